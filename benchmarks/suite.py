@@ -0,0 +1,427 @@
+"""Benchmark db_model against equivalent SQLAlchemy declarative models.
+
+Usage::
+
+    python -m benchmarks.suite [case ...] [--rows N] [--repeat N] [--json PATH]
+
+Every case runs against in-memory SQLite. Timings are the best of ``--repeat``
+runs, memory is measured with ``tracemalloc``.
+"""
+import argparse
+import json
+import platform
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from gc import collect
+from time import perf_counter
+from tracemalloc import start, stop, take_snapshot
+from typing import Any, Callable, Dict, Iterator, List, Optional
+from uuid import UUID, uuid4
+
+import sqlalchemy
+from sqlalchemy import (
+    CHAR,
+    Column,
+    DateTime,
+    ForeignKey,
+    Integer,
+    MetaData,
+    String,
+    create_engine,
+    delete,
+)
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import RelationshipProperty
+from sqlalchemy.orm import Session as SASession
+from sqlalchemy.orm import declarative_base
+from sqlalchemy.orm import registry as Registry
+from sqlalchemy.orm import relationship as sa_relationship
+from sqlalchemy.orm import selectinload
+from sqlalchemy.types import TypeDecorator
+
+import db_model
+from db_model import DBModel, PrimaryKey, mapped_column, register
+from db_model.orm import Session
+from db_model.relationship import relationship
+from db_model.sa_types import GUID
+from db_model.sql import select
+
+metadata = MetaData()
+Base: Any = declarative_base()
+
+
+class Author(DBModel, metadata=metadata):
+    id: PrimaryKey[int]
+    name: str
+    age: Optional[int]
+    created_at: datetime
+
+    books: List["Book"] = relationship("Book", back_populates="author", uselist=True)
+
+
+class Book(DBModel, metadata=metadata):
+    id: PrimaryKey[int]
+    name: str
+    author_id: int = mapped_column(foreign_key=Author.id)
+    author: Author = relationship(Author, back_populates="books")
+
+
+class SlottedAuthor(DBModel, metadata=metadata, slots=True):
+    id: PrimaryKey[int]
+    name: str
+    age: Optional[int]
+    created_at: datetime
+
+
+class DeclarativeAuthor(Base):
+    __tablename__ = "author"
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String, nullable=False)
+    age = Column(Integer)
+    created_at = Column(DateTime, nullable=False)
+
+    books: "RelationshipProperty[DeclarativeBook]" = sa_relationship(
+        "DeclarativeBook", back_populates="author"
+    )
+
+
+class DeclarativeBook(Base):
+    __tablename__ = "book"
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String, nullable=False)
+    author_id = Column(Integer, ForeignKey("author.id"), nullable=False)
+    author: "RelationshipProperty[DeclarativeAuthor]" = sa_relationship(
+        DeclarativeAuthor, back_populates="books"
+    )
+
+
+class RecipeGUID(TypeDecorator):
+    """GUID type from the SQLAlchemy documentation, restricted to CHAR(32)."""
+
+    impl = CHAR(32)
+    cache_ok = True
+
+    def process_bind_param(self, value: Any, dialect: Any) -> Any:
+        return None if value is None else value.hex
+
+    def process_result_value(self, value: Any, dialect: Any) -> Any:
+        return None if value is None else UUID(value)
+
+
+@dataclass
+class Variant:
+    name: str
+    run: Callable[[], Any]
+    setup: Optional[Callable[[], Any]] = None
+
+
+@dataclass
+class Measurement:
+    case: str
+    variant: str
+    value: float
+    unit: str
+
+
+Case = Callable[[argparse.Namespace], Iterator[Variant]]
+_CASES: Dict[str, Case] = {}
+_MEMORY_CASES = {"memory"}
+
+
+def case(function: Case) -> Case:
+    _CASES[function.__name__] = function
+    return function
+
+
+def _engine(metadata: MetaData) -> Engine:
+    engine = create_engine("sqlite://", future=True)
+    metadata.create_all(engine)
+    return engine
+
+
+def _authors(rows: int) -> List[Dict[str, Any]]:
+    now = datetime.now()
+    return [
+        {"id": i, "name": f"Name {i}", "age": i, "created_at": now} for i in range(rows)
+    ]
+
+
+def _books(rows: int, per_author: int) -> List[Dict[str, Any]]:
+    return [
+        {"id": i, "name": f"Book {i}", "author_id": i // per_author}
+        for i in range(rows)
+    ]
+
+
+def _model_namespace(i: int) -> Dict[str, Any]:
+    return {
+        "__annotations__": {
+            "id": PrimaryKey[int],
+            "name": str,
+            "age": Optional[int],
+            "created_at": datetime,
+        },
+        "__tablename__": f"model_{i}",
+    }
+
+
+@case
+def registration(options: argparse.Namespace) -> Iterator[Variant]:
+    def db_model_models() -> None:
+        registry = Registry()
+        for i in range(options.models):
+            cls = type(f"Model{i}", (), _model_namespace(i))
+            register(cls, metadata=MetaData(), registry=registry)
+        registry.configure()
+
+    def declarative_models() -> None:
+        base: Any = declarative_base()
+        for i in range(options.models):
+            type(
+                f"Model{i}",
+                (base,),
+                {
+                    "__tablename__": f"model_{i}",
+                    "id": Column(Integer, primary_key=True),
+                    "name": Column(String, nullable=False),
+                    "age": Column(Integer),
+                    "created_at": Column(DateTime, nullable=False),
+                },
+            )
+        base.registry.configure()
+
+    yield Variant("db_model", db_model_models)
+    yield Variant("declarative", declarative_models)
+
+
+@case
+def bulk_insert(options: argparse.Namespace) -> Iterator[Variant]:
+    rows = _authors(options.rows)
+
+    session = Session(bind=_engine(metadata))
+    yield Variant(
+        "db_model",
+        lambda: session.bulk_insert(Author, rows),
+        lambda: session.execute(delete(Author)),
+    )
+
+    sa_session = SASession(bind=_engine(Base.metadata), future=True)
+    yield Variant(
+        "declarative",
+        lambda: sa_session.bulk_insert_mappings(DeclarativeAuthor, rows),
+        lambda: sa_session.execute(delete(DeclarativeAuthor)),
+    )
+
+
+@case
+def hydration(options: argparse.Namespace) -> Iterator[Variant]:
+    rows = _authors(options.rows)
+
+    session = Session(bind=_engine(metadata))
+    session.bulk_insert(Author, rows)
+    yield Variant(
+        "db_model",
+        lambda: session.scalars(select(Author)).all(),
+        session.expunge_all,
+    )
+    yield Variant(
+        "db_model fetch_detached",
+        lambda: session.fetch_detached(select(Author)),
+    )
+
+    sa_session = SASession(bind=_engine(Base.metadata), future=True)
+    sa_session.bulk_insert_mappings(DeclarativeAuthor, rows)
+    yield Variant(
+        "declarative",
+        lambda: sa_session.scalars(sqlalchemy.select(DeclarativeAuthor)).all(),
+        sa_session.expunge_all,
+    )
+
+
+@case
+def read_only(options: argparse.Namespace) -> Iterator[Variant]:
+    engine = _engine(metadata)
+    with Session(bind=engine) as session:
+        session.bulk_insert(Author, _authors(options.rows))
+        session.commit()
+
+    def read(read_only: bool) -> Callable[[], List[str]]:
+        def run() -> List[str]:
+            # read_only implies expire_on_commit=False, set it in both arms.
+            with Session(
+                bind=engine, read_only=read_only, expire_on_commit=False
+            ) as session:
+                authors = session.scalars(select(Author)).all()
+                session.commit()
+                return [author.name for author in authors]
+
+        return run
+
+    yield Variant("db_model", read(False))
+    yield Variant("db_model read_only", read(True))
+
+
+@case
+def relationship_loading(options: argparse.Namespace) -> Iterator[Variant]:
+    per_author = 10
+    authors = _authors(max(options.rows // per_author, 1))
+    books = _books(options.rows, per_author)
+
+    def load(session: SASession, author: Any) -> Callable[[], int]:
+        statement = sqlalchemy.select(author).options(selectinload(author.books))
+        return lambda: sum(
+            len(instance.books) for instance in session.scalars(statement)
+        )
+
+    session = Session(bind=_engine(metadata))
+    session.bulk_insert(Author, authors)
+    session.bulk_insert(Book, books)
+    yield Variant("db_model", load(session, Author), session.expunge_all)
+
+    sa_session = SASession(bind=_engine(Base.metadata), future=True)
+    sa_session.bulk_insert_mappings(DeclarativeAuthor, authors)
+    sa_session.bulk_insert_mappings(DeclarativeBook, books)
+    yield Variant(
+        "declarative", load(sa_session, DeclarativeAuthor), sa_session.expunge_all
+    )
+
+
+def _process_all(
+    process: Callable[[Any], Any], values: List[Any]
+) -> Callable[[], List[Any]]:
+    return lambda: [process(value) for value in values]
+
+
+def _guid_processors(type_: TypeDecorator) -> Any:
+    dialect = create_engine("sqlite://").dialect
+    return (
+        type_.bind_processor(dialect),
+        type_.result_processor(dialect, None),
+    )
+
+
+@case
+def guid_bind(options: argparse.Namespace) -> Iterator[Variant]:
+    values = [uuid4() for _ in range(options.rows)]
+    for name, type_ in (("db_model", GUID()), ("declarative", RecipeGUID())):
+        process, _ = _guid_processors(type_)
+        yield Variant(name, _process_all(process, values))
+
+
+@case
+def guid_result(options: argparse.Namespace) -> Iterator[Variant]:
+    values = [uuid4().hex for _ in range(options.rows)]
+    for name, type_ in (("db_model", GUID()), ("declarative", RecipeGUID())):
+        _, process = _guid_processors(type_)
+        yield Variant(name, _process_all(process, values))
+
+
+@case
+def memory(options: argparse.Namespace) -> Iterator[Variant]:
+    rows = _authors(options.rows)
+
+    session = Session(bind=_engine(metadata))
+    session.bulk_insert(Author, rows)
+    session.bulk_insert(SlottedAuthor, rows)
+    yield Variant(
+        "db_model",
+        lambda: session.scalars(select(Author)).all(),
+        session.expunge_all,
+    )
+    yield Variant(
+        "db_model fetch_detached",
+        lambda: session.fetch_detached(select(Author)),
+    )
+    yield Variant(
+        "db_model slots",
+        lambda: session.fetch_slotted(select(SlottedAuthor)),
+    )
+
+    sa_session = SASession(bind=_engine(Base.metadata), future=True)
+    sa_session.bulk_insert_mappings(DeclarativeAuthor, rows)
+    yield Variant(
+        "declarative",
+        lambda: sa_session.scalars(sqlalchemy.select(DeclarativeAuthor)).all(),
+        sa_session.expunge_all,
+    )
+
+
+def measure_time(variant: Variant, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        if variant.setup is not None:
+            variant.setup()
+        start_time = perf_counter()
+        variant.run()
+        timings.append(perf_counter() - start_time)
+    return min(timings)
+
+
+def measure_memory(variant: Variant, rows: int) -> float:
+    if variant.setup is not None:
+        variant.setup()
+    collect()
+    start()
+    before = take_snapshot()
+    instances = variant.run()
+    after = take_snapshot()
+    stop()
+    size = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    del instances
+    return size / rows
+
+
+def run(options: argparse.Namespace) -> List[Measurement]:
+    measurements = []
+    for name in options.cases or _CASES:
+        for variant in _CASES[name](options):
+            if name in _MEMORY_CASES:
+                value, unit = measure_memory(variant, options.rows), "bytes/row"
+            else:
+                value, unit = measure_time(variant, options.repeat), "seconds"
+            measurements.append(Measurement(name, variant.name, value, unit))
+    return measurements
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.suite",
+        description="Compare db_model with SQLAlchemy declarative models.",
+    )
+    parser.add_argument("cases", nargs="*", help=f"cases to run: {', '.join(_CASES)}")
+    parser.add_argument("--rows", type=int, default=10_000, help="rows per case")
+    parser.add_argument("--models", type=int, default=100, help="models to register")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per variant")
+    parser.add_argument("--json", help="write the results as JSON to this path")
+    options = parser.parse_args(argv)
+    unknown = set(options.cases) - set(_CASES)
+    if unknown:
+        parser.error(f"unknown cases: {', '.join(sorted(unknown))}")
+
+    measurements = run(options)
+    for measurement in measurements:
+        value = (
+            f"{measurement.value * 1000:10.2f} ms"
+            if measurement.unit == "seconds"
+            else f"{measurement.value:10.1f} {measurement.unit}"
+        )
+        print(f"{measurement.case:<22} {measurement.variant:<25} {value}")
+
+    if options.json:
+        report = {
+            "python": platform.python_version(),
+            "sqlalchemy": sqlalchemy.__version__,
+            "db_model": db_model.__version__,
+            "rows": options.rows,
+            "models": options.models,
+            "repeat": options.repeat,
+            "results": [asdict(measurement) for measurement in measurements],
+        }
+        with open(options.json, "w") as file:
+            json.dump(report, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
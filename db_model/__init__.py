@@ -7,12 +7,26 @@ __all__ = (
     "register",
     "Mapped",
     "PrimaryKey",
+    "Indexed",
+    "index",
+    "check_indexes",
     "mapped_column",
     "DBModel",
     "get_metadata",
     "get_registry",
+    "configure_models",
+    "get_registration_stats",
 )
 
 
-from .core import DBModel, Mapped, get_metadata, get_registry, register
-from .field import PrimaryKey, col, mapped_column
+from .core import (
+    DBModel,
+    Mapped,
+    configure_models,
+    get_metadata,
+    get_registration_stats,
+    get_registry,
+    register,
+)
+from .field import Indexed, PrimaryKey, col, mapped_column
+from .indexes import check_indexes, index
@@ -1,14 +1,34 @@
-from dataclasses import Field, dataclass, field, fields
-from typing import TYPE_CHECKING, Any, Callable, ClassVar, Dict, Iterable, Type, TypeVar
+from dataclasses import MISSING, Field, dataclass, field, fields
+from functools import wraps
+from threading import RLock
+from time import perf_counter
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Sequence,
+    Set,
+    Type,
+    TypeVar,
+)
 
-from sqlalchemy import Column, MetaData, Table
+from sqlalchemy import Column, MetaData, Table, event
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import RelationshipProperty
 from sqlalchemy.orm import registry as Registry
 from typing_extensions import Annotated, dataclass_transform
 
 from db_model.field import Mapped as _Mapped
 from db_model.field import mapped_column
+from db_model.indexes import get_indexes
 from db_model.relationship import RelationshipInfo, relationship
-from db_model.types_ import get_column
+from db_model.types_ import get_column, resolve_type
 
 _T = TypeVar("_T")
 
@@ -31,16 +51,244 @@ def get_registry() -> Registry:
     return _default_registry
 
 
-def get_columns(cls: Type, mapper_args: Dict[str, Any]) -> Iterable[Column[Any]]:
+def get_column_fields(cls: Type, mapper_args: Dict[str, Any]) -> List[Field]:
     properties = mapper_args.get("properties", {})
-    fields_ = list(
+    return list(
         filter(
             lambda field: field.name not in properties
             and not isinstance(field, RelationshipInfo),
             fields(cls),
         )
     )
-    yield from map(get_column, fields_)
+
+
+def get_columns(cls: Type, mapper_args: Dict[str, Any]) -> Iterable[Column[Any]]:
+    yield from map(get_column, get_column_fields(cls, mapper_args))
+
+
+@dataclass
+class RegistrationStats:
+    """Seconds spent registering a model, per phase."""
+
+    model: Type
+    transform: float = 0.0
+    resolve: float = 0.0
+    columns: float = 0.0
+    map: float = 0.0
+
+    @property
+    def total(self) -> float:
+        return self.transform + self.resolve + self.columns + self.map
+
+
+_registration_stats: Dict[Type, RegistrationStats] = {}
+
+
+def get_registration_stats() -> List[RegistrationStats]:
+    """Return the timing breakdown of every registered model."""
+    return list(_registration_stats.values())
+
+
+def _table_name(cls: Type) -> str:
+    return getattr(cls, "__tablename__", cls.__name__.lower())
+
+
+def _map(cls: Type, metadata: MetaData, registry: Registry) -> None:
+    stats = _registration_stats.setdefault(cls, RegistrationStats(cls))
+    table_name = _table_name(cls)
+    table_args = getattr(cls, "__table_args__", {})
+    mapper_args = getattr(cls, "__mapper_args__", {})
+
+    start = perf_counter()
+    column_fields = get_column_fields(cls, mapper_args)
+    specs = [resolve_type(field.type) for field in column_fields]
+    resolved = perf_counter()
+    columns = [get_column(field, spec) for field, spec in zip(column_fields, specs)]
+    relationships: Iterable[RelationshipInfo] = filter(
+        lambda field: isinstance(field, RelationshipInfo),  # type: ignore
+        fields(cls),
+    )
+    default_lazy = getattr(cls, "__relationship_lazy__", None)
+    mapper_args.setdefault("properties", {})
+    for relationship_ in relationships:
+        mapper_args["properties"][
+            relationship_.name
+        ] = relationship_.__getrelationship__(default_lazy)
+
+    table = Table(
+        table_name,
+        metadata,
+        *columns,
+        *table_args,
+        *get_indexes(cls, table_name),
+    )
+    built = perf_counter()
+    registry.map_imperatively(cls, table, **mapper_args)
+
+    stats.resolve += resolved - start
+    stats.columns += built - resolved
+    stats.map += perf_counter() - built
+
+
+def _make_slotted(cls: Type) -> Type:
+    # Mapped classes keep their values in the instance __dict__ that
+    # SQLAlchemy instruments, so the slotted twin is a separate plain
+    # dataclass with the same fields, used for detached snapshots.
+    cls_fields = fields(cls)
+    namespace: Dict[str, Any] = {
+        field_.name: field(repr=field_.repr, compare=field_.compare)
+        for field_ in cls_fields
+    }
+    namespace.update(
+        __annotations__={field_.name: field_.type for field_ in cls_fields},
+        __module__=cls.__module__,
+        __qualname__=f"{cls.__qualname__}.__slotted__",
+        __doc__=f"Slotted snapshot of :class:`{cls.__qualname__}`.",
+    )
+    plain: Type = dataclass(type(cls.__name__, (), namespace))
+    namespace = dict(plain.__dict__)
+    namespace.pop("__dict__", None)
+    namespace.pop("__weakref__", None)
+    namespace["__slots__"] = tuple(field_.name for field_ in cls_fields)
+    namespace["__qualname__"] = plain.__qualname__
+    return type(cls.__name__, (), namespace)
+
+
+class _PendingModel(NamedTuple):
+    metadata: MetaData
+    registry: Registry
+    init: Callable[..., None]
+    attributes: Dict[str, Any]
+
+
+_pending_models: Dict[Type, _PendingModel] = {}
+# Held while a lazy model is mapped, so other threads reading its fields wait
+# for the mapping instead of finding it half done.
+_configure_lock = RLock()
+
+
+class _UnmappedAttribute:
+    """Stands in for a field of a lazy model, mapping the model on access."""
+
+    def __init__(self, model: Type, name: str) -> None:
+        self.model = model
+        self.name = name
+
+    def __get__(self, instance: Any, owner: Type) -> Any:
+        _configure((self.model,))
+        return getattr(owner if instance is None else instance, self.name)
+
+
+def _defer(cls: Type, metadata: MetaData, registry: Registry) -> None:
+    init = cls.__init__
+
+    @wraps(init)
+    def __init__(self: Any, *args: Any, **kwargs: Any) -> None:
+        _configure((cls,))
+        cls.__init__(self, *args, **kwargs)
+
+    # Class attributes still hold the dataclass defaults, so expressions such
+    # as ``Model.id == 1`` need the mapping built first.
+    attributes = {}
+    for field_ in fields(cls):
+        attributes[field_.name] = cls.__dict__.get(field_.name, MISSING)
+        setattr(cls, field_.name, _UnmappedAttribute(cls, field_.name))
+    cls.__init__ = __init__
+    _pending_models[cls] = _PendingModel(metadata, registry, init, attributes)
+    if not event.contains(metadata, "after_create", _create_pending_tables):
+        event.listen(metadata, "after_create", _create_pending_tables)
+
+
+def _relationship_targets(cls: Type, registry: Registry) -> Iterator[Type]:
+    properties = getattr(cls, "__mapper_args__", {}).get("properties", {})
+    arguments = [
+        property_.argument
+        for property_ in properties.values()
+        if isinstance(property_, RelationshipProperty)
+    ]
+    arguments.extend(
+        field.args[0] if field.args else field.kwargs.get("argument")
+        for field in fields(cls)
+        if isinstance(field, RelationshipInfo)
+    )
+    for argument in arguments:
+        if isinstance(argument, type):
+            yield argument
+        elif isinstance(argument, str):
+            yield from [
+                model
+                for model, pending in _pending_models.items()
+                if pending.registry is registry and model.__name__ == argument
+            ]
+
+
+def _referenced_tables(table: Table) -> Set[str]:
+    return {
+        foreign_key.target_fullname.split(".")[-2] for foreign_key in table.foreign_keys
+    }
+
+
+def _referenced_models(table: Table, metadata: MetaData) -> List[Type]:
+    # Foreign keys to the table of a lazy model need it in the metadata before
+    # create_all sorts the tables.
+    names = _referenced_tables(table)
+    return [
+        model
+        for model, pending in _pending_models.items()
+        if pending.metadata is metadata and _table_name(model) in names
+    ]
+
+
+def _is_referenced(cls: Type, metadata: MetaData) -> bool:
+    name = _table_name(cls)
+    return any(name in _referenced_tables(table) for table in metadata.tables.values())
+
+
+def _configure(models: Iterable[Any]) -> List[Table]:
+    tables: List[Table] = []
+    with _configure_lock:
+        for model in models:
+            pending = (
+                _pending_models.pop(model, None) if isinstance(model, type) else None
+            )
+            if pending is None:
+                continue
+            model.__init__ = pending.init
+            for name, value in pending.attributes.items():
+                if value is MISSING:
+                    delattr(model, name)
+                else:
+                    setattr(model, name, value)
+            _map(model, pending.metadata, pending.registry)
+            table = model.__table__
+            tables.append(table)
+            tables.extend(_configure(_relationship_targets(model, pending.registry)))
+            tables.extend(_configure(_referenced_models(table, pending.metadata)))
+    return tables
+
+
+def configure_models(*models: Type) -> None:
+    """Map lazily registered models, or every pending model if none are given."""
+    with _configure_lock:
+        _configure(models or tuple(_pending_models))
+
+
+def _create_pending_tables(
+    metadata: MetaData, connection: Connection, **kw: Any
+) -> None:
+    # Tables of lazy models only exist once mapped, so create_all maps the
+    # pending models of its metadata and creates their tables afterwards.
+    with _configure_lock:
+        models = [
+            model
+            for model, pending in _pending_models.items()
+            if pending.metadata is metadata
+        ]
+        tables = _configure(models)
+    if tables:
+        metadata.create_all(
+            connection, tables=tables, checkfirst=kw.get("checkfirst", True)
+        )
 
 
 @dataclass_transform(
@@ -52,35 +300,44 @@ def register(
     metadata: MetaData = _metadata,
     registry: Registry = _default_registry,
     abstract: bool = False,
+    lazy: bool = False,
+    slots: bool = False,
 ) -> Type[_T]:
+    """Transform ``cls`` into a dataclass and map it to a table.
+
+    With ``lazy`` the table and mapping are only built once the model is first
+    instantiated, one of its fields is accessed on the class, it is selected
+    via ``db_model.sql.select`` or loaded through the session, its table is
+    created by ``metadata.create_all`` or it is passed to ``configure_models``.
+    A lazy model is mapped as soon as a mapped model has a foreign key to it.
+
+    ``__relationship_lazy__`` on ``cls`` sets the loading strategy, e.g.
+    ``"selectin"`` or ``"raise"``, of relationships not setting ``lazy``.
+
+    ``__indexes__`` on ``cls`` lists indexes built with ``db_model.index`` or
+    ``sqlalchemy.Index`` objects, added to the table next to the ones of
+    ``Indexed`` fields and ``mapped_column(index=True)``.
+
+    With ``slots`` a slotted dataclass with the same fields is attached as
+    ``cls.__slotted__``, which ``Session.fetch_slotted`` returns instances of.
+    Subclasses of a model registered with ``slots`` get their own.
+    """
     transformer = getattr(cls, "__transformer__", dataclass)
+    start = perf_counter()
     cls = transformer(cls)
+    _registration_stats[cls] = RegistrationStats(cls, transform=perf_counter() - start)
 
-    if not abstract:
-        table_name = getattr(cls, "__tablename__", cls.__name__.lower())
-        table_args = getattr(cls, "__table_args__", {})
-        mapper_args = getattr(cls, "__mapper_args__", {})
-        columns = get_columns(cls, mapper_args)
-        relationships: Iterable[RelationshipInfo] = filter(
-            lambda field: isinstance(field, RelationshipInfo),  # type: ignore
-            fields(cls),
-        )
-        mapper_args.setdefault("properties", {})
-        for relationship_ in relationships:
-            mapper_args["properties"][
-                relationship_.name
-            ] = relationship_.__getrelationship__()
+    if slots or hasattr(cls, "__slotted__"):
+        cls.__slotted__ = _make_slotted(cls)  # type: ignore
 
-        registry.map_imperatively(
-            cls,
-            Table(
-                table_name,
-                metadata,
-                *columns,
-                *table_args,
-            ),
-            **mapper_args,
-        )
+    if not abstract:
+        with _configure_lock:
+            if lazy and not _is_referenced(cls, metadata):
+                _defer(cls, metadata, registry)
+            else:
+                _map(cls, metadata, registry)
+                table: Table = cls.__table__  # type: ignore[union-attr]
+                _configure(_referenced_models(table, metadata))
     return cls
 
 
@@ -94,6 +351,9 @@ class DBModel:
         __table_args__: ClassVar[tuple]
         __transformer__: ClassVar[Callable[[Type], Type]]
         __mapper_args__: ClassVar[Dict[str, Any]]
+        __slotted__: ClassVar[Type]
+        __relationship_lazy__: ClassVar[str]
+        __indexes__: ClassVar[Sequence[Any]]
 
     def __init_subclass__(
         cls,
@@ -101,10 +361,14 @@ class DBModel:
         metadata: MetaData = _metadata,
         registry: Registry = _default_registry,
         abstract: bool = False,
+        lazy: bool = False,
+        slots: bool = False,
     ) -> None:
         register(
             cls,
             metadata=metadata,
             registry=registry,
             abstract=abstract,
+            lazy=lazy,
+            slots=slots,
         )
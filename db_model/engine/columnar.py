@@ -0,0 +1,76 @@
+import uuid
+from typing import Any, Iterable, List, Optional, Sequence
+
+import numpy
+
+from db_model.types_ import _COLUMN_TYPE_MAPPING, _NUMPY_DTYPE_MAPPING
+
+_NULLABLE_DTYPES = {"datetime64[D]", "datetime64[us]"}
+
+
+def get_dtype(values: Sequence[Any]) -> Optional[str]:
+    """Return the dtype for a column based on the type of its first value."""
+    sample = next((value for value in values if value is not None), None)
+    if sample is None:
+        return None
+    type_ = type(sample)
+    if type_ not in _COLUMN_TYPE_MAPPING:
+        return None
+    return _NUMPY_DTYPE_MAPPING.get(type_)
+
+
+def _to_array(values: Sequence[Any], dtype: Optional[str]) -> numpy.ndarray:
+    if dtype is None:
+        array = numpy.empty(len(values), dtype=object)
+        array[:] = values
+        return array
+    elif dtype == "V16":
+        return numpy.frombuffer(b"".join(value.bytes for value in values), dtype=dtype)
+    return numpy.array(values, dtype=dtype)
+
+
+def _to_object_array(array: numpy.ndarray) -> numpy.ndarray:
+    if array.dtype == numpy.dtype("V16"):
+        return _to_array([uuid.UUID(bytes=value.tobytes()) for value in array], None)
+    return array.astype(object)
+
+
+class _ColumnBuilder:
+    def __init__(self) -> None:
+        self.dtype: Optional[str] = None
+        self.resolved = False
+        self.chunks: List[numpy.ndarray] = []
+
+    def append(self, values: Sequence[Any]) -> None:
+        if not self.resolved and any(value is not None for value in values):
+            self.resolved = True
+            self.dtype = get_dtype(values)
+            if (self.chunks or None in values) and self.dtype not in _NULLABLE_DTYPES:
+                self.dtype = None
+            self.chunks = [_to_array(list(chunk), self.dtype) for chunk in self.chunks]
+        elif (
+            self.dtype is not None
+            and self.dtype not in _NULLABLE_DTYPES
+            and None in values
+        ):
+            self.dtype = None
+            self.chunks = [_to_object_array(chunk) for chunk in self.chunks]
+        self.chunks.append(_to_array(values, self.dtype))
+
+    def build(self) -> numpy.ndarray:
+        if not self.chunks:
+            return _to_array([], self.dtype)
+        elif len(self.chunks) == 1:
+            return self.chunks[0]
+        return numpy.concatenate(self.chunks)
+
+
+def to_arrays(
+    batches: Iterable[Sequence[Sequence[Any]]], width: int
+) -> List[numpy.ndarray]:
+    """Build one array per column from batches of column values."""
+    builders = [_ColumnBuilder() for _ in range(width)]
+    for columns in batches:
+        for builder, values in zip(builders, columns):
+            builder.append(values)
+    return [builder.build() for builder in builders]
@@ -0,0 +1,174 @@
+import csv
+import json
+from datetime import date, datetime, time
+from operator import attrgetter
+from typing import IO, Any, Callable, Dict, Iterable, List, Optional, Sequence
+from uuid import UUID
+
+from sqlalchemy import inspect
+
+_Converter = Callable[[Any], Any]
+
+_CONVERTERS: Dict[type, _Converter] = {
+    UUID: str,
+    datetime: datetime.isoformat,
+    date: date.isoformat,
+    time: time.isoformat,
+}
+
+_encode_json = json.JSONEncoder(separators=(",", ":"), default=str).encode
+
+
+def _column_converter(column: Any) -> Optional[_Converter]:
+    try:
+        return _CONVERTERS.get(column.type.python_type)
+    except NotImplementedError:
+        return None
+
+
+class _ModelSerializer:
+    """Column keys of a model and a function returning their converted values."""
+
+    def __init__(self, model: type) -> None:
+        attributes = inspect(model).column_attrs
+        self.keys = tuple(attribute.key for attribute in attributes)
+        getter = attrgetter(*self.keys)
+        converters = [
+            (index, converter)
+            for index, attribute in enumerate(attributes)
+            if (converter := _column_converter(attribute.columns[0])) is not None
+        ]
+
+        if len(self.keys) == 1:
+            self.values: Callable[[Any], List[Any]] = lambda instance: [
+                getter(instance)
+            ]
+        else:
+            self.values = lambda instance: list(getter(instance))
+        if converters:
+            values = self.values
+
+            def convert(instance: Any) -> List[Any]:
+                row = values(instance)
+                for index, converter in converters:
+                    if row[index] is not None:
+                        row[index] = converter(row[index])
+                return row
+
+            self.values = convert
+
+
+_SERIALIZERS: Dict[type, Optional[_ModelSerializer]] = {}
+
+
+def _serializer(cls: type) -> Optional[_ModelSerializer]:
+    try:
+        return _SERIALIZERS[cls]
+    except KeyError:
+        serializer = None
+        if hasattr(cls, "__table__") and inspect(cls, raiseerr=False) is not None:
+            serializer = _ModelSerializer(cls)
+        _SERIALIZERS[cls] = serializer
+        return serializer
+
+
+def _to_json(value: Any) -> Any:
+    converter = _CONVERTERS.get(type(value))
+    if converter is not None:
+        return converter(value)
+    serializer = _serializer(type(value))
+    if serializer is not None:
+        return dict(zip(serializer.keys, serializer.values(value)))
+    return value
+
+
+def _to_csv(value: Any) -> Any:
+    converter = _CONVERTERS.get(type(value))
+    return value if converter is None else converter(value)
+
+
+def write_jsonl(
+    fp: IO[str], partitions: Iterable[Sequence[Any]], keys: Optional[Sequence[str]]
+) -> int:
+    """Write one JSON document per row, an object of ``keys`` unless rows are scalars."""
+    count = 0
+    for partition in partitions:
+        if keys is None:
+            lines = [_encode_json(_to_json(value)) for value in partition]
+        else:
+            lines = [
+                _encode_json({key: _to_json(value) for key, value in zip(keys, row)})
+                for row in partition
+            ]
+        fp.write("\n".join(lines) + "\n")
+        count += len(lines)
+    return count
+
+
+def _csv_columns(rows: Sequence[Sequence[Any]]) -> List[Optional[_ModelSerializer]]:
+    # Serializers are fixed per position, taken from the first row setting it,
+    # so a model missing from a row, as in an outer join, still fills its cells.
+    columns: List[Optional[_ModelSerializer]] = []
+    for values in zip(*rows):
+        value = next((value for value in values if value is not None), None)
+        columns.append(None if value is None else _serializer(type(value)))
+    return columns
+
+
+def _csv_header(
+    keys: Sequence[str], columns: Sequence[Optional[_ModelSerializer]]
+) -> List[str]:
+    header: List[str] = []
+    for key, serializer in zip(keys, columns):
+        if serializer is None:
+            header.append(key)
+        elif len(keys) == 1:
+            header.extend(serializer.keys)
+        else:
+            header.extend(f"{key}.{column}" for column in serializer.keys)
+    return header
+
+
+def _csv_row(
+    columns: Sequence[Optional[_ModelSerializer]], row: Sequence[Any]
+) -> List[Any]:
+    values: List[Any] = []
+    for serializer, value in zip(columns, row):
+        if serializer is None:
+            values.append(_to_csv(value))
+        elif value is None:
+            values.extend([None] * len(serializer.keys))
+        else:
+            values.extend(serializer.values(value))
+    return values
+
+
+def write_csv(
+    fp: IO[str],
+    partitions: Iterable[Sequence[Any]],
+    keys: Sequence[str],
+    scalar: bool,
+    header: bool = True,
+) -> int:
+    """Write rows as CSV, columns of model instances are written as their own columns.
+
+    The columns are taken from the first partition, so a model selected in a
+    column must be set in at least one of its rows. Where it is ``None``, as
+    in outer joins, its cells are left empty.
+    """
+    writer = csv.writer(fp)
+    count = 0
+    columns: Optional[List[Optional[_ModelSerializer]]] = None
+    for partition in partitions:
+        rows: Sequence[Sequence[Any]] = (
+            [(value,) for value in partition] if scalar else partition
+        )
+        if columns is None and rows:
+            columns = _csv_columns(rows)
+            if header:
+                writer.writerow(_csv_header(keys, columns))
+        writer.writerows(_csv_row(columns or (), row) for row in rows)
+        count += len(partition)
+    if header and count == 0:
+        writer.writerow(keys)
+    return count
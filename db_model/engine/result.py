@@ -1,14 +1,35 @@
-from typing import Any, Generic, Iterator, List, Optional, TypeVar, overload
+from importlib import import_module
+from typing import (
+    IO,
+    Any,
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Type,
+    TypeVar,
+    overload,
+)
 
 from sqlalchemy.engine import Result as _Result
 from sqlalchemy.engine import ScalarResult as _ScalarResult
 
+from db_model.engine import export
+
 _T = TypeVar("_T")
 _V0 = TypeVar("_V0")
 _V1 = TypeVar("_V1")
 _V2 = TypeVar("_V2")
 
 
+def _to_arrays(batches: Iterable[Any], width: int) -> List[Any]:
+    # numpy is optional, so the columnar module is only imported when needed
+    # and is kept out of reach of type checkers analysing this module.
+    return import_module("db_model.engine.columnar").to_arrays(batches, width)
+
+
 class ScalarResult(_ScalarResult, Generic[_T]):  # pragma: no cover
     def all(self) -> List[_T]:
         return super().all()
@@ -37,6 +58,32 @@ class ScalarResult(_ScalarResult, Generic[_T]):  # pragma: no cover
     def one(self) -> _T:
         return super().one()  # type: ignore
 
+    def to_numpy(self, batch_size: Optional[int] = None) -> Any:
+        """Return all values as a ``numpy.ndarray``, filled from ``partitions()``."""
+        (array,) = _to_arrays(
+            ((partition,) for partition in self.partitions(batch_size)), 1
+        )
+        return array
+
+    def write_jsonl(self, fp: IO[str], batch_size: Optional[int] = 1000) -> int:
+        """Write each value as a line of JSON to ``fp``, return the number of rows.
+
+        Model instances are written as objects of their columns. Rows are
+        fetched ``batch_size`` at a time, see :meth:`Session.stream` to also
+        stream them from the database.
+        """
+        return export.write_jsonl(fp, self.partitions(batch_size), None)
+
+    def write_csv(
+        self, fp: IO[str], batch_size: Optional[int] = 1000, header: bool = True
+    ) -> int:
+        """Write the values as CSV to ``fp``, return the number of rows.
+
+        Model instances are written as a column per model column.
+        """
+        keys = list(self._metadata.keys)  # type: ignore[attr-defined]
+        return export.write_csv(fp, self.partitions(batch_size), keys, True, header)
+
 
 class Result(_Result, Generic[_T]):  # pragma: no cover
     @overload
@@ -56,7 +103,7 @@ class Result(_Result, Generic[_T]):  # pragma: no cover
         ...
 
     def scalars(self, index: int = 0) -> ScalarResult:
-        return super().scalars(index)  # type: ignore
+        return ScalarResult(self, index)
 
     def __iter__(self) -> Iterator[_T]:  # type: ignore
         return super().__iter__()  # type: ignore
@@ -96,3 +143,62 @@ class Result(_Result, Generic[_T]):  # pragma: no cover
 
     def scalar(self) -> Optional[_T]:
         return super().scalar()
+
+    def to_columns(self, batch_size: Optional[int] = None) -> Dict[str, List[Any]]:
+        """Return a list of values per selected column."""
+        keys = list(self.keys())
+        columns: List[List[Any]] = [[] for _ in keys]
+        for partition in self.partitions(batch_size):
+            for column, values in zip(columns, zip(*partition)):  # type: ignore
+                column.extend(values)
+        return dict(zip(keys, columns))
+
+    def to_numpy(self, batch_size: Optional[int] = None) -> Dict[str, Any]:
+        """Return a ``numpy.ndarray`` per selected column, filled from ``partitions()``.
+
+        Column dtypes follow ``_NUMPY_DTYPE_MAPPING`` for registered column types
+        and fall back to ``object``, including for integer and UUID columns with
+        ``NULL`` values.
+        """
+        keys = list(self.keys())
+        arrays = _to_arrays(
+            (tuple(zip(*partition)) for partition in self.partitions(batch_size)),  # type: ignore
+            len(keys),
+        )
+        return dict(zip(keys, arrays))
+
+    def write_jsonl(self, fp: IO[str], batch_size: Optional[int] = 1000) -> int:
+        """Write each row as a JSON object of its columns to ``fp``, return the number of rows.
+
+        Model instances are written as nested objects. UUID, date and datetime
+        values are written as strings.
+        """
+        keys = list(self.keys())
+        return export.write_jsonl(fp, self.partitions(batch_size), keys)  # type: ignore[arg-type]
+
+    def write_csv(
+        self, fp: IO[str], batch_size: Optional[int] = 1000, header: bool = True
+    ) -> int:
+        """Write the rows as CSV to ``fp``, return the number of rows.
+
+        Model instances are written as a column per model column, prefixed with
+        the entity name when the row has several columns. A model that is
+        ``None``, as in outer joins, leaves its columns empty.
+        """
+        keys = list(self.keys())
+        return export.write_csv(fp, self.partitions(batch_size), keys, False, header)  # type: ignore[arg-type]
+
+
+_TYPED_RESULT_CLASSES: Dict[Type[_Result], Type[Result]] = {}
+
+
+def as_typed_result(result: _Result) -> Result:
+    """Rebind a SQLAlchemy result to the typed :class:`Result` in place."""
+    if isinstance(result, Result):
+        return result
+    cls = type(result)
+    typed_cls = _TYPED_RESULT_CLASSES.get(cls)
+    if typed_cls is None:
+        typed_cls = _TYPED_RESULT_CLASSES[cls] = type(cls.__name__, (Result, cls), {})
+    result.__class__ = typed_cls
+    return result  # type: ignore[return-value]
@@ -0,0 +1,242 @@
+from typing import (
+    Any,
+    AsyncIterator,
+    Generic,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    TypeVar,
+    Union,
+    overload,
+)
+
+from sqlalchemy import util
+from sqlalchemy.ext.asyncio import AsyncResult as _AsyncResult
+from sqlalchemy.ext.asyncio import AsyncScalarResult as _AsyncScalarResult
+from sqlalchemy.ext.asyncio import AsyncSession as _AsyncSession
+from sqlalchemy.sql.base import Executable
+from sqlalchemy.util.concurrency import greenlet_spawn
+
+from db_model.engine.result import Result, ScalarResult
+from db_model.orm import Session
+from db_model.sql import Select
+
+_T = TypeVar("_T")
+_V0 = TypeVar("_V0")
+_V1 = TypeVar("_V1")
+_V2 = TypeVar("_V2")
+
+_TSelect = TypeVar("_TSelect")
+_TSelect0 = TypeVar("_TSelect0")
+_TSelectParam = TypeVar("_TSelectParam", bound=tuple)
+
+
+class AsyncScalarResult(_AsyncScalarResult, Generic[_T]):  # pragma: no cover
+    async def all(self) -> List[_T]:
+        return await super().all()
+
+    def partitions(self, size: Optional[int] = None) -> AsyncIterator[List[_T]]:  # type: ignore
+        return super().partitions(size)  # type: ignore
+
+    async def fetchall(self) -> List[_T]:
+        return await super().fetchall()
+
+    async def fetchmany(self, size: Optional[int] = None) -> List[_T]:
+        return await super().fetchmany(size)
+
+    def __aiter__(self) -> AsyncIterator[_T]:  # type: ignore
+        return self
+
+    async def __anext__(self) -> _T:
+        return await super().__anext__()
+
+    async def first(self) -> Optional[_T]:
+        return await super().first()
+
+    async def one_or_none(self) -> Optional[_T]:
+        return await super().one_or_none()
+
+    async def one(self) -> _T:
+        return await super().one()
+
+
+class AsyncResult(_AsyncResult, Generic[_T]):  # pragma: no cover
+    @overload
+    def scalars(self: "AsyncResult[tuple[_V0]]") -> AsyncScalarResult[_V0]:
+        ...
+
+    @overload
+    def scalars(self: "AsyncResult[tuple[_V0,_V1]]") -> AsyncScalarResult[_V0]:
+        ...
+
+    @overload
+    def scalars(self: "AsyncResult[tuple[_V0,_V1,_V2]]") -> AsyncScalarResult[_V0]:
+        ...
+
+    @overload
+    def scalars(self, index: int = 0) -> AsyncScalarResult:
+        ...
+
+    def scalars(self, index: int = 0) -> AsyncScalarResult:
+        return AsyncScalarResult(self._real_result, index)  # type: ignore
+
+    def __aiter__(self) -> AsyncIterator[_T]:  # type: ignore
+        return self
+
+    async def __anext__(self) -> _T:  # type: ignore
+        return await super().__anext__()  # type: ignore
+
+    def partitions(self, size: Optional[int] = None) -> AsyncIterator[List[_T]]:  # type: ignore
+        return super().partitions(size)  # type: ignore
+
+    async def fetchone(self) -> Optional[_T]:  # type: ignore
+        return await super().fetchone()  # type: ignore
+
+    async def fetchmany(self, size: Optional[int] = None) -> List[_T]:  # type: ignore
+        return await super().fetchmany(size)  # type: ignore
+
+    async def all(self) -> List[_T]:  # type: ignore
+        return await super().all()  # type: ignore
+
+    async def first(self) -> Optional[_T]:  # type: ignore
+        return await super().first()  # type: ignore
+
+    async def one_or_none(self) -> Optional[_T]:  # type: ignore
+        return await super().one_or_none()  # type: ignore
+
+    async def one(self) -> _T:  # type: ignore
+        return await super().one()  # type: ignore
+
+
+class AsyncSession(_AsyncSession):
+    """asyncio counterpart of :class:`db_model.orm.Session`.
+
+    Statements run on the typed ``Session`` proxied by ``sync_session``.
+    """
+
+    sync_session_class = Session
+    sync_session: Session
+
+    @overload  # type: ignore[override]
+    async def scalars(
+        self,
+        statement: Select[tuple[_TSelect]],
+        params: Optional[Union[Mapping[str, Any], Sequence[Mapping[str, Any]]]] = None,
+        execution_options: Mapping[str, Any] = util.EMPTY_DICT,
+        bind_arguments: Optional[Mapping[str, Any]] = None,
+        **kw: Any,
+    ) -> ScalarResult[_TSelect]:
+        ...
+
+    @overload
+    async def scalars(
+        self,
+        statement: Select[tuple[_TSelect, _TSelect0]],
+        params: Optional[Union[Mapping[str, Any], Sequence[Mapping[str, Any]]]] = None,
+        execution_options: Mapping[str, Any] = util.EMPTY_DICT,
+        bind_arguments: Optional[Mapping[str, Any]] = None,
+        **kw: Any,
+    ) -> ScalarResult[_TSelect]:
+        ...
+
+    @overload
+    async def scalars(
+        self,
+        statement: Executable,
+        params: Optional[Union[Mapping[str, Any], Sequence[Mapping[str, Any]]]] = None,
+        execution_options: Mapping[str, Any] = util.EMPTY_DICT,
+        bind_arguments: Optional[Mapping[str, Any]] = None,
+        **kw: Any,
+    ) -> ScalarResult:
+        ...
+
+    async def scalars(
+        self,
+        statement: Union[Executable, Select[tuple]],
+        params: Optional[Union[Mapping[str, Any], Sequence[Mapping[str, Any]]]] = None,
+        execution_options: Mapping[str, Any] = util.EMPTY_DICT,
+        bind_arguments: Optional[Mapping[str, Any]] = None,
+        **kw: Any,
+    ) -> ScalarResult:
+        return await super().scalars(statement, params, execution_options, bind_arguments, **kw)  # type: ignore
+
+    @overload  # type: ignore[override]
+    async def execute(
+        self,
+        statement: Select[_TSelectParam],
+        params: Optional[Union[Mapping[str, Any], Sequence[Mapping[str, Any]]]] = None,
+        execution_options: Mapping[str, Any] = util.EMPTY_DICT,
+        bind_arguments: Optional[Mapping[str, Any]] = None,
+        **kw: Any,
+    ) -> Result[_TSelectParam]:
+        ...
+
+    @overload
+    async def execute(
+        self,
+        statement: Executable,
+        params: Optional[Union[Mapping[str, Any], Sequence[Mapping[str, Any]]]] = None,
+        execution_options: Mapping[str, Any] = util.EMPTY_DICT,
+        bind_arguments: Optional[Mapping[str, Any]] = None,
+        **kw: Any,
+    ) -> Result:
+        ...
+
+    async def execute(
+        self,
+        statement: Union[Executable, Select[_TSelectParam]],
+        params: Optional[Union[Mapping[str, Any], Sequence[Mapping[str, Any]]]] = None,
+        execution_options: Mapping[str, Any] = util.EMPTY_DICT,
+        bind_arguments: Optional[Mapping[str, Any]] = None,
+        **kw: Any,
+    ) -> Result:
+        return await super().execute(statement, params, execution_options, bind_arguments, **kw)  # type: ignore
+
+    async def stream(  # type: ignore[override]
+        self,
+        statement: Select[_TSelectParam],
+        params: Optional[Mapping[str, Any]] = None,
+        *,
+        batch_size: int = 1000,
+    ) -> AsyncResult[_TSelectParam]:
+        """Stream ``statement`` like :meth:`db_model.orm.Session.stream`.
+
+        Rows are fetched on a server-side cursor ``batch_size`` at a time and the
+        instances of consumed batches are expunged from the session.
+        """
+        result = await greenlet_spawn(
+            self.sync_session.stream, statement, params, batch_size=batch_size
+        )
+        return AsyncResult(result)
+
+    @overload  # type: ignore[override]
+    async def stream_scalars(
+        self,
+        statement: Select[tuple[_TSelect]],
+        params: Optional[Mapping[str, Any]] = None,
+        *,
+        batch_size: int = ...,
+    ) -> AsyncScalarResult[_TSelect]:
+        ...
+
+    @overload
+    async def stream_scalars(
+        self,
+        statement: Select[tuple[_TSelect, _TSelect0]],
+        params: Optional[Mapping[str, Any]] = None,
+        *,
+        batch_size: int = ...,
+    ) -> AsyncScalarResult[_TSelect]:
+        ...
+
+    async def stream_scalars(
+        self,
+        statement: Select[Any],
+        params: Optional[Mapping[str, Any]] = None,
+        *,
+        batch_size: int = 1000,
+    ) -> AsyncScalarResult:
+        """Like :meth:`stream`, returning the first column of each row."""
+        result = await self.stream(statement, params, batch_size=batch_size)
+        return result.scalars()
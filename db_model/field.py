@@ -24,6 +24,7 @@ from db_model.dataclass_utils import KW_ONLY
 _T = TypeVar("_T")
 
 PrimaryKey = Annotated[_T, "PrimaryKey"]
+Indexed = Annotated[_T, "Indexed"]
 
 
 class Mapped(Generic[_T]):
@@ -66,6 +67,8 @@ class Field(_Field, Generic[_T]):
         foreign_key: Optional[Union[str, ForeignKey, PrimaryKey[_T]]],
         sa_args: Optional[Tuple[Any, ...]],
         sa_kwargs: Optional[Mapping[str, Any]],
+        index: bool = False,
+        unique: bool = False,
     ) -> None:
         super().__init__(
             default=default,
@@ -81,6 +84,8 @@ class Field(_Field, Generic[_T]):
         self.foreign_key = foreign_key
         self.sa_args = sa_args
         self.sa_kwargs = sa_kwargs
+        self.index = index
+        self.unique = unique
 
 
 @overload
@@ -96,6 +101,8 @@ def mapped_column(
     foreign_key: Optional[Union[str, ForeignKey, PrimaryKey[_T]]] = ...,
     sa_args: Optional[Tuple[Any, ...]] = ...,
     sa_kwargs: Optional[Mapping[str, Any]] = ...,
+    index: bool = ...,
+    unique: bool = ...,
 ) -> _T:
     ...
 
@@ -113,6 +120,8 @@ def mapped_column(
     foreign_key: Optional[Union[str, ForeignKey, PrimaryKey[_T]]] = ...,
     sa_args: Optional[Tuple[Any, ...]] = ...,
     sa_kwargs: Optional[Mapping[str, Any]] = ...,
+    index: bool = ...,
+    unique: bool = ...,
 ) -> _T:
     ...
 
@@ -129,6 +138,8 @@ def mapped_column(
     foreign_key: Optional[Union[str, ForeignKey, PrimaryKey[_T]]] = ...,
     sa_args: Optional[Tuple[Any, ...]] = ...,
     sa_kwargs: Optional[Mapping[str, Any]] = ...,
+    index: bool = ...,
+    unique: bool = ...,
 ) -> _T:
     ...
 
@@ -146,6 +157,8 @@ def mapped_column(
     foreign_key: Optional[Union[str, ForeignKey, PrimaryKey[_T]]] = None,
     sa_args: Optional[Tuple[Any, ...]] = None,
     sa_kwargs: Optional[Mapping[str, Any]] = None,
+    index: bool = False,
+    unique: bool = False,
 ) -> _T:
     return Field(  # type: ignore[return-value]
         default=default,
@@ -159,6 +172,8 @@ def mapped_column(
         foreign_key=foreign_key,
         sa_args=sa_args,
         sa_kwargs=sa_kwargs,
+        index=index,
+        unique=unique,
     )
 
 
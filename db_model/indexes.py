@@ -0,0 +1,92 @@
+import re
+from dataclasses import dataclass
+from typing import Any, List, Optional, Sequence, Tuple
+
+from sqlalchemy import Index, text
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.base import Executable
+from sqlalchemy.sql.elements import ClauseElement
+
+
+@dataclass(frozen=True)
+class IndexSpec:
+    """An index of a model, declared in ``__indexes__`` and built by ``register()``."""
+
+    columns: Tuple[str, ...]
+    name: Optional[str] = None
+    unique: bool = False
+    where: Optional[str] = None
+    include: Tuple[str, ...] = ()
+
+    def to_index(self, table_name: str) -> Index:
+        prefix = "uq" if self.unique else "ix"
+        name = self.name or "_".join((prefix, table_name, *self.columns))
+        kwargs: dict = {}
+        if self.where is not None:
+            kwargs.update(
+                postgresql_where=text(self.where), sqlite_where=text(self.where)
+            )
+        if self.include:
+            kwargs.update(
+                postgresql_include=list(self.include), mssql_include=list(self.include)
+            )
+        return Index(name, *self.columns, unique=self.unique, **kwargs)
+
+
+def index(
+    *columns: str,
+    name: Optional[str] = None,
+    unique: bool = False,
+    where: Optional[str] = None,
+    include: Sequence[str] = (),
+) -> IndexSpec:
+    """Declare an index on ``columns`` for ``__indexes__``.
+
+    ``where`` makes a partial index (PostgreSQL and SQLite) and ``include``
+    adds non-key columns to a covering index (PostgreSQL and SQL Server).
+    The name defaults to ``ix_<table>_<columns>``, or ``uq_`` when unique.
+    """
+    return IndexSpec(tuple(columns), name, unique, where, tuple(include))
+
+
+def get_indexes(cls: type, table_name: str) -> List[Index]:
+    return [
+        spec.to_index(table_name) if isinstance(spec, IndexSpec) else spec
+        for spec in getattr(cls, "__indexes__", ())
+    ]
+
+
+class _Explain(Executable, ClauseElement):
+    inherit_cache = False
+
+    def __init__(self, statement: Any, prefix: str) -> None:
+        self.statement = statement
+        self.prefix = prefix
+
+
+@compiles(_Explain)
+def _compile_explain(element: _Explain, compiler: Any, **kw: Any) -> str:
+    return f"{element.prefix} {compiler.process(element.statement, **kw)}"
+
+
+_EXPLAIN_PREFIXES = {"sqlite": "EXPLAIN QUERY PLAN", "postgresql": "EXPLAIN"}
+
+_FULL_SCANS = {
+    # "SCAN t USING INDEX ix" reads the whole index, only SEARCH seeks keys.
+    "sqlite": re.compile(r"^SCAN (?!CONSTANT ROW)"),
+    "postgresql": re.compile(r"Seq Scan on "),
+}
+
+
+def check_indexes(session: Any, statement: Any) -> List[str]:
+    """Return the lines of the query plan of ``statement`` scanning a whole table or index.
+
+    Meant for tests, e.g. ``assert not check_indexes(session, select(...))``.
+    Only SQLite and PostgreSQL query plans are understood.
+    """
+    dialect = session.get_bind().dialect.name
+    if dialect not in _EXPLAIN_PREFIXES:
+        raise NotImplementedError(f"check_indexes does not support {dialect}")
+    rows = session.execute(_Explain(statement, _EXPLAIN_PREFIXES[dialect]))
+    details = [row[-1] for row in rows]
+    return [detail for detail in details if _FULL_SCANS[dialect].search(detail)]
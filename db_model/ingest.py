@@ -0,0 +1,208 @@
+"""Load CSV, JSON lines and Arrow files into the table of a model.
+
+Files are read and inserted ``batch_size`` rows at a time with ``executemany``,
+values are coerced to the types of the model's fields, ``bytes`` from hex strings
+in CSV and JSON lines. Arrow formats need ``pyarrow``.
+"""
+import csv
+import json
+import logging
+import os
+from dataclasses import dataclass
+from datetime import date, datetime
+from importlib import import_module
+from time import perf_counter
+from typing import (
+    IO,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    Mapping,
+    Optional,
+    Type,
+    Union,
+)
+from uuid import UUID
+
+from sqlalchemy import insert
+
+from db_model.core import _configure, get_column_fields
+from db_model.orm import Session
+from db_model.orm.session import _chunks
+from db_model.types_ import lookup_type
+from db_model.typing_utils import get_sub_types
+
+logger = logging.getLogger("db_model.ingest")
+
+Source = Union[str, "os.PathLike[str]", IO[str]]
+Converter = Callable[[Any], Any]
+
+_PARSERS: Dict[type, Converter] = {
+    bytes: bytes.fromhex,
+    date: date.fromisoformat,
+    datetime: datetime.fromisoformat,
+    UUID: UUID,
+}
+
+_FORMATS = {
+    ".csv": "csv",
+    ".jsonl": "jsonl",
+    ".ndjson": "jsonl",
+    ".parquet": "parquet",
+    ".arrow": "arrow",
+    ".feather": "arrow",
+}
+
+
+@dataclass
+class LoadProgress:
+    """Rows inserted so far and seconds elapsed since the load started."""
+
+    model: type
+    rows: int
+    elapsed: float
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.elapsed if self.elapsed else 0.0
+
+
+def log_progress(progress: LoadProgress) -> None:
+    logger.info(
+        "%s: %d rows loaded in %.1fs (%.0f rows/s)",
+        progress.model.__name__,
+        progress.rows,
+        progress.elapsed,
+        progress.rows_per_second,
+    )
+
+
+def _parse_int(type_: Type[int]) -> Converter:
+    if type_ is bool:
+        return lambda value: value.lower() in ("1", "true", "t", "yes")
+    return lambda value: type_(int(value))
+
+
+def _converter(type_: Any) -> Converter:
+    sub_types, _ = get_sub_types(type_)
+    inner_types = [sub_type for sub_type in sub_types if not isinstance(None, sub_type)]
+    if len(inner_types) != 1 or lookup_type(inner_types[0]) is None:
+        raise RuntimeError(f"Unable to map type {type_}: {inner_types}")
+    actual_type = inner_types[0]
+    nullable = type(None) in sub_types
+    parse = _PARSERS.get(actual_type, actual_type)
+    if issubclass(actual_type, int) and actual_type is not int:
+        # bool("false") is True and IntEnum("1") fails, go through int first.
+        parse = _parse_int(actual_type)
+
+    def convert(value: Any) -> Any:
+        if value is None or isinstance(value, actual_type):
+            return value
+        if value == "" and nullable:
+            return None
+        return parse(value)
+
+    return convert
+
+
+_CONVERTERS: Dict[type, Dict[str, Converter]] = {}
+
+
+def get_converters(model: type) -> Dict[str, Converter]:
+    """Return a function coercing raw values, per column of ``model``."""
+    converters = _CONVERTERS.get(model)
+    if converters is None:
+        _configure((model,))
+        fields = get_column_fields(model, getattr(model, "__mapper_args__", {}))
+        converters = _CONVERTERS[model] = {
+            field.name: _converter(field.type) for field in fields
+        }
+    return converters
+
+
+def _read_csv(fp: IO[str]) -> Iterator[Mapping[str, Any]]:
+    return csv.DictReader(fp)
+
+
+def _read_jsonl(fp: IO[str]) -> Iterator[Mapping[str, Any]]:
+    return (json.loads(line) for line in fp if line.strip())
+
+
+def _read_arrow_batches(path: Any, format: str, batch_size: int) -> Iterator[Any]:
+    if format == "parquet":
+        parquet = import_module("pyarrow.parquet")
+        yield from parquet.ParquetFile(path).iter_batches(batch_size=batch_size)
+    else:
+        ipc = import_module("pyarrow.ipc")
+        with ipc.open_file(path) as reader:
+            for index in range(reader.num_record_batches):
+                yield reader.get_batch(index)
+
+
+def _format(source: Source, format: Optional[str]) -> str:
+    if format is not None:
+        return format
+    name: Any = getattr(source, "name", source)
+    suffix = (
+        os.path.splitext(os.fspath(name))[1].lower()
+        if isinstance(name, (str, os.PathLike))
+        else ""
+    )
+    if suffix not in _FORMATS:
+        raise ValueError(f"Cannot infer the format of {source!r}, pass format=")
+    return _FORMATS[suffix]
+
+
+def _batches(
+    source: Source, format: str, batch_size: int
+) -> Iterator[Iterable[Mapping[str, Any]]]:
+    if format in ("parquet", "arrow"):
+        for batch in _read_arrow_batches(source, format, batch_size):
+            yield batch.to_pylist()
+        return
+
+    read = {"csv": _read_csv, "jsonl": _read_jsonl}[format]
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, newline="") as fp:
+            yield from _chunks(read(fp), batch_size)
+    else:
+        yield from _chunks(read(source), batch_size)
+
+
+def load(
+    model: Type[Any],
+    source: Source,
+    session: Session,
+    *,
+    format: Optional[str] = None,
+    batch_size: int = 10_000,
+    progress: Optional[Callable[[LoadProgress], None]] = log_progress,
+) -> int:
+    """Insert the rows of ``source`` into the table of ``model``, return their number.
+
+    ``source`` is a path or an open text file, its ``format`` (``"csv"``,
+    ``"jsonl"``, ``"parquet"`` or ``"arrow"``) is inferred from the file
+    extension by default. Columns missing from the model are ignored and empty
+    CSV values are loaded as ``NULL`` for optional fields. ``progress`` is
+    called after each batch, by default logging the number of rows per second.
+    """
+    converters = get_converters(model)
+    statement = insert(model.__table__)
+    start = perf_counter()
+    rows = 0
+    for batch in _batches(source, _format(source, format), batch_size):
+        params = [
+            {
+                key: converters[key](value)
+                for key, value in row.items()
+                if key in converters
+            }
+            for row in batch
+        ]
+        session.execute(statement, params=params)
+        rows += len(params)
+        if progress is not None:
+            progress(LoadProgress(model, rows, perf_counter() - start))
+    return rows
@@ -1,3 +1,26 @@
-__all__ = ("Session",)
+__all__ = (
+    "InMemoryCollector",
+    "LRUCache",
+    "LoggingCollector",
+    "NPlusOneDetector",
+    "NPlusOneError",
+    "NPlusOneWarning",
+    "PrometheusCollector",
+    "QueryStats",
+    "ResultCache",
+    "Session",
+    "ShardedSession",
+    "TTLCache",
+    "hash_shard",
+)
 
+from .cache import LRUCache, ResultCache, TTLCache
+from .n_plus_one import NPlusOneDetector, NPlusOneError, NPlusOneWarning
 from .session import Session
+from .sharding import ShardedSession, hash_shard
+from .tracking import (
+    InMemoryCollector,
+    LoggingCollector,
+    PrometheusCollector,
+    QueryStats,
+)
@@ -0,0 +1,374 @@
+from collections import OrderedDict
+from functools import partial
+from itertools import chain
+from threading import Lock
+from time import monotonic
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    NamedTuple,
+    Optional,
+    Protocol,
+    Set,
+    Tuple,
+)
+
+from sqlalchemy import Table, event, inspect
+from sqlalchemy.engine import FrozenResult, Result
+from sqlalchemy.orm import ORMExecuteState
+from sqlalchemy.orm import Session as _Session
+from sqlalchemy.orm import make_transient_to_detached
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.orm.base import instance_state
+from sqlalchemy.orm.mapper import Mapper
+from sqlalchemy.sql.util import find_tables
+
+NO_CACHE = "db_model_no_cache"
+
+_WRITTEN_TABLES = "db_model_written_tables"
+
+_EAGER_STRATEGIES = {"joined", "selectin", "subquery", "immediate"}
+
+
+class CacheBackend(Protocol):
+    def get(self, key: Hashable) -> Optional["CacheEntry"]:
+        ...
+
+    def set(self, key: Hashable, value: "CacheEntry") -> None:
+        ...
+
+    def delete(self, key: Hashable) -> None:
+        ...
+
+    def clear(self) -> None:
+        ...
+
+
+class LRUCache:
+    """Keep the ``maxsize`` most recently used results, thread-safe."""
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: Hashable) -> Optional["CacheEntry"]:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: "CacheEntry") -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class TTLCache(LRUCache):
+    """:class:`LRUCache` whose entries also expire ``ttl`` seconds after being set."""
+
+    def __init__(self, ttl: float, maxsize: int = 1024) -> None:
+        super().__init__(maxsize)
+        self.ttl = ttl
+
+    def get(self, key: Hashable) -> Optional["CacheEntry"]:
+        entry: Any = super().get(key)
+        if entry is None:
+            return None
+        expires, value = entry
+        if expires < monotonic():
+            self.delete(key)
+            return None
+        return value
+
+    def set(self, key: Hashable, value: "CacheEntry") -> None:
+        super().set(key, (monotonic() + self.ttl, value))  # type: ignore[arg-type]
+
+
+def _hashable(value: Any) -> Hashable:
+    if isinstance(value, (list, tuple)):
+        return tuple(_hashable(item) for item in value)
+    elif isinstance(value, dict):
+        return tuple(sorted((key, _hashable(item)) for key, item in value.items()))
+    return value
+
+
+def _mapper_tables(mapper: Mapper, seen: Set[Mapper]) -> Iterable[Table]:
+    # Eagerly loaded relationships end up in the cached instances, so their
+    # tables invalidate the entry as well.
+    if mapper in seen:
+        return
+    seen.add(mapper)
+    yield from mapper.tables
+    for relationship in mapper.relationships:
+        if relationship.lazy in _EAGER_STRATEGIES:
+            yield from _mapper_tables(relationship.mapper, seen)
+
+
+class CacheEntry(NamedTuple):
+    """Rows of a result, with the version of each table read when they were."""
+
+    versions: Tuple[Tuple[Table, int], ...]
+    result: FrozenResult
+
+
+class _Modified(Exception):
+    pass
+
+
+def _detached_copy(instance: Any, copies: Dict[int, Any]) -> Any:
+    # A clean, detached copy of the loaded attributes and relationships.
+    copy = copies.get(id(instance))
+    if copy is not None:
+        return copy
+    state = instance_state(instance)
+    if state.modified or state.key is None:
+        # Rows do not override pending changes, these values are not the database's.
+        raise _Modified()
+    mapper = state.mapper
+    copy = copies[id(instance)] = state.manager.new_instance()
+    instance_state(copy).key = state.key
+    _set_loaded(copy, state, mapper.column_attrs)
+    for relationship in mapper.relationships:
+        if relationship.key in state.dict:
+            set_committed_value(
+                copy,
+                relationship.key,
+                _map_related(
+                    relationship, state.dict[relationship.key], _detached_copy, copies
+                ),
+            )
+    return copy
+
+
+def _attach(session: _Session, snapshot: Any, attached: Dict[int, Any]) -> Any:
+    # The instance of the session with the identity of ``snapshot``, loaded
+    # attributes are kept like when a query returns an instance already loaded.
+    instance = attached.get(id(snapshot))
+    if instance is not None:
+        return instance
+    snapshot_state = instance_state(snapshot)
+    mapper = snapshot_state.mapper
+    instance = session.identity_map.get(snapshot_state.key)
+    if instance is None:
+        instance = snapshot_state.manager.new_instance()
+        _set_loaded(instance, snapshot_state, mapper.column_attrs)
+        make_transient_to_detached(instance)
+        instance_state(instance).key = snapshot_state.key
+        # Not a write, read-only sessions attach the instance as well.
+        _Session.add(session, instance)  # type: ignore[arg-type]
+    attached[id(snapshot)] = instance
+    _set_loaded(instance, snapshot_state, mapper.column_attrs)
+    _set_loaded(instance, snapshot_state, mapper.relationships, session, attached)
+    return instance
+
+
+def _set_loaded(
+    instance: Any,
+    source: Any,
+    attributes: Iterable[Any],
+    session: Optional[_Session] = None,
+    attached: Optional[Dict[int, Any]] = None,
+) -> None:
+    # Set the attributes loaded in ``source`` that are not in ``instance``.
+    instance_dict = instance_state(instance).dict
+    for attribute in attributes:
+        key = attribute.key
+        if key in source.dict and key not in instance_dict:
+            value = source.dict[key]
+            if session is not None and attached is not None:
+                value = _map_related(
+                    attribute, value, partial(_attach, session), attached
+                )
+            set_committed_value(instance, key, value)
+
+
+def _map_related(
+    relationship: Any,
+    value: Any,
+    function: Callable[[Any, Dict[int, Any]], Any],
+    memo: Dict[int, Any],
+) -> Any:
+    if not relationship.uselist:
+        return None if value is None else function(value, memo)
+    if isinstance(value, dict):
+        value = value.values()
+    return [function(item, memo) for item in value]
+
+
+def _is_instance(value: Any) -> bool:
+    return hasattr(value, "_sa_instance_state")
+
+
+class ResultCache:
+    """Cache the results of SELECT statements executed by sessions.
+
+    Entries are keyed by the statement's cache key and parameter values and
+    hold detached copies of the instances loaded, attached to the session of
+    each hit. They are stale once a flush or a DML statement of a session
+    using the cache touches one of the tables they read, and again once the
+    transaction that did is committed or rolled back. Statements reading
+    tables written by the current transaction of a session are not cached.
+    ``backend`` defaults to an :class:`LRUCache`. Statements executed with
+    the ``db_model_no_cache`` execution option are not cached.
+
+    The cache may be shared by sessions of several threads as long as its
+    backend is thread-safe, as :class:`LRUCache` and :class:`TTLCache` are.
+    """
+
+    def __init__(self, backend: Optional[CacheBackend] = None) -> None:
+        self.backend: CacheBackend = LRUCache() if backend is None else backend
+        self.hits = 0
+        self.misses = 0
+        # Invalidating bumps the version of tables instead of tracking the
+        # keys reading them, stale entries are dropped when read or evicted.
+        self._versions: Dict[Table, int] = {}
+        self._lock = Lock()
+
+    def install(self, session: _Session) -> None:
+        event.listen(session, "do_orm_execute", self._on_execute)
+        event.listen(session, "after_flush", self._after_flush)
+        event.listen(session, "after_commit", self._after_commit)
+        event.listen(session, "after_soft_rollback", self._after_soft_rollback)
+        event.listen(session, "after_transaction_end", self._after_transaction_end)
+
+    def invalidate(self, tables: Iterable[Table]) -> None:
+        with self._lock:
+            for table in tables:
+                self._versions[table] = self._versions.get(table, 0) + 1
+
+    def clear(self) -> None:
+        self.backend.clear()
+
+    def _key(
+        self, orm_execute_state: ORMExecuteState
+    ) -> Optional[Tuple[Hashable, ...]]:
+        cache_key = orm_execute_state.statement._generate_cache_key()  # type: ignore
+        if cache_key is None:
+            return None
+        return (
+            cache_key.key,
+            tuple(_hashable(bind.effective_value) for bind in cache_key.bindparams),
+            _hashable(orm_execute_state.parameters or {}),
+        )
+
+    def _tables(self, orm_execute_state: ORMExecuteState) -> Set[Table]:
+        statement: Any = orm_execute_state.statement
+        tables = set(find_tables(statement, include_crud=True))
+        seen: Set[Mapper] = set()
+        for mapper in orm_execute_state.all_mappers:
+            tables.update(_mapper_tables(mapper, seen))
+        return tables
+
+    def _written(self, session: _Session) -> Set[Table]:
+        written: Set[Table] = session.info.setdefault(_WRITTEN_TABLES, set())
+        return written
+
+    def _write(self, session: _Session, tables: Set[Table]) -> None:
+        self.invalidate(tables)
+        self._written(session).update(tables)
+
+    def _fresh(self, entry: CacheEntry) -> bool:
+        return all(
+            self._versions.get(table, 0) == version for table, version in entry.versions
+        )
+
+    def _on_execute(self, orm_execute_state: ORMExecuteState) -> Optional[Result]:
+        session = orm_execute_state.session
+        if not orm_execute_state.is_select:
+            if (
+                orm_execute_state.is_insert
+                or orm_execute_state.is_update
+                or orm_execute_state.is_delete
+            ):
+                self._write(session, self._tables(orm_execute_state))
+            return None
+        if orm_execute_state.execution_options.get(NO_CACHE):
+            return None
+        key = self._key(orm_execute_state)
+        if key is None:
+            return None
+        tables = self._tables(orm_execute_state)
+        if not tables.isdisjoint(self._written(session)):
+            # Rows not committed yet must not be seen by other sessions.
+            return None
+
+        entry = self.backend.get(key)
+        if entry is not None and not self._fresh(entry):
+            self.backend.delete(key)
+            entry = None
+        if entry is None:
+            self.misses += 1
+            versions = tuple((table, self._versions.get(table, 0)) for table in tables)
+            frozen = orm_execute_state.invoke_statement().freeze()
+            copies: Dict[int, Any] = {}
+            try:
+                rows = [
+                    [
+                        _detached_copy(value, copies) if _is_instance(value) else value
+                        for value in row
+                    ]
+                    for row in frozen.rewrite_rows()
+                ]
+            except _Modified:
+                pass
+            else:
+                self.backend.set(
+                    key, CacheEntry(versions, frozen.with_new_rows(rows))  # type: ignore[arg-type]
+                )
+            return frozen()
+
+        self.hits += 1
+        attached: Dict[int, Any] = {}
+        rows = [
+            [
+                _attach(session, value, attached) if _is_instance(value) else value
+                for value in row
+            ]
+            for row in entry.result.rewrite_rows()
+        ]
+        return entry.result.with_new_rows(rows)()  # type: ignore[arg-type,no-any-return]
+
+    def _after_flush(self, session: _Session, flush_context: Any) -> None:
+        instances = chain(session.new, session.dirty, session.deleted)
+        self._write(
+            session,
+            {
+                table
+                for instance in instances
+                for table in inspect(instance).mapper.tables
+            },
+        )
+
+    def _after_commit(self, session: _Session) -> None:
+        # Other sessions may have cached the previously committed rows since
+        # the flush, those entries are stale once the new rows are visible.
+        written = self._written(session)
+        self.invalidate(written)
+        written.clear()
+
+    def _after_soft_rollback(
+        self, session: _Session, previous_transaction: Any
+    ) -> None:
+        self.invalidate(self._written(session))
+
+    def _after_transaction_end(self, session: _Session, transaction: Any) -> None:
+        if transaction.parent is None:
+            # Closing a session rolls back without a rollback event.
+            written = self._written(session)
+            self.invalidate(written)
+            written.clear()
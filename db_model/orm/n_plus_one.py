@@ -0,0 +1,113 @@
+import logging
+import os
+import sys
+import warnings
+from dataclasses import dataclass
+from typing import Any, Dict, List, Literal, Optional, Tuple
+
+import sqlalchemy
+from sqlalchemy import event
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.orm import ORMExecuteState
+from sqlalchemy.orm import Session as _Session
+
+import db_model
+
+_IGNORED_PATHS = (
+    os.path.dirname(sqlalchemy.__file__),
+    os.path.dirname(db_model.__file__),
+)
+
+logger = logging.getLogger("db_model.n_plus_one")
+
+
+class NPlusOneWarning(UserWarning):
+    pass
+
+
+class NPlusOneError(InvalidRequestError):
+    pass
+
+
+@dataclass
+class NPlusOneReport:
+    """A relationship lazily loaded for several instances from the same line."""
+
+    relationship: str
+    call_site: str
+    count: int = 0
+
+    def __str__(self) -> str:
+        return (
+            f"{self.relationship} lazily loaded {self.count} times at {self.call_site}, "
+            "consider a selectin or joined loading strategy"
+        )
+
+
+def _call_site() -> str:
+    frame = sys._getframe(1)
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if not filename.startswith(_IGNORED_PATHS):
+            return f"{filename}:{frame.f_lineno} in {frame.f_code.co_name}"
+        frame = frame.f_back  # type: ignore[assignment]
+    return "<unknown>"
+
+
+class NPlusOneDetector:
+    """Report relationships lazily loaded ``threshold`` times from one call site.
+
+    ``action`` is ``"warn"`` to emit an :class:`NPlusOneWarning`, ``"raise"`` to
+    raise :class:`NPlusOneError` or ``"log"`` to log a warning. Reports are
+    also kept in ``reports``.
+    """
+
+    def __init__(
+        self,
+        threshold: int = 2,
+        action: Literal["warn", "raise", "log"] = "warn",
+    ) -> None:
+        self.threshold = threshold
+        self.action = action
+        self._loads: Dict[Tuple[str, str], NPlusOneReport] = {}
+
+    @property
+    def reports(self) -> List[NPlusOneReport]:
+        return [
+            report for report in self._loads.values() if report.count >= self.threshold
+        ]
+
+    def install(self, session: _Session) -> None:
+        event.listen(session, "do_orm_execute", self._on_execute)
+
+    def remove(self, session: _Session) -> None:
+        event.remove(session, "do_orm_execute", self._on_execute)
+
+    def _on_execute(self, orm_execute_state: ORMExecuteState) -> None:
+        if orm_execute_state.lazy_loaded_from is None:
+            return
+        path: Any = orm_execute_state.loader_strategy_path
+        prop: Optional[Any] = getattr(path, "prop", None)
+        relationship = (
+            f"{prop.parent.class_.__name__}.{prop.key}"
+            if prop is not None
+            else str(path)
+        )
+        call_site = _call_site()
+
+        report = self._loads.get((relationship, call_site))
+        if report is None:
+            report = self._loads[relationship, call_site] = NPlusOneReport(
+                relationship, call_site
+            )
+        report.count += 1
+        if report.count == self.threshold:
+            self._report(report)
+
+    def _report(self, report: NPlusOneReport) -> None:
+        if self.action == "raise":
+            raise NPlusOneError(str(report))
+        elif self.action == "log":
+            logger.warning("%s", report)
+        else:
+            warnings.warn(str(report), NPlusOneWarning, stacklevel=2)
@@ -1,19 +1,430 @@
-from typing import Any, Mapping, Optional, Sequence, TypeVar, Union, overload
+from contextlib import contextmanager
+from itertools import count, islice
+from time import perf_counter
+from typing import (
+    Any,
+    Callable,
+    Collection,
+    ContextManager,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    overload,
+)
 
-from sqlalchemy import util
+from sqlalchemy import Table, UniqueConstraint, insert, inspect, select, tuple_, util
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import IteratorResult
+from sqlalchemy.engine.default import DefaultDialect
+from sqlalchemy.engine.interfaces import Dialect
+from sqlalchemy.exc import ArgumentError, InvalidRequestError
+from sqlalchemy.orm import Query
 from sqlalchemy.orm import Session as _Session
+from sqlalchemy.orm.base import instance_state
 from sqlalchemy.sql.base import Executable
 
-from db_model.engine.result import Result, ScalarResult
+from db_model.core import _configure
+from db_model.engine.result import Result, ScalarResult, as_typed_result
+from db_model.orm.cache import ResultCache
+from db_model.orm.n_plus_one import NPlusOneDetector
+from db_model.orm.tracking import (
+    InMemoryCollector,
+    QueryCollector,
+    QueryStats,
+    track_result,
+    tracking_options,
+)
 from db_model.sql import Select
 
 _TSelect = TypeVar("_TSelect")
 _TSelect0 = TypeVar("_TSelect0")
 
 _TSelectParam = TypeVar("_TSelectParam", bound=tuple)
+_TModel = TypeVar("_TModel")
+_T = TypeVar("_T")
+_TCollector = TypeVar("_TCollector", bound=QueryCollector)
+
+_DEFAULT_MAX_BIND_PARAMETERS = 999
+_MAX_BIND_PARAMETERS: Dict[str, int] = {
+    "sqlite": 999,
+    "postgresql": 32767,
+    "mssql": 2100,
+}
+
+
+def _max_bind_parameters(dialect: Dialect) -> int:
+    return _MAX_BIND_PARAMETERS.get(dialect.name, _DEFAULT_MAX_BIND_PARAMETERS)
+
+
+def _rows_per_statement(dialect: Dialect, table: Table, batch_size: int) -> int:
+    return max(1, min(batch_size, _max_bind_parameters(dialect) // len(table.columns)))
+
+
+def _chunks(iterable: Iterable[_T], size: int) -> Iterator[List[_T]]:
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def _to_params(
+    table: Table, row: Union[_TModel, Mapping[str, Any]]
+) -> Mapping[str, Any]:
+    if isinstance(row, Mapping):
+        return row
+    return {key: getattr(row, key) for key in table.columns.keys()}
+
+
+_UPSERT_INSERTS: Dict[str, Callable[[Table], Any]] = {
+    "sqlite": sqlite.insert,
+    "postgresql": postgresql.insert,
+}
+
+
+def _conflict_columns(
+    table: Table, conflict_on: Optional[Union[str, Sequence[Any], UniqueConstraint]]
+) -> List[Any]:
+    if conflict_on is None:
+        return [column.key for column in table.primary_key.columns]
+    if isinstance(conflict_on, str):
+        constraints = {
+            constraint.name: constraint
+            for constraint in table.constraints
+            if isinstance(constraint, UniqueConstraint)
+        }
+        if conflict_on not in constraints:
+            raise ArgumentError(
+                f"{table.name} has no unique constraint named {conflict_on}"
+            )
+        conflict_on = constraints[conflict_on]
+    if isinstance(conflict_on, UniqueConstraint):
+        return [column.key for column in conflict_on.columns]
+    return [getattr(column, "key", column) for column in conflict_on]
+
+
+def _last_per_conflict(
+    chunk: List[Mapping[str, Any]], conflict_columns: Sequence[str]
+) -> List[Mapping[str, Any]]:
+    # PostgreSQL refuses to update the same row twice in one statement, so
+    # only the last row of each conflict key is kept. Rows with a missing or
+    # NULL key never conflict and are all kept.
+    rows: Dict[Any, Mapping[str, Any]] = {}
+    for row in chunk:
+        key = tuple(row.get(column) for column in conflict_columns)
+        rows[object() if None in key else key] = row
+    return list(rows.values())
+
+
+_DETACHED_LOADERS: Dict[type, Callable[[Sequence[Any]], Any]] = {}
+
+
+def _get_detached_loader(model: Type[_TModel]) -> Callable[[Sequence[Any]], _TModel]:
+    loader = _DETACHED_LOADERS.get(model)
+    if loader is None:
+        keys = tuple(model.__table__.columns.keys())  # type: ignore[attr-defined]
+        new = object.__new__
+
+        def load(row: Sequence[Any]) -> _TModel:
+            instance = new(model)
+            instance.__dict__.update(zip(keys, row))
+            return instance
+
+        loader = _DETACHED_LOADERS[model] = load
+    return loader
+
+
+def _get_slotted_loader(model: type) -> Callable[[Sequence[Any]], Any]:
+    # The slotted twin of the model itself, not one inherited from a parent.
+    slotted = model.__dict__.get("__slotted__")
+    if slotted is None:
+        raise ArgumentError(f"{model.__name__} is not registered with slots=True")
+    loader = _DETACHED_LOADERS.get(slotted)
+    if loader is None:
+        keys = tuple(model.__table__.columns.keys())  # type: ignore[attr-defined]
+        new = object.__new__
+        cls: type = slotted
+        setters = tuple(getattr(cls, key).__set__ for key in keys)
+
+        def load(row: Sequence[Any]) -> Any:
+            instance: Any = new(cls)
+            for set_, value in zip(setters, row):
+                set_(instance, value)
+            return instance
+
+        loader = _DETACHED_LOADERS[slotted] = load
+    return loader
+
+
+def _models(statement: Any) -> Tuple[str, ...]:
+    descriptions = getattr(statement, "column_descriptions", ())
+    entities = (description.get("entity") for description in descriptions)
+    return tuple(dict.fromkeys(entity.__name__ for entity in entities if entity))
+
+
+def _checked_out(engine: Any) -> int:
+    checkedout = getattr(engine.pool, "checkedout", None)
+    return checkedout() if checkedout is not None else 0
 
 
 class Session(_Session):
+    _reader_counter = count()
+
+    def __init__(
+        self,
+        *args: Any,
+        query_collectors: Iterable[QueryCollector] = (),
+        detect_n_plus_one: bool = False,
+        read_only: bool = False,
+        result_cache: Optional[ResultCache] = None,
+        readers: Sequence[Any] = (),
+        reader_strategy: Literal["round_robin", "least_loaded"] = "round_robin",
+        **kwargs: Any,
+    ) -> None:
+        """Create a session, see :class:`sqlalchemy.orm.Session` for the arguments.
+
+        A ``read_only`` session does not autoflush or expire instances on commit,
+        and raises ``InvalidRequestError`` on add, delete, merge, DML statements
+        and flushing changes made to loaded instances. SELECT statements are
+        cached in ``result_cache``, which may be shared between sessions.
+
+        With ``readers``, SELECT statements run on one of these replica binds,
+        picked once per session by ``reader_strategy``: ``"round_robin"`` or
+        ``"least_loaded"``, the engine with the fewest checked out connections.
+        SELECT ... FOR UPDATE and other statements run on the primary. Once the
+        session writes, by flushing or executing a DML statement, it reads
+        from the primary bind until closed. ``on_primary()`` forces primary
+        reads within a block.
+        """
+        if read_only:
+            kwargs.update(autoflush=False, expire_on_commit=False)
+        super().__init__(*args, **kwargs)
+        self.read_only = read_only
+        self.query_collectors: List[QueryCollector] = list(query_collectors)
+        if detect_n_plus_one:
+            NPlusOneDetector().install(self)
+        self.result_cache = result_cache
+        if result_cache is not None:
+            result_cache.install(self)
+        self.readers = list(readers)
+        self.reader_strategy = reader_strategy
+        self._reader: Optional[Any] = None
+        self._primary_depth = 0
+        self._wrote = False
+
+    def _choose_reader(self) -> Any:
+        if self._reader is None:
+            offset = next(self._reader_counter) % len(self.readers)
+            readers = self.readers[offset:] + self.readers[:offset]
+            if self.reader_strategy == "least_loaded":
+                self._reader = min(readers, key=_checked_out)
+            else:
+                self._reader = readers[0]
+        return self._reader
+
+    def get_bind(  # type: ignore[override]
+        self, mapper: Any = None, clause: Any = None, **kw: Any
+    ) -> Any:
+        if self.readers and kw.get("bind") is None:
+            if getattr(clause, "is_dml", False) or self._flushing:  # type: ignore[attr-defined]
+                self._wrote = True
+            elif (
+                getattr(clause, "is_select", False)
+                # Locking reads must run where the rows are written.
+                and getattr(clause, "_for_update_arg", None) is None
+                and not (self._wrote or self._primary_depth)
+            ):
+                return self._choose_reader()
+        return super().get_bind(mapper, clause=clause, **kw)
+
+    @contextmanager
+    def on_primary(self) -> Iterator[None]:
+        """Read from the primary bind within the block."""
+        self._primary_depth += 1
+        try:
+            yield
+        finally:
+            self._primary_depth -= 1
+
+    def close(self) -> None:
+        super().close()
+        self._reader = None
+        self._wrote = False
+
+    def _check_writable(self, operation: str) -> None:
+        if self.read_only:
+            raise InvalidRequestError(f"Cannot {operation} in a read-only session")
+
+    def add(self, instance: Any, _warn: bool = True) -> None:
+        self._check_writable("add instances")
+        super().add(instance, _warn)
+
+    def add_all(self, instances: Iterable[Any]) -> None:
+        self._check_writable("add instances")
+        super().add_all(instances)
+
+    def delete(self, instance: Any) -> None:
+        self._check_writable("delete instances")
+        super().delete(instance)
+
+    def merge(
+        self,
+        instance: _TModel,
+        load: bool = True,
+        options: Optional[Sequence[Any]] = None,
+    ) -> _TModel:
+        self._check_writable("merge instances")
+        return super().merge(instance, load=load, options=options)
+
+    def bulk_save_objects(
+        self,
+        objects: Sequence[Any],
+        return_defaults: bool = False,
+        update_changed_only: bool = True,
+        preserve_order: bool = True,
+    ) -> None:
+        self._check_writable("save objects")
+        super().bulk_save_objects(
+            objects,
+            return_defaults=return_defaults,
+            update_changed_only=update_changed_only,
+            preserve_order=preserve_order,
+        )
+
+    def bulk_insert_mappings(
+        self,
+        mapper: Any,
+        mappings: Sequence[Mapping[str, Any]],
+        return_defaults: bool = False,
+        render_nulls: bool = False,
+    ) -> None:
+        self._check_writable("insert mappings")
+        super().bulk_insert_mappings(
+            mapper,
+            mappings,
+            return_defaults=return_defaults,
+            render_nulls=render_nulls,
+        )
+
+    def bulk_update_mappings(
+        self, mapper: Any, mappings: Sequence[Mapping[str, Any]]
+    ) -> None:
+        self._check_writable("update mappings")
+        super().bulk_update_mappings(mapper, mappings)
+
+    def flush(self, objects: Optional[Collection[Any]] = None) -> None:
+        # Read-only sessions never write, changes to loaded instances included.
+        if self.read_only:
+            if not self._is_clean():  # type: ignore[attr-defined]
+                self._check_writable("flush changes")
+            return
+        super().flush(objects)
+
+    @overload
+    def track_queries(self) -> ContextManager[InMemoryCollector]:
+        ...
+
+    @overload
+    def track_queries(self, collector: _TCollector) -> ContextManager[_TCollector]:
+        ...
+
+    @contextmanager  # type: ignore[misc]
+    def track_queries(
+        self, collector: Optional[QueryCollector] = None
+    ) -> Iterator[QueryCollector]:
+        """Record the queries executed within the block into ``collector``.
+
+        Without a collector an :class:`InMemoryCollector` is used, e.g.
+        ``with session.track_queries() as queries: ...`` then
+        ``assert queries.count <= 2``.
+        """
+        collector = InMemoryCollector() if collector is None else collector
+        self.query_collectors.append(collector)
+        try:
+            yield collector
+        finally:
+            self.query_collectors.remove(collector)
+
+    @contextmanager
+    def detect_n_plus_one(
+        self, detector: Optional[NPlusOneDetector] = None
+    ) -> Iterator[NPlusOneDetector]:
+        """Report relationships lazily loaded repeatedly from one line within the block.
+
+        ``Session(detect_n_plus_one=True)`` warns for the whole session instead.
+        """
+        detector = NPlusOneDetector() if detector is None else detector
+        detector.install(self)
+        try:
+            yield detector
+        finally:
+            detector.remove(self)
+
+    def get(  # type: ignore[override]
+        self, entity: Type[_TModel], ident: Any, **kw: Any
+    ) -> Optional[_TModel]:
+        _configure((entity,))
+        return super().get(entity, ident, **kw)
+
+    def get_many(
+        self, entity: Type[_TModel], idents: Iterable[Any]
+    ) -> List[Optional[_TModel]]:
+        """Return the instances of ``entity`` with the given primary keys, in order.
+
+        Instances already in the identity map are not fetched again, the others
+        are loaded with ``IN`` queries sized to the dialect's bind parameter
+        limit. Composite primary keys are given as tuples, missing keys give
+        ``None``.
+        """
+        _configure((entity,))
+        mapper = inspect(entity)
+        multiple = len(mapper.primary_key) > 1
+        keys = [tuple(ident) if multiple else (ident,) for ident in idents]
+        found = self._get_many(mapper, dict.fromkeys(keys))
+        return [found.get(key) for key in keys]
+
+    def _get_many(
+        self,
+        mapper: Any,
+        keys: Iterable[Tuple[Any, ...]],
+        identity_token: Any = None,
+        execution_options: Mapping[str, Any] = util.EMPTY_DICT,
+    ) -> Dict[Tuple[Any, ...], Any]:
+        found: Dict[Tuple[Any, ...], Any] = {}
+        missing: List[Tuple[Any, ...]] = []
+        for key in keys:
+            identity_key = mapper.identity_key_from_primary_key(key, identity_token)
+            instance = self.identity_map.get(identity_key)
+            if instance is not None and not instance_state(instance).expired:
+                found[key] = instance
+            else:
+                missing.append(key)
+
+        if missing:
+            columns = mapper.primary_key
+            dialect = self.get_bind(mapper).dialect
+            size = max(1, _max_bind_parameters(dialect) // len(columns))
+            where = columns[0].in_ if len(columns) == 1 else tuple_(*columns).in_
+            for chunk in _chunks(missing, size):
+                values: Any = [key[0] for key in chunk] if len(columns) == 1 else chunk
+                statement = select(mapper).where(where(values))
+                for instance in self.scalars(
+                    statement, execution_options=execution_options
+                ):
+                    found[tuple(mapper.primary_key_from_instance(instance))] = instance
+        return found
+
+    def query(self, *entities: Any, **kwargs: Any) -> "Query[Any]":
+        _configure(entities)
+        return super().query(*entities, **kwargs)
+
     @overload  # type: ignore[override]
     def scalars(
         self,
@@ -95,12 +506,289 @@ class Session(_Session):
         _add_event: Optional[Any] = None,
         **kw: Any,
     ) -> Union[Result[_TSelectParam], ScalarResult[_TSelectParam]]:
-        return super().execute(  # type: ignore[return-value]
+        if self.read_only and getattr(statement, "is_dml", False):
+            self._check_writable("execute DML statements")
+        if not self.query_collectors or _parent_execute_state is not None:
+            # Statements re-executed by do_orm_execute hooks report into the
+            # stats of the outer execute, passed along in execution_options.
+            result = super().execute(
+                statement,
+                params=params,
+                execution_options=execution_options,
+                bind_arguments=bind_arguments,
+                _parent_execute_state=_parent_execute_state,
+                _add_event=_add_event,
+                **kw,
+            )
+            return as_typed_result(result)
+
+        stats = QueryStats(models=_models(statement))
+        start = perf_counter()
+        result = super().execute(
             statement,
             params=params,
-            execution_options=execution_options,
+            execution_options={**execution_options, **tracking_options(stats)},
             bind_arguments=bind_arguments,
             _parent_execute_state=_parent_execute_state,
             _add_event=_add_event,
             **kw,
         )
+        stats.compile_time = perf_counter() - start - stats.execute_time
+        return as_typed_result(
+            track_result(result, stats, tuple(self.query_collectors))
+        )
+
+    @overload
+    def bulk_insert(
+        self,
+        model: Type[_TModel],
+        rows: Iterable[Union[_TModel, Mapping[str, Any]]],
+        *,
+        batch_size: int = ...,
+        return_primary_keys: Literal[False] = ...,
+    ) -> None:
+        ...
+
+    @overload
+    def bulk_insert(
+        self,
+        model: Type[_TModel],
+        rows: Iterable[Union[_TModel, Mapping[str, Any]]],
+        *,
+        batch_size: int = ...,
+        return_primary_keys: Literal[True],
+    ) -> List[Tuple[Any, ...]]:
+        ...
+
+    def bulk_insert(
+        self,
+        model: Type[_TModel],
+        rows: Iterable[Union[_TModel, Mapping[str, Any]]],
+        *,
+        batch_size: int = 1000,
+        return_primary_keys: bool = False,
+    ) -> Optional[List[Tuple[Any, ...]]]:
+        """Insert rows into the table of ``model`` without the unit of work.
+
+        Rows may be model instances or mappings of column name to value and
+        should all set the same columns. Instances are not added to the session.
+        Rows are written via ``executemany`` of one ``INSERT`` statement,
+        ``batch_size`` rows at a time, so the statement is compiled once and
+        drivers with a fast ``executemany``, such as psycopg2, batch it further.
+
+        With ``return_primary_keys`` the primary keys of the inserted rows are
+        returned in order. Dialects supporting ``RETURNING`` and multi-row
+        ``VALUES`` insert ``batch_size`` rows per statement; everywhere else,
+        SQLite included, one statement is executed per row.
+        """
+        _configure((model,))
+        table: Table = model.__table__  # type: ignore[attr-defined]
+        params = (_to_params(table, row) for row in rows)
+
+        if return_primary_keys:
+            dialect: DefaultDialect = self.get_bind(model).dialect  # type: ignore[assignment]
+            return self._insert_returning_primary_keys(
+                table, dialect, params, batch_size
+            )
+
+        statement = insert(table)
+        for chunk in _chunks(params, batch_size):
+            self.execute(statement, params=chunk)
+        return None
+
+    def _insert_returning_primary_keys(
+        self,
+        table: Table,
+        dialect: DefaultDialect,
+        params: Iterable[Mapping[str, Any]],
+        batch_size: int,
+    ) -> List[Tuple[Any, ...]]:
+        primary_keys: List[Tuple[Any, ...]] = []
+        if dialect.full_returning and dialect.supports_multivalues_insert:
+            statement = insert(table).returning(*table.primary_key.columns)
+            rows_per_statement = _rows_per_statement(dialect, table, batch_size)
+            for chunk in _chunks(params, rows_per_statement):
+                result: Any = self.execute(statement.values(chunk))
+                primary_keys.extend(tuple(row) for row in result)
+        else:
+            statement = insert(table)
+            for row in params:
+                result = self.execute(statement, params=row)
+                primary_keys.append(tuple(result.inserted_primary_key))
+        return primary_keys
+
+    def upsert(
+        self,
+        model: Type[_TModel],
+        rows: Iterable[Union[_TModel, Mapping[str, Any]]],
+        *,
+        conflict_on: Optional[Union[str, Sequence[Any], UniqueConstraint]] = None,
+        update: Optional[Sequence[str]] = None,
+        returning: Optional[Sequence[Any]] = None,
+        batch_size: int = 1000,
+    ) -> Optional[List[Tuple[Any, ...]]]:
+        """Insert rows into the table of ``model``, updating rows that already exist.
+
+        Conflicts are detected on ``conflict_on``: column names or columns, a
+        ``UniqueConstraint`` or its name, defaulting to the primary key. On
+        conflict the ``update`` columns are set from the new row, by default
+        every other column of the rows; with ``update=()`` conflicting rows are
+        left as they are. Rows are written with ``INSERT ... ON CONFLICT`` in
+        batches on SQLite and PostgreSQL. With ``returning`` the given columns
+        of the inserted or updated rows are returned, where the dialect
+        supports ``RETURNING``. When a batch holds several rows with the same
+        conflict key, only the last one is written.
+        """
+        _configure((model,))
+        table: Table = model.__table__  # type: ignore[attr-defined]
+        dialect: DefaultDialect = self.get_bind(model).dialect  # type: ignore[assignment]
+        dialect_insert = _UPSERT_INSERTS.get(dialect.name)
+        if dialect_insert is None:
+            raise NotImplementedError(f"upsert is not supported on {dialect.name}")
+        if returning is not None and not dialect.full_returning:
+            raise NotImplementedError(f"RETURNING is not supported on {dialect.name}")
+        conflict_columns = _conflict_columns(table, conflict_on)
+
+        returned: List[Tuple[Any, ...]] = []
+        params = (_to_params(table, row) for row in rows)
+        for chunk in _chunks(params, _rows_per_statement(dialect, table, batch_size)):
+            columns = update
+            if columns is None:
+                columns = [key for key in chunk[0] if key not in conflict_columns]
+            if columns:
+                chunk = _last_per_conflict(chunk, conflict_columns)
+            statement = dialect_insert(table).values(chunk)
+            if columns:
+                statement = statement.on_conflict_do_update(
+                    index_elements=conflict_columns,
+                    set_={key: statement.excluded[key] for key in columns},
+                )
+            else:
+                statement = statement.on_conflict_do_nothing(
+                    index_elements=conflict_columns
+                )
+            if returning is None:
+                self.execute(statement)
+            else:
+                result: Any = self.execute(statement.returning(*returning))
+                returned.extend(tuple(row) for row in result)
+        return None if returning is None else returned
+
+    def stream(
+        self,
+        statement: Select[_TSelectParam],
+        params: Optional[Mapping[str, Any]] = None,
+        *,
+        batch_size: int = 1000,
+    ) -> Result[_TSelectParam]:
+        """Execute ``statement`` on a server-side cursor, ``batch_size`` rows at a time.
+
+        Loaded instances are expunged from the session once their batch has been
+        consumed, so memory use stays flat regardless of the size of the result.
+        Changes made to them after that are not flushed.
+        """
+        result: Any = self.execute(
+            statement,
+            params=params,
+            execution_options={"stream_results": True, "yield_per": batch_size},
+        )
+        entities = [
+            index
+            for index, description in enumerate(statement.column_descriptions)
+            if description["entity"] is not None
+            and description["expr"] is description["entity"]
+        ]
+        rows = self._expunge_batches(result.partitions(), entities)
+        return as_typed_result(IteratorResult(result._metadata, rows, raw=result))
+
+    def _expunge_batches(
+        self, partitions: Iterable[List[Any]], entities: Sequence[int]
+    ) -> Iterator[Any]:
+        for partition in partitions:
+            yield from partition
+            for row in partition:
+                for index in entities:
+                    instance = row[index]
+                    if (
+                        instance is not None
+                        and instance_state(instance).session_id == self.hash_key
+                    ):
+                        self.expunge(instance)
+
+    @overload
+    def stream_scalars(
+        self,
+        statement: Select[tuple[_TSelect]],
+        params: Optional[Mapping[str, Any]] = None,
+        *,
+        batch_size: int = ...,
+    ) -> ScalarResult[_TSelect]:
+        ...
+
+    @overload
+    def stream_scalars(
+        self,
+        statement: Select[tuple[_TSelect, _TSelect0]],
+        params: Optional[Mapping[str, Any]] = None,
+        *,
+        batch_size: int = ...,
+    ) -> ScalarResult[_TSelect]:
+        ...
+
+    def stream_scalars(
+        self,
+        statement: Select[Any],
+        params: Optional[Mapping[str, Any]] = None,
+        *,
+        batch_size: int = 1000,
+    ) -> ScalarResult:
+        """Like :meth:`stream`, returning the first column of each row."""
+        return self.stream(statement, params, batch_size=batch_size).scalars()
+
+    def fetch_detached(
+        self,
+        statement: Select[tuple[_TSelect]],
+        params: Optional[Mapping[str, Any]] = None,
+    ) -> List[_TSelect]:
+        """Load instances of a single model without attaching them to the session.
+
+        Rows are fetched as plain columns and instances are built by setting
+        their ``__dict__`` directly, bypassing ``__init__``, instrumentation
+        events and the identity map. The instances are read-only snapshots: they
+        cannot be added to a session and relationships are not loaded.
+        """
+        return self._fetch_detached(statement, params, _get_detached_loader)
+
+    def fetch_slotted(
+        self,
+        statement: Select[tuple[_TSelect]],
+        params: Optional[Mapping[str, Any]] = None,
+    ) -> List[Any]:
+        """Like :meth:`fetch_detached`, loading instances of ``Model.__slotted__``.
+
+        The model must be registered with ``slots=True``. Its slotted twin is a
+        plain dataclass with the same fields and no ``__dict__``, not an
+        instance of the model.
+        """
+        return self._fetch_detached(statement, params, _get_slotted_loader)
+
+    def _fetch_detached(
+        self,
+        statement: Select[Any],
+        params: Optional[Mapping[str, Any]],
+        get_loader: Callable[[Any], Callable[[Sequence[Any]], Any]],
+    ) -> List[Any]:
+        descriptions = statement.column_descriptions
+        model = descriptions[0]["entity"] if len(descriptions) == 1 else None
+        if model is None or descriptions[0]["expr"] is not model:
+            raise ArgumentError(
+                f"fetch_detached expects a select of a single model, not {statement}"
+            )
+        _configure((model,))
+        table: Table = model.__table__
+        loader = get_loader(model)
+        result = self.execute(
+            statement.with_only_columns(*table.columns),
+            params=params,
+        )
+        return [loader(row) for row in result]
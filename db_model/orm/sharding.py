@@ -0,0 +1,479 @@
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from operator import attrgetter, itemgetter
+from time import perf_counter
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
+
+from sqlalchemy import event, inspect, util
+from sqlalchemy.engine import Engine, Result
+from sqlalchemy.exc import CompileError, InvalidRequestError
+from sqlalchemy.ext.horizontal_shard import ShardedSession as _ShardedSession
+from sqlalchemy.ext.horizontal_shard import (  # type: ignore[attr-defined]
+    execute_and_instances,
+)
+from sqlalchemy.orm import ORMExecuteState
+from sqlalchemy.sql import operators, visitors
+from sqlalchemy.sql.elements import FunctionFilter, Over, UnaryExpression, WithinGroup
+from sqlalchemy.sql.functions import FunctionElement
+from sqlalchemy.sql.selectable import CompoundSelect, Select
+
+from db_model.core import _configure
+from db_model.orm.session import Session, _to_params
+from db_model.orm.tracking import _STATS_OPTION
+
+_TModel = TypeVar("_TModel")
+
+ShardFunction = Callable[[Tuple[Any, ...], Sequence[str]], str]
+
+
+def hash_shard(identity: Tuple[Any, ...], shard_ids: Sequence[str]) -> str:
+    """Pick a shard from the CRC32 of the primary key values, stable across processes."""
+    digest = zlib.crc32("\0".join(map(str, identity)).encode())
+    return shard_ids[digest % len(shard_ids)]
+
+
+# Dialects sorting NULL after every other value in ascending order.
+_NULLS_LARGEST = {"postgresql", "oracle"}
+
+_AGGREGATES = {
+    "array_agg",
+    "avg",
+    "bool_and",
+    "bool_or",
+    "count",
+    "cume_dist",
+    "dense_rank",
+    "every",
+    "group_concat",
+    "json_agg",
+    "json_group_array",
+    "json_group_object",
+    "jsonb_agg",
+    "max",
+    "min",
+    "mode",
+    "percent_rank",
+    "percentile_cont",
+    "percentile_disc",
+    "rank",
+    "stddev",
+    "string_agg",
+    "sum",
+    "total",
+    "variance",
+}
+
+
+def _add(values: Sequence[Any]) -> Any:
+    present = [value for value in values if value is not None]
+    return sum(present[1:], present[0]) if present else None
+
+
+_Combiner = Callable[[Sequence[Any]], Any]
+
+_COMBINERS: Dict[str, _Combiner] = {
+    "count": _add,
+    "sum": _add,
+    "total": _add,
+    "min": lambda values: min((v for v in values if v is not None), default=None),
+    "max": lambda values: max((v for v in values if v is not None), default=None),
+}
+
+
+def _cannot(action: str) -> InvalidRequestError:
+    return InvalidRequestError(
+        f"Statements run on every shard cannot {action}, "
+        "execute them within session.shard()"
+    )
+
+
+def _is_aggregate(element: Any) -> bool:
+    return isinstance(element, (Over, WithinGroup, FunctionFilter)) or (
+        isinstance(element, FunctionElement)
+        and getattr(element, "name", "").lower() in _AGGREGATES
+    )
+
+
+def _combiners(statement: Select) -> Optional[List[_Combiner]]:
+    combiners: List[Optional[_Combiner]] = []
+    for column in statement.selected_columns:
+        element = getattr(column, "element", column)  # unwrap labels
+        combine = (
+            _COMBINERS.get(element.name.lower())
+            if isinstance(element, FunctionElement)
+            else None
+        )
+        if combine is not None and any(
+            getattr(child, "operator", None) is operators.distinct_op
+            for child in visitors.iterate(element)
+        ):
+            combine = None
+        if combine is None and any(map(_is_aggregate, visitors.iterate(column))):
+            raise _cannot(f"combine the aggregate {column}")
+        combiners.append(combine)
+    if not any(combiners):
+        return None
+    if not all(combiners):
+        raise _cannot("select aggregates along with other columns")
+    return combiners  # type: ignore[return-value]
+
+
+def _sort_key(
+    statement: Select, clause: Any, nulls_largest: bool
+) -> Tuple[Callable[[Sequence[Any]], Any], bool, bool]:
+    descending = False
+    nulls_first: Optional[bool] = None
+    element = clause
+    while isinstance(element, UnaryExpression) and element.modifier is not None:
+        if element.modifier is operators.desc_op:
+            descending = True
+        elif element.modifier is operators.nulls_first_op:
+            nulls_first = True
+        elif element.modifier is operators.nulls_last_op:
+            nulls_first = False
+        elif element.modifier is not operators.asc_op:
+            break
+        element = element.element
+    if nulls_first is None:
+        nulls_first = descending == nulls_largest
+
+    annotations = getattr(element, "_annotations", {})
+    for index, description in enumerate(statement.column_descriptions):
+        expression = description["expr"]
+        entity = inspect(expression, raiseerr=False)
+        if getattr(entity, "is_mapper", False) or getattr(
+            entity, "is_aliased_class", False
+        ):
+            if annotations.get("parententity") is entity:
+                get_instance = itemgetter(index)
+                get_value = attrgetter(annotations["proxy_key"])
+                return (
+                    (lambda row: get_value(get_instance(row))),
+                    descending,
+                    nulls_first,
+                )
+        elif hasattr(expression, "__clause_element__"):
+            if expression.__clause_element__().compare(element):
+                return itemgetter(index), descending, nulls_first
+        elif expression.compare(element):
+            return itemgetter(index), descending, nulls_first
+    raise _cannot(f"be ordered by {element}, which is not selected")
+
+
+class _Merge:
+    """Merge the results of a SELECT run on every shard as a single database would."""
+
+    def __init__(self, statement: Any, nulls_largest: bool) -> None:
+        if isinstance(statement, CompoundSelect):
+            raise _cannot("combine compound selects")
+        self.statement = statement
+        self.combiners: Optional[List[_Combiner]] = None
+        self.order_by: List[Tuple[Callable[[Sequence[Any]], Any], bool, bool]] = []
+        self.limit: Optional[int] = None
+        self.offset: Optional[int] = None
+        if not isinstance(statement, Select):
+            # Textual statements, their rows are concatenated.
+            return
+
+        if (
+            statement._distinct  # type: ignore[attr-defined]
+            or statement._group_by_clauses  # type: ignore[attr-defined]
+            or statement._having_criteria  # type: ignore[attr-defined]
+        ):
+            raise _cannot("use DISTINCT, GROUP BY or HAVING")
+        if statement._fetch_clause is not None:  # type: ignore[attr-defined]
+            raise _cannot("use FETCH")
+        self.combiners = _combiners(statement)
+        self.order_by = [
+            _sort_key(statement, clause, nulls_largest)
+            for clause in statement._order_by_clauses  # type: ignore[attr-defined]
+        ]
+        if (
+            statement._limit_clause is not None  # type: ignore[attr-defined]
+            or statement._offset_clause is not None  # type: ignore[attr-defined]
+        ):
+            if self.combiners is not None:
+                raise _cannot("limit aggregates")
+            try:
+                self.limit = statement._limit  # type: ignore[attr-defined]
+                self.offset = statement._offset  # type: ignore[attr-defined]
+            except CompileError:
+                raise _cannot("use LIMIT or OFFSET expressions") from None
+            # Each shard returns every row that may end up in the window.
+            self.statement = statement.offset(None).limit(
+                None if self.limit is None else self.limit + (self.offset or 0)
+            )
+
+    @property
+    def concatenates(self) -> bool:
+        return (
+            self.combiners is None
+            and not self.order_by
+            and self.limit is None
+            and self.offset is None
+        )
+
+    def __call__(self, results: Sequence[Result]) -> Result:
+        frozen = [result.freeze() for result in results]
+        if self.combiners is not None:
+            # Ungrouped aggregates return one row per shard.
+            values = [frozen_result.rewrite_rows()[0] for frozen_result in frozen]
+            row: Any = [
+                combine([shard_row[index] for shard_row in values])
+                for index, combine in enumerate(self.combiners)
+            ]
+            return frozen[0].with_new_rows([row])()  # type: ignore[no-any-return]
+
+        rows: List[Any] = [
+            row for frozen_result in frozen for row in frozen_result.rewrite_rows()
+        ]
+        if frozen[0]._attributes.get("filtered"):  # type: ignore[attr-defined]
+            # Joined eager loaded collections return a row per related row.
+            rows = list({tuple(map(id, row)): row for row in rows}.values())
+        for key, descending, nulls_first in reversed(self.order_by):
+            missing = [row for row in rows if key(row) is None]
+            rows = sorted(
+                (row for row in rows if key(row) is not None),
+                key=key,
+                reverse=descending,
+            )
+            rows = missing + rows if nulls_first else rows + missing
+        start = self.offset or 0
+        stop = None if self.limit is None else start + self.limit
+        return frozen[0].with_new_rows(rows[start:stop])()  # type: ignore[no-any-return]
+
+
+class ShardedSession(Session, _ShardedSession):  # type: ignore[misc]
+    """Session spreading the rows of each model over several databases.
+
+    Instances are routed to the shard returned by the shard function of their
+    model, ``hash_shard`` unless set in ``shard_functions``, called with their
+    primary key values, which must be set before flushing. ``get`` and
+    ``get_many`` query the shard of each key only. Other statements run on
+    every shard, concurrently with up to ``max_workers`` threads, and their
+    rows are merged: ``count``, ``sum``, ``min`` and ``max`` aggregates are
+    combined, ORDER BY is re-applied in Python to the selected values and
+    LIMIT/OFFSET to the sorted rows. Statements whose results cannot be merged
+    this way, e.g. with GROUP BY or DISTINCT, raise
+    :class:`~sqlalchemy.exc.InvalidRequestError` unless run within
+    :meth:`shard`. SQLite engines used concurrently need
+    ``connect_args={"check_same_thread": False}``.
+    """
+
+    def __init__(
+        self,
+        shards: Mapping[str, Engine],
+        *,
+        shard_functions: Optional[Mapping[type, ShardFunction]] = None,
+        max_workers: Optional[int] = None,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(
+            shard_chooser=self._shard_chooser,
+            id_chooser=self._id_chooser,
+            execute_chooser=self._execute_chooser,
+            shards=shards,
+            **kwargs,
+        )
+        event.remove(self, "do_orm_execute", execute_and_instances)
+        event.listen(self, "do_orm_execute", self._execute_and_instances, retval=True)
+        self.shard_ids: List[str] = list(shards)
+        self.shard_functions: Dict[type, ShardFunction] = dict(shard_functions or {})
+        self.max_workers = len(self.shard_ids) if max_workers is None else max_workers
+        self._pinned_shard: Optional[str] = None
+
+    def shard_for(self, model: type, identity: Tuple[Any, ...]) -> str:
+        """Return the shard holding the row of ``model`` with this primary key."""
+        function = self.shard_functions.get(model, hash_shard)
+        return function(identity, self.shard_ids)
+
+    @contextmanager
+    def shard(self, shard_id: str) -> Iterator[None]:
+        """Run every statement executed within the block on ``shard_id`` only."""
+        previous, self._pinned_shard = self._pinned_shard, shard_id
+        try:
+            yield
+        finally:
+            self._pinned_shard = previous
+
+    def _shard_chooser(
+        self, mapper: Any, instance: Any, clause: Any = None, **kw: Any
+    ) -> str:
+        if instance is None:
+            # Only used to find a bind, e.g. for its dialect.
+            return self._pinned_shard or self.shard_ids[0]
+        identity = tuple(mapper.primary_key_from_instance(instance))
+        if None in identity:
+            raise InvalidRequestError(
+                f"{instance!r} needs its primary key set to be routed to a shard"
+            )
+        return self.shard_for(mapper.class_, identity)
+
+    def _id_chooser(self, query: Any, identity: Sequence[Any]) -> List[str]:
+        model = query.column_descriptions[0]["entity"]
+        return [self.shard_for(model, tuple(identity))]
+
+    def _execute_chooser(self, orm_context: ORMExecuteState) -> List[str]:
+        if self._pinned_shard is not None:
+            return [self._pinned_shard]
+        if orm_context.is_insert:
+            raise InvalidRequestError(
+                "Insert statements must run on a single shard, use "
+                "bulk_insert or execute them within session.shard()"
+            )
+        return self.shard_ids
+
+    def _execute_and_instances(self, orm_context: ORMExecuteState) -> Any:
+        bind_arguments = orm_context.bind_arguments
+        if orm_context.is_select:
+            active_options: Any = orm_context.load_options
+        elif orm_context.is_update or orm_context.is_delete:
+            active_options = orm_context.update_delete_options
+        else:
+            active_options = None
+        shard_ids = self._execute_chooser(orm_context)
+        if (
+            "shard_id" in bind_arguments
+            or "_sa_shard_id" in orm_context.execution_options
+            or getattr(active_options, "_refresh_identity_token", None) is not None
+            or len(shard_ids) == 1
+        ):
+            return execute_and_instances(orm_context)
+
+        shard_bind_arguments = [
+            {**bind_arguments, "shard_id": shard_id} for shard_id in shard_ids
+        ]
+        connections = [
+            self.connection(bind_arguments=arguments)
+            for arguments in shard_bind_arguments
+        ]
+        statement: Any = orm_context.statement
+        merge = None
+        if orm_context.is_select:
+            merge = _Merge(statement, connections[0].dialect.name in _NULLS_LARGEST)
+            statement = merge.statement
+        params = orm_context.parameters or {}
+        shard_options = [
+            _shard_options(orm_context, shard_id) for shard_id in shard_ids
+        ]
+
+        # Worker threads only run the statement on the connection of their
+        # shard, rows are turned into instances by the calling thread.
+        def run(index: int) -> Any:
+            connection: Any = connections[index]
+            return connection._execute_20(statement, params, shard_options[index])
+
+        start = perf_counter()
+        if self.max_workers > 1:
+            with ThreadPoolExecutor(min(self.max_workers, len(shard_ids))) as executor:
+                cursors = list(executor.map(run, range(len(shard_ids))))
+        else:
+            cursors = [run(index) for index in range(len(shard_ids))]
+        stats = orm_context.execution_options.get(_STATS_OPTION)
+        if stats is not None:
+            stats.execute_time += perf_counter() - start
+            stats.fingerprint = stats.fingerprint or cursors[0].context.statement
+
+        compile_state_cls = orm_context._compile_state_cls  # type: ignore[attr-defined]
+        results = [
+            cursor
+            if compile_state_cls is None
+            else compile_state_cls.orm_setup_cursor_result(
+                self, statement, params, options, arguments, cursor
+            )
+            for cursor, options, arguments in zip(
+                cursors, shard_options, shard_bind_arguments
+            )
+        ]
+        if merge is None or merge.concatenates:
+            return results[0].merge(*results[1:])
+        return merge(results)
+
+    def get(  # type: ignore[override]
+        self, entity: Type[_TModel], ident: Any, **kw: Any
+    ) -> Optional[_TModel]:
+        _configure((entity,))
+        if "identity_token" not in kw:
+            identity = tuple(ident) if isinstance(ident, (tuple, list)) else (ident,)
+            kw["identity_token"] = self.shard_for(entity, identity)
+        return super().get(entity, ident, **kw)
+
+    def _get_many(
+        self,
+        mapper: Any,
+        keys: Iterable[Tuple[Any, ...]],
+        identity_token: Any = None,
+        execution_options: Mapping[str, Any] = util.EMPTY_DICT,
+    ) -> Dict[Tuple[Any, ...], Any]:
+        if identity_token is not None:
+            return super()._get_many(mapper, keys, identity_token, execution_options)
+        shards: Dict[str, List[Tuple[Any, ...]]] = {}
+        for key in keys:
+            shards.setdefault(self.shard_for(mapper.class_, key), []).append(key)
+        found: Dict[Tuple[Any, ...], Any] = {}
+        for shard_id, shard_keys in shards.items():
+            found.update(
+                super()._get_many(
+                    mapper, shard_keys, shard_id, {"_sa_shard_id": shard_id}
+                )
+            )
+        return found
+
+    def bulk_insert(  # type: ignore[override]
+        self,
+        model: Type[_TModel],
+        rows: Iterable[Union[_TModel, Mapping[str, Any]]],
+        **kwargs: Any,
+    ) -> Optional[List[Tuple[Any, ...]]]:
+        """Insert rows like :meth:`Session.bulk_insert`, grouped by shard.
+
+        Rows are held in memory to be grouped, primary keys are returned shard
+        by shard.
+        """
+        _configure((model,))
+        table = model.__table__  # type: ignore[attr-defined]
+        keys = [column.key for column in table.primary_key.columns]
+        shards: Dict[str, List[Mapping[str, Any]]] = {}
+        for row in rows:
+            params = _to_params(table, row)
+            identity = tuple(params[key] for key in keys)
+            shards.setdefault(self.shard_for(model, identity), []).append(params)
+
+        primary_keys: List[Tuple[Any, ...]] = []
+        for shard_id, shard_rows in shards.items():
+            with self.shard(shard_id):
+                primary_keys.extend(
+                    super().bulk_insert(model, shard_rows, **kwargs) or ()
+                )
+        return primary_keys if kwargs.get("return_primary_keys") else None
+
+
+def _shard_options(orm_context: ORMExecuteState, shard_id: str) -> Dict[str, Any]:
+    # Same as the per shard execution of execute_and_instances. Query stats
+    # are timed around all shards rather than by cursor events of each thread.
+    execution_options = dict(orm_context.local_execution_options)
+    execution_options.pop(_STATS_OPTION, None)
+    if orm_context.is_select:
+        execution_options["_sa_orm_load_options"] = orm_context.load_options + {
+            "_refresh_identity_token": shard_id
+        }
+    elif orm_context.is_update or orm_context.is_delete:
+        execution_options[
+            "_sa_orm_update_options"
+        ] = orm_context.update_delete_options + {"_refresh_identity_token": shard_id}
+    return execution_options
@@ -0,0 +1,303 @@
+import logging
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Protocol,
+    Sequence,
+    Tuple,
+    Type,
+)
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.engine import Result as _Result
+
+_STATS_OPTION = "_db_model_query_stats"
+
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+
+
+@dataclass
+class QueryStats:
+    """Timings in seconds and row count of a single ``Session.execute``.
+
+    ``compile_time`` covers everything before the cursor executes, including
+    compilation when the statement misses the compiled cache. ``hydration_time``
+    covers fetching rows from the cursor and building instances from them.
+    """
+
+    fingerprint: str = ""
+    models: Tuple[str, ...] = ()
+    compile_time: float = 0.0
+    execute_time: float = 0.0
+    hydration_time: float = 0.0
+    rows: int = 0
+    _cursor_start: float = field(default=0.0, repr=False, compare=False)
+
+    @property
+    def total(self) -> float:
+        return self.compile_time + self.execute_time + self.hydration_time
+
+
+class QueryCollector(Protocol):
+    def record(self, stats: QueryStats) -> None:
+        ...
+
+
+class Histogram:
+    """Cumulative histogram with Prometheus style ``le`` buckets."""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> Dict[float, int]:
+        """Return the number of observations less than or equal to each bucket."""
+        totals: Dict[float, int] = {}
+        total = 0
+        for bucket, count in zip((*self.buckets, float("inf")), self.counts):
+            total += count
+            totals[bucket] = total
+        return totals
+
+
+class InMemoryCollector:
+    """Keep every recorded query, e.g. to assert query budgets in tests."""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        self.queries: List[QueryStats] = []
+        self.histogram = Histogram(buckets)
+
+    def record(self, stats: QueryStats) -> None:
+        self.queries.append(stats)
+        self.histogram.observe(stats.total)
+
+    @property
+    def count(self) -> int:
+        return len(self.queries)
+
+    @property
+    def rows(self) -> int:
+        return sum(stats.rows for stats in self.queries)
+
+    @property
+    def total_time(self) -> float:
+        return sum(stats.total for stats in self.queries)
+
+    def by_fingerprint(self) -> Dict[str, List[QueryStats]]:
+        queries: Dict[str, List[QueryStats]] = {}
+        for stats in self.queries:
+            queries.setdefault(stats.fingerprint, []).append(stats)
+        return queries
+
+
+class LoggingCollector:
+    """Log queries taking at least ``min_duration`` seconds."""
+
+    def __init__(
+        self,
+        logger: logging.Logger = logging.getLogger("db_model.queries"),
+        level: int = logging.INFO,
+        min_duration: float = 0.0,
+    ) -> None:
+        self.logger = logger
+        self.level = level
+        self.min_duration = min_duration
+
+    def record(self, stats: QueryStats) -> None:
+        if stats.total < self.min_duration:
+            return
+        self.logger.log(
+            self.level,
+            "%d rows of %s in %.2fms (compile %.2fms, execute %.2fms, hydrate %.2fms): %s",
+            stats.rows,
+            ", ".join(stats.models) or "-",
+            stats.total * 1000,
+            stats.compile_time * 1000,
+            stats.execute_time * 1000,
+            stats.hydration_time * 1000,
+            stats.fingerprint,
+        )
+
+
+class PrometheusCollector:
+    """Aggregate queries per model for the Prometheus text exposition format."""
+
+    _PHASES = ("compile", "execute", "hydration")
+
+    def __init__(
+        self, prefix: str = "db_model_query", buckets: Sequence[float] = DEFAULT_BUCKETS
+    ) -> None:
+        self.prefix = prefix
+        self.buckets = buckets
+        self.durations: Dict[Tuple[str, str], Histogram] = {}
+        self.rows: Dict[str, int] = {}
+
+    def record(self, stats: QueryStats) -> None:
+        models = ",".join(stats.models)
+        for phase in self._PHASES:
+            histogram = self.durations.get((models, phase))
+            if histogram is None:
+                histogram = self.durations[models, phase] = Histogram(self.buckets)
+            histogram.observe(getattr(stats, f"{phase}_time"))
+        self.rows[models] = self.rows.get(models, 0) + stats.rows
+
+    def render(self) -> str:
+        duration = f"{self.prefix}_duration_seconds"
+        rows = f"{self.prefix}_rows_total"
+        lines = [
+            f"# HELP {duration} Time spent per query phase.",
+            f"# TYPE {duration} histogram",
+        ]
+        for (models, phase), histogram in sorted(self.durations.items()):
+            labels = f'models="{models}",phase="{phase}"'
+            for bucket, count in histogram.cumulative().items():
+                le = "+Inf" if bucket == float("inf") else repr(bucket)
+                lines.append(f'{duration}_bucket{{{labels},le="{le}"}} {count}')
+            lines.append(f"{duration}_sum{{{labels}}} {histogram.sum}")
+            lines.append(f"{duration}_count{{{labels}}} {histogram.count}")
+        lines.append(f"# HELP {rows} Rows fetched by queries.")
+        lines.append(f"# TYPE {rows} counter")
+        for models, count in sorted(self.rows.items()):
+            lines.append(f'{rows}{{models="{models}"}} {count}')
+        return "\n".join(lines) + "\n"
+
+
+def _before_cursor_execute(
+    conn: Any,
+    cursor: Any,
+    statement: str,
+    parameters: Any,
+    context: Any,
+    executemany: bool,
+) -> None:
+    stats = context.execution_options.get(_STATS_OPTION) if context else None
+    if stats is not None:
+        stats._cursor_start = perf_counter()
+        if not stats.fingerprint:
+            stats.fingerprint = statement
+
+
+def _after_cursor_execute(
+    conn: Any,
+    cursor: Any,
+    statement: str,
+    parameters: Any,
+    context: Any,
+    executemany: bool,
+) -> None:
+    stats = context.execution_options.get(_STATS_OPTION) if context else None
+    if stats is not None:
+        stats.execute_time += perf_counter() - stats._cursor_start
+
+
+def tracking_options(stats: QueryStats) -> Dict[str, Any]:
+    """Execution options making cursor events report into ``stats``."""
+    if not event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+    return {_STATS_OPTION: stats}
+
+
+_NO_ROW = object()
+
+
+class _TrackedResult(_Result):
+    _query_stats: QueryStats
+    _query_collectors: Sequence[QueryCollector]
+    _query_recorded = False
+    _query_fetching = False
+    _query_closed = False
+
+    def _record_query(self) -> None:
+        if not self._query_recorded:
+            self._query_recorded = True
+            for collector in self._query_collectors:
+                collector.record(self._query_stats)
+
+    def _timed_fetch(self, fetch: Callable[..., Any], *args: Any) -> Any:
+        # Results soft close themselves once exhausted, recording is deferred
+        # until the rows of the fetch that exhausted them are counted.
+        self._query_fetching = True
+        start = perf_counter()
+        try:
+            return fetch(*args)
+        finally:
+            self._query_stats.hydration_time += perf_counter() - start
+            self._query_fetching = False
+
+    def _fetchiter_impl(self) -> Iterator[Any]:
+        iterator = super()._fetchiter_impl()  # type: ignore[misc]
+        while True:
+            row = self._timed_fetch(next, iterator, _NO_ROW)
+            if row is _NO_ROW:
+                self._record_query()
+                return
+            self._query_stats.rows += 1
+            yield row
+
+    def _fetchone_impl(self, hard_close: bool = False) -> Any:
+        row = self._timed_fetch(super()._fetchone_impl, hard_close)  # type: ignore[misc]
+        if row is None:
+            self._record_query()
+        else:
+            self._query_stats.rows += 1
+        return row
+
+    def _fetchmany_impl(self, size: Optional[int] = None) -> List[Any]:
+        rows = self._timed_fetch(super()._fetchmany_impl, size)  # type: ignore[misc]
+        self._query_stats.rows += len(rows)
+        if not rows or self._query_closed:
+            self._record_query()
+        return rows
+
+    def _fetchall_impl(self) -> List[Any]:
+        rows = self._timed_fetch(super()._fetchall_impl)  # type: ignore[misc]
+        self._query_stats.rows += len(rows)
+        self._record_query()
+        return rows
+
+    def _soft_close(self, hard: bool = False, **kw: Any) -> None:
+        super()._soft_close(hard=hard, **kw)  # type: ignore[misc]
+        self._query_closed = True
+        if not self._query_fetching:
+            self._record_query()
+
+
+_TRACKED_RESULT_CLASSES: Dict[Type[_Result], Type[_Result]] = {}
+
+
+def track_result(
+    result: _Result, stats: QueryStats, collectors: Sequence[QueryCollector]
+) -> _Result:
+    """Rebind ``result`` in place so fetching rows is recorded in ``stats``.
+
+    The collectors are called once the result is exhausted or closed.
+    """
+    cls = type(result)
+    tracked_cls = _TRACKED_RESULT_CLASSES.get(cls)
+    if tracked_cls is None:
+        tracked_cls = _TRACKED_RESULT_CLASSES[cls] = type(
+            cls.__name__, (_TrackedResult, cls), {}
+        )
+    result.__class__ = tracked_cls
+    tracked: Any = result
+    tracked._query_stats = stats
+    tracked._query_collectors = collectors
+    if not getattr(result, "returns_rows", True):
+        tracked._record_query()
+    return result
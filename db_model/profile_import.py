@@ -0,0 +1,59 @@
+"""Report the slowest models registered while importing modules.
+
+Usage::
+
+    python -m db_model.profile_import mypkg.models [more.modules ...] [--limit N]
+"""
+import argparse
+from importlib import import_module
+from operator import attrgetter
+from time import perf_counter
+from typing import List, Optional, Sequence
+
+from db_model.core import RegistrationStats, get_registration_stats
+
+_PHASES = ("transform", "resolve", "columns", "map")
+
+
+def format_stats(stats: Sequence[RegistrationStats], limit: Optional[int]) -> List[str]:
+    slowest = sorted(stats, key=attrgetter("total"), reverse=True)[:limit]
+    lines = [
+        f"{'model':<60} {'total':>9} " + " ".join(f"{phase:>9}" for phase in _PHASES)
+    ]
+    for stat in slowest:
+        name = f"{stat.model.__module__}.{stat.model.__qualname__}"
+        timings = [stat.total, *(getattr(stat, phase) for phase in _PHASES)]
+        lines.append(
+            f"{name:<60} " + " ".join(f"{timing * 1000:>7.2f}ms" for timing in timings)
+        )
+    return lines
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m db_model.profile_import",
+        description="Import modules and report the slowest registered models.",
+    )
+    parser.add_argument("modules", nargs="+", help="modules to import")
+    parser.add_argument(
+        "-n", "--limit", type=int, default=20, help="number of models to show"
+    )
+    args = parser.parse_args(argv)
+
+    registered = len(get_registration_stats())
+    start = perf_counter()
+    for module in args.modules:
+        import_module(module)
+    elapsed = perf_counter() - start
+
+    stats = get_registration_stats()[registered:]
+    print("\n".join(format_stats(stats, args.limit)))
+    print(
+        f"\n{len(stats)} models registered in "
+        f"{sum(stat.total for stat in stats) * 1000:.2f}ms "
+        f"of {elapsed * 1000:.2f}ms spent importing"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,5 @@
 from dataclasses import MISSING, Field
-from typing import Any, Dict, TypeVar
+from typing import Any, Dict, Optional, TypeVar
 
 from sqlalchemy.orm import RelationshipProperty
 from sqlalchemy.orm import relationship as _relationship
@@ -36,8 +36,12 @@ class RelationshipInfo(Field[T]):
         self.args = args
         self.kwargs = kwargs
 
-    def __getrelationship__(self) -> RelationshipProperty:
-        return _relationship(*self.args, **self.kwargs)
+    def __getrelationship__(self, lazy: Optional[str] = None) -> RelationshipProperty:
+        """Build the relationship, loaded with ``lazy`` unless it sets its own."""
+        kwargs = self.kwargs
+        if lazy is not None and "lazy" not in kwargs:
+            kwargs = {**kwargs, "lazy": lazy}
+        return _relationship(*self.args, **kwargs)
 
 
 @copy_t(_relationship)
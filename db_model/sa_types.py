@@ -1,43 +1,259 @@
 import uuid
-from typing import Any
+from datetime import datetime, timedelta, timezone
+from enum import Enum, IntFlag
+from typing import Any, Callable, Optional, Type
 
+from sqlalchemy import (
+    BigInteger,
+    Column,
+    Integer,
+    LargeBinary,
+    SmallInteger,
+    String,
+    bindparam,
+    func,
+    select,
+    type_coerce,
+    update,
+)
 from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.engine import Connection
 from sqlalchemy.engine.interfaces import Dialect
-from sqlalchemy.types import CHAR, TypeDecorator
+from sqlalchemy.types import BINARY, CHAR, TypeDecorator
 
+_Processor = Callable[[Any], Any]
 
-class GUID(TypeDecorator):  # pragma: no cover
+
+def _to_hex(value: Any) -> Optional[str]:
+    if value is None:
+        return None
+    elif not isinstance(value, uuid.UUID):
+        value = uuid.UUID(value)
+    return value.hex
+
+
+def _to_bytes(value: Any) -> Optional[bytes]:
+    if value is None:
+        return None
+    elif not isinstance(value, uuid.UUID):
+        value = uuid.UUID(value)
+    return value.bytes
+
+
+def _to_str(value: Any) -> Optional[str]:
+    if value is None:
+        return None
+    return str(value)
+
+
+def _from_str(value: Any) -> Optional[uuid.UUID]:
+    if value is None or isinstance(value, uuid.UUID):
+        return value
+    return uuid.UUID(value)
+
+
+def _from_bytes(value: Any) -> Optional[uuid.UUID]:
+    if value is None:
+        return None
+    return uuid.UUID(bytes=bytes(value))
+
+
+class GUID(TypeDecorator):
     """Platform-independent GUID type.
 
     Uses PostgreSQL's UUID type, otherwise uses
-    CHAR(32), storing as stringified hex values.
+    CHAR(32), storing as stringified hex values,
+    or BINARY(16), storing the raw bytes, if ``binary`` is set.
     """
 
     impl = CHAR
     cache_ok = True
 
+    def __init__(self, binary: bool = False) -> None:
+        super().__init__()
+        self.binary = binary
+
+    @property
+    def python_type(self) -> type:
+        return uuid.UUID
+
     def load_dialect_impl(self, dialect: Dialect):
         if dialect.name == "postgresql":
             return dialect.type_descriptor(UUID())  # type: ignore[arg-type]
+        elif self.binary:
+            return dialect.type_descriptor(BINARY(16))  # type: ignore[arg-type]
         else:
             return dialect.type_descriptor(CHAR(32))  # type: ignore[arg-type]
 
-    def process_bind_param(self, value: Any, dialect: Dialect) -> Any:
-        if value is None:
-            return value
-        elif dialect.name == "postgresql":
-            return str(value)
+    def _bind_converter(self, dialect: Dialect) -> _Processor:
+        if dialect.name == "postgresql":
+            return _to_str
+        elif self.binary:
+            return _to_bytes
         else:
-            if not isinstance(value, uuid.UUID):
-                return "%.32x" % uuid.UUID(value).int
-            else:
-                # hexstring
-                return "%.32x" % value.int
+            return _to_hex
+
+    def _result_converter(self, dialect: Dialect) -> _Processor:
+        if dialect.name != "postgresql" and self.binary:
+            return _from_bytes
+        return _from_str
+
+    def process_bind_param(self, value: Any, dialect: Dialect) -> Any:
+        return self._bind_converter(dialect)(value)
 
     def process_result_value(self, value: Any, dialect: Dialect) -> Any:
+        return self._result_converter(dialect)(value)
+
+    # The processors are resolved once per dialect so that converting each
+    # value skips the dialect dispatch of process_bind_param/process_result_value.
+
+    def bind_processor(self, dialect: Dialect) -> Any:
+        convert = self._bind_converter(dialect)
+        impl_processor = self.impl.bind_processor(dialect)  # type: ignore
+        if impl_processor is None:
+            return convert
+
+        def process(value: Any) -> Any:
+            return impl_processor(convert(value))  # type: ignore[misc]
+
+        return process
+
+    def result_processor(self, dialect: Dialect, coltype: Any) -> Any:
+        convert = self._result_converter(dialect)
+        impl_processor = self.impl.result_processor(dialect, coltype)  # type: ignore
+        if impl_processor is None:
+            return convert
+
+        def process(value: Any) -> Any:
+            return convert(impl_processor(value))  # type: ignore[misc]
+
+        return process
+
+
+class BinaryGUID(GUID):
+    """:class:`GUID` stored as BINARY(16) outside of PostgreSQL.
+
+    Register it with ``register_type(uuid.UUID, BinaryGUID)``.
+    """
+
+    cache_ok = True
+
+    def __init__(self) -> None:
+        super().__init__(binary=True)
+
+
+def _integer_type(low: int, high: int) -> Type[Integer]:
+    for type_, bits in ((SmallInteger, 16), (Integer, 32)):
+        if -(2 ** (bits - 1)) <= low and high < 2 ** (bits - 1):
+            return type_
+    return BigInteger
+
+
+class IntEnumType(TypeDecorator):
+    """Integer enums, including ``IntFlag``, stored as integer values.
+
+    The column is a SMALLINT, INTEGER or BIGINT, the smallest fitting every
+    value of the enum, or every combination of the flags of an ``IntFlag``.
+    """
+
+    impl = SmallInteger
+    cache_ok = True
+
+    def __init__(self, enum_class: Type[Enum]) -> None:
+        super().__init__()
+        self.enum_class = enum_class
+        values = [int(member.value) for member in enum_class] or [0]
+        if issubclass(enum_class, IntFlag):
+            combined = 0
+            for value in values:
+                combined |= value
+            values.append(combined)
+        self._integer_type = _integer_type(min(values), max(values))
+
+    @property
+    def python_type(self) -> type:
+        return self.enum_class
+
+    def load_dialect_impl(self, dialect: Dialect):
+        return dialect.type_descriptor(self._integer_type())  # type: ignore[arg-type]
+
+    def process_bind_param(self, value: Any, dialect: Dialect) -> Any:
+        return None if value is None else int(value)
+
+    def process_result_value(self, value: Any, dialect: Dialect) -> Any:
+        return None if value is None else self.enum_class(value)
+
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+class EpochDateTime(TypeDecorator):
+    """Datetime stored as a BIGINT of microseconds since the Unix epoch.
+
+    Naive values are taken as UTC, aware values are converted to UTC, and
+    values are loaded as naive UTC datetimes. Register it with
+    ``register_type(datetime, EpochDateTime)``.
+    """
+
+    impl = BigInteger
+    cache_ok = True
+
+    @property
+    def python_type(self) -> type:
+        return datetime
+
+    def process_bind_param(self, value: Any, dialect: Dialect) -> Any:
         if value is None:
-            return value
-        else:
-            if not isinstance(value, uuid.UUID):
-                value = uuid.UUID(value)
-            return value
+            return None
+        if value.tzinfo is not None:
+            value = value.astimezone(timezone.utc).replace(tzinfo=None)
+        return (value - _EPOCH) // _MICROSECOND
+
+    def process_result_value(self, value: Any, dialect: Dialect) -> Any:
+        return None if value is None else _EPOCH + value * _MICROSECOND
+
+
+def migrate_guid_to_binary(
+    connection: Connection,
+    column: Column,
+    batch_size: int = 1000,
+) -> int:
+    """Rewrite CHAR(32) hex values of a GUID column as 16 byte binary values.
+
+    Only the stored values are rewritten. Changing the declared column type,
+    where the database requires it, is left to the schema migration.
+    Returns the number of rows updated.
+
+    Only SQLite is supported, as it is the only dialect storing both forms in
+    the same column. Elsewhere ``NotImplementedError`` is raised and the
+    values are converted while the column type is changed, e.g. with
+    ``decode(value, 'hex')`` in ``ALTER COLUMN ... USING`` on PostgreSQL.
+    """
+    if connection.dialect.name != "sqlite":
+        raise NotImplementedError(
+            f"migrate_guid_to_binary is not supported on {connection.dialect.name}"
+        )
+    table = column.table
+    raw_column = column.key
+    hex_values = (
+        select(type_coerce(column, String))
+        .where(func.length(column) == 32)
+        .limit(batch_size)
+    )
+    statement = (
+        update(table)
+        .where(column == bindparam("_old", type_=String))
+        .values({raw_column: bindparam("_new", type_=LargeBinary)})
+    )
+
+    total = 0
+    while values := connection.execute(hex_values).scalars().all():
+        result = connection.execute(
+            statement,
+            [{"_old": value, "_new": uuid.UUID(value).bytes} for value in values],
+        )
+        if not result.rowcount:
+            break
+        total += result.rowcount
+    return total
@@ -1,15 +1,138 @@
-from typing import Any, Generic, TypeVar, overload
-
+from operator import itemgetter
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Generic,
+    Iterator,
+    List,
+    TypeVar,
+    overload,
+)
+
+from sqlalchemy import bindparam, literal, tuple_
+from sqlalchemy.exc import ArgumentError
 from sqlalchemy.sql import Select as _Select
-from sqlalchemy.sql.elements import ColumnClause
+from sqlalchemy.sql.elements import BindParameter, ColumnClause
 from sqlalchemy.types import TypeEngine
 
+from db_model.core import _configure
+from db_model.engine.result import Result, ScalarResult
+
+if TYPE_CHECKING:
+    from db_model.orm.session import Session
+
 Ts = TypeVar("Ts", bound=tuple)
+_T = TypeVar("_T")
+
+
+def _key_getter(statement: _Select, key: Any) -> Callable[[Any], Any]:
+    for index, description in enumerate(statement.column_descriptions):
+        entity = description.get("entity")
+        if description["expr"] is key:
+            return itemgetter(index)
+        elif (
+            entity is not None
+            and description["expr"] is entity
+            and getattr(key, "class_", None) is entity
+        ):
+            name = key.key
+            return lambda row: getattr(row[index], name)
+    raise ArgumentError(f"Pagination key {key} is not part of the selected columns")
+
+
+def _typed_value(key: Any, value: Any) -> Any:
+    # Values inside tuple_() are not coerced to the type of the column they are
+    # compared with, so types such as GUID need to be bound explicitly.
+    return value if isinstance(value, BindParameter) else literal(value, key.type)
 
 
 class Select(_Select, Generic[Ts]):
     inherit_cache = True
 
+    def _keyset(self, key: Any) -> List[Any]:
+        if key is None:
+            entity = self.column_descriptions[0].get("entity")
+            if entity is None:
+                raise ArgumentError(
+                    "A pagination key is required unless a model is selected"
+                )
+            return [
+                getattr(entity, column.key) for column in entity.__table__.primary_key
+            ]
+        return list(key) if isinstance(key, (tuple, list)) else [key]
+
+    def paginate(
+        self, key: Any = None, page_size: int = 100, after: Any = None
+    ) -> "Select[Ts]":
+        """Return the ``page_size`` rows following ``after`` in ``key`` order.
+
+        ``key`` is a column, a tuple of columns or, by default, the primary key
+        of the first selected model. ``after`` is the key of the last row of
+        the previous page, a tuple for composite keys, or ``None`` for the first
+        page. Pages are found by seeking ``key`` instead of counting an OFFSET.
+        """
+        keys = self._keyset(key)
+        statement = self.order_by(None).order_by(*keys).limit(page_size)
+        if after is None:
+            return statement  # type: ignore[return-value]
+        after = after if isinstance(after, tuple) else (after,)
+        if len(keys) == 1:
+            return statement.where(keys[0] > after[0])  # type: ignore[return-value]
+        after = tuple(_typed_value(key, value) for key, value in zip(keys, after))
+        return statement.where(tuple_(*keys) > tuple_(*after))  # type: ignore[return-value]
+
+    def iter_pages(
+        self, session: "Session", key: Any = None, page_size: int = 100
+    ) -> Iterator[List[Ts]]:
+        """Walk every row of the statement by keyset, yielding one page of rows at a time."""
+        keys = self._keyset(key)
+        getters = [_key_getter(self, key) for key in keys]
+        last_key: tuple = tuple(
+            bindparam(f"_after_{i}", type_=key.type) for i, key in enumerate(keys)
+        )
+        first_page = self.paginate(keys, page_size)
+        next_page = self.paginate(keys, page_size, last_key).prepare()
+
+        page = session.execute(first_page).all()
+        while page:
+            yield page
+            if len(page) < page_size:
+                return
+            params = {
+                f"_after_{i}": getter(page[-1]) for i, getter in enumerate(getters)
+            }
+            page = next_page(session, **params).all()
+
+    def prepare(self) -> "PreparedSelect[Ts]":
+        """Build the statement once, to be executed with new bind parameter values.
+
+        Use ``bindparam("name")`` for the values that change between executions.
+        """
+        return PreparedSelect(self)
+
+
+class PreparedSelect(Generic[Ts]):
+    """A select executed as ``prepared(session, **params)``.
+
+    The statement and its cache key are only generated once, the compiled form
+    is then found in the engine's compiled cache on every execution.
+    """
+
+    __slots__ = ("statement",)
+
+    def __init__(self, statement: Select[Ts]) -> None:
+        statement._generate_cache_key()  # type: ignore[attr-defined]
+        self.statement = statement
+
+    def __call__(self, session: "Session", **params: Any) -> Result[Ts]:
+        return session.execute(self.statement, params=params)
+
+    def scalars(
+        self: "PreparedSelect[tuple[_T]]", session: "Session", **params: Any
+    ) -> ScalarResult[_T]:
+        return session.execute(self.statement, params=params).scalars()
+
 
 _TVal_0 = TypeVar("_TVal_0")
 _TVal_1 = TypeVar("_TVal_1")
@@ -431,4 +554,5 @@ def select(
 
 
 def select(*entities: Any, **kw: Any) -> Select:  # type: ignore
+    _configure(entities)
     return Select._create(*entities, **kw)  # type: ignore[return-value]
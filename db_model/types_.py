@@ -1,12 +1,37 @@
+import enum
 import uuid
 from dataclasses import Field
 from datetime import date, datetime
-from typing import Any, Dict, Tuple, Type, TypeVar, Union
+from decimal import Decimal
+from functools import partial
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
-from sqlalchemy import Column, Date, DateTime, ForeignKey, Integer, String
+from sqlalchemy import (
+    Boolean,
+    Column,
+    Date,
+    DateTime,
+    Enum,
+    Float,
+    ForeignKey,
+    Integer,
+    LargeBinary,
+    Numeric,
+    String,
+)
 from sqlalchemy.types import TypeDecorator, TypeEngine
 
-from db_model.sa_types import GUID
+from db_model.sa_types import GUID, IntEnumType
 from db_model.typing_utils import get_sub_types
 
 _T = TypeVar("_T")
@@ -17,32 +42,88 @@ _COLUMN_TYPE_MAPPING: Dict[Type, Type[Union[TypeDecorator, TypeEngine]]] = {
     date: Date,
     datetime: DateTime,
     uuid.UUID: GUID,
+    bool: Boolean,
+    float: Float,
+    Decimal: Numeric,
+    bytes: LargeBinary,
+    enum.Enum: Enum,
+    enum.IntEnum: IntEnumType,
+    enum.IntFlag: IntEnumType,
 }
 
+_NUMPY_DTYPE_MAPPING: Dict[Type, str] = {
+    int: "int64",
+    date: "datetime64[D]",
+    datetime: "datetime64[us]",
+    uuid.UUID: "V16",
+}
+
+
+class ColumnSpec(NamedTuple):
+    """Column settings resolved from a field annotation."""
+
+    db_type: Callable[[], Union[TypeDecorator, TypeEngine]]
+    nullable: bool
+    annotations: Tuple[Any, ...]
+
 
-def register_type(
-    type_: Type[_T], db_type: Type[TypeDecorator[_T]]
-) -> None:  # pragma: no cover
+_RESOLVED_TYPES: Dict[Any, ColumnSpec] = {}
+
+
+def register_type(type_: Type[_T], db_type: Type[TypeDecorator[_T]]) -> None:
     _COLUMN_TYPE_MAPPING[type_] = db_type
+    _RESOLVED_TYPES.clear()
 
 
-def get_column_type(field: Field[_T]) -> TypeEngine[_T]:
-    sub_types, _ = get_sub_types(field.type)
+def lookup_type(type_: Type) -> Optional[Type[Union[TypeDecorator, TypeEngine]]]:
+    """Return the column type registered for ``type_`` or its closest base class."""
+    bases = getattr(type_, "__mro__", (type_,))
+    if isinstance(type_, type) and issubclass(type_, enum.Enum):
+        # Enums mixing in str or int resolve to their enum base, not the mixin.
+        bases = sorted(bases, key=lambda base: not issubclass(base, enum.Enum))
+    for base in bases:
+        db_type = _COLUMN_TYPE_MAPPING.get(base)
+        if db_type is not None:
+            return db_type
+    return None
+
+
+def _resolve_type(type_: Any) -> ColumnSpec:
+    sub_types, annotations = get_sub_types(type_)
     inner_types = {
         inner_type for inner_type in sub_types if not isinstance(None, inner_type)
     }
     if len(inner_types) != 1:
-        raise RuntimeError(f"Unable to process type {field.type}: {inner_types}")
+        raise RuntimeError(f"Unable to process type {type_}: {inner_types}")
     actual_type = tuple(inner_types)[0]
+    db_type: Any = lookup_type(actual_type)
+    if db_type is None:
+        raise RuntimeError(f"Unable to map type {type_}: {inner_types}")
+    if issubclass(actual_type, enum.Enum) and actual_type not in _COLUMN_TYPE_MAPPING:
+        db_type = partial(db_type, actual_type)
+
+    return ColumnSpec(db_type, type(None) in sub_types, annotations)
+
+
+def resolve_type(type_: Any) -> ColumnSpec:
+    """Resolve an annotation, memoized until the type mapping changes."""
     try:
-        column_type = _COLUMN_TYPE_MAPPING[actual_type]()
+        return _RESOLVED_TYPES[type_]
     except KeyError:
-        raise RuntimeError(f"Unable to map type {field.type}: {inner_types}")
+        spec = _RESOLVED_TYPES[type_] = _resolve_type(type_)
+        return spec
+    except TypeError:
+        # Annotations with unhashable metadata cannot be memoized.
+        return _resolve_type(type_)
 
-    return column_type
+
+def get_column_type(field: Field[_T]) -> TypeEngine[_T]:
+    return resolve_type(field.type).db_type()
 
 
-def get_column(field: Field[_T]) -> Column[TypeEngine[_T]]:
+def get_column(
+    field: Field[_T], spec: Optional[ColumnSpec] = None
+) -> Column[TypeEngine[_T]]:
     args: Tuple[Any, ...] = getattr(field, "sa_args", None) or ()
     foreign_key = getattr(field, "foreign_key", None)
     if foreign_key is not None:
@@ -53,19 +134,24 @@ def get_column(field: Field[_T]) -> Column[TypeEngine[_T]]:
         )
         args += (foreign_key,)
 
-    column_type = get_column_type(field)
-
-    sub_types, annotations = get_sub_types(field.type)
-    is_primary_key = getattr(field, "primary_key", False) or "PrimaryKey" in annotations
+    if spec is None:
+        spec = resolve_type(field.type)
+    is_primary_key = (
+        getattr(field, "primary_key", False) or "PrimaryKey" in spec.annotations
+    )
     kwargs: Dict[str, Union[str, Any]] = {
-        "nullable": type(None) in sub_types,
+        "nullable": spec.nullable,
         "primary_key": is_primary_key,
     }
+    if getattr(field, "index", False) or "Indexed" in spec.annotations:
+        kwargs["index"] = True
+    if getattr(field, "unique", False):
+        kwargs["unique"] = True
     kwargs.update(getattr(field, "sa_kwargs", None) or {})
 
     return Column(
         field.name,
-        column_type,
+        spec.db_type(),
         *args,
         **kwargs,  # type: ignore
     )
@@ -5,6 +5,7 @@ from sqlalchemy import create_engine
 from sqlalchemy.engine import Engine
 
 from db_model import get_metadata, get_registry
+from db_model.core import _pending_models
 from db_model.orm import Session
 
 metadata = get_metadata()
@@ -20,6 +21,7 @@ def fixture_session(engine: Engine) -> Iterator[Session]:
     registry = get_registry()
     registry.dispose()
     metadata.clear()
+    _pending_models.clear()
 
     connection = engine.connect()
     with Session(bind=connection) as session:
@@ -27,3 +29,4 @@ def fixture_session(engine: Engine) -> Iterator[Session]:
 
     registry.dispose()
     metadata.clear()
+    _pending_models.clear()
@@ -0,0 +1,23 @@
+from typing import List, Optional
+
+from sqlalchemy import bindparam, create_engine
+
+from db_model import DBModel, PrimaryKey, get_metadata
+from db_model.orm import Session
+from db_model.sql import select
+
+
+class MyModel(DBModel):
+    id: PrimaryKey[int]
+    name: str
+
+
+by_id = select(MyModel).where(MyModel.id == bindparam("id")).prepare()
+
+engine = create_engine("sqlite:///:memory:", future=True)
+
+get_metadata().create_all(engine)
+
+with Session(bind=engine) as session:
+    rows: List[tuple[MyModel]] = by_id(session, id=1).all()
+    model: Optional[MyModel] = by_id.scalars(session, id=1).first()
@@ -7,6 +7,7 @@ from mypy import api as mypy_api
 CASES = [
     ("input_1.py", "output_1.txt"),
     ("input_2.py", "output_2.txt"),
+    ("input_3.py", "output_3.txt"),
 ]
 
 CONFIG_PATH = "test/mypy/pyproject.toml"
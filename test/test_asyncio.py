@@ -0,0 +1,59 @@
+import asyncio
+from pathlib import Path
+
+import pytest
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from db_model import DBModel, PrimaryKey, col, get_metadata
+from db_model.ext.asyncio import AsyncSession
+from db_model.sql import select
+
+metadata = get_metadata()
+
+
+@pytest.mark.usefixtures("session")
+def test_async_session(tmp_path: Path) -> None:
+    class Author(DBModel):
+        id: PrimaryKey[int]
+        name: str
+
+    async def run() -> None:
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'db.sqlite'}")
+        async with engine.begin() as connection:
+            await connection.run_sync(metadata.create_all)
+
+        async with AsyncSession(engine) as session:
+            session.add_all([Author(id=i, name=f"Name {i}") for i in range(5)])
+            await session.commit()
+
+            author = (
+                await session.scalars(select(Author).where(col(Author.id) == 1))
+            ).one()
+            assert author.name == "Name 1"
+
+            result = await session.execute(select(col(Author.name)).order_by(Author.id))
+            assert result.scalars().all()[:2] == ["Name 0", "Name 1"]
+
+            streamed = await session.stream_scalars(
+                select(Author).order_by(Author.id), batch_size=2
+            )
+            assert [author.id async for author in streamed] == list(range(5))
+            assert len(session.identity_map) == 0
+
+            rows = await session.stream(
+                select(col(Author.id)).where(col(Author.id) > 2)
+            )
+            assert await rows.all() == [(3,), (4,)]
+
+        async def get_name(id: int) -> str:
+            async with AsyncSession(engine) as session:
+                author = await session.get(Author, id)
+                assert author is not None
+                return author.name
+
+        names = await asyncio.gather(*(get_name(i) for i in range(3)))
+        assert names == ["Name 0", "Name 1", "Name 2"]
+
+        await engine.dispose()
+
+    asyncio.run(run())
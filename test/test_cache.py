@@ -0,0 +1,156 @@
+from pathlib import Path
+from typing import List
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import create_engine, event, update
+from sqlalchemy.engine import Engine
+
+from db_model import DBModel, PrimaryKey, col, get_metadata, mapped_column
+from db_model.engine.result import ScalarResult
+from db_model.orm import LRUCache, ResultCache, Session, TTLCache
+from db_model.relationship import relationship
+from db_model.sql import select
+
+metadata = get_metadata()
+
+
+def test_result_cache(engine: Engine, session: Session) -> None:
+    class Author(DBModel):
+        id: PrimaryKey[int]
+        name: str
+
+    metadata.create_all(engine)
+    session.bulk_insert(Author, [{"id": i, "name": f"Name {i}"} for i in range(3)])
+    session.commit()
+
+    statements: List[str] = []
+    event.listen(
+        engine,
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement),
+    )
+
+    cache = ResultCache()
+    with Session(bind=engine, result_cache=cache) as cached:
+        query = select(Author).where(Author.id >= 1).order_by(Author.id)
+        first = cached.scalars(query).all()
+        result = cached.scalars(
+            select(Author).where(Author.id >= 1).order_by(Author.id)
+        )
+        assert isinstance(result, ScalarResult)
+        assert result.all() == first
+        assert [author.name for author in first] == ["Name 1", "Name 2"]
+        assert (cache.hits, cache.misses, len(statements)) == (1, 1, 1)
+
+        cached.scalars(select(Author).where(Author.id >= 2)).all()
+        cached.scalars(query, execution_options={"db_model_no_cache": True}).all()
+        assert (cache.hits, cache.misses, len(statements)) == (1, 2, 3)
+
+        first[0].name = "Changed"
+        cached.flush()
+        # Reads of tables written by the transaction are not cached.
+        assert [author.name for author in cached.scalars(query)] == [
+            "Changed",
+            "Name 2",
+        ]
+        assert (cache.hits, cache.misses) == (1, 2)
+
+        cached.rollback()
+        assert [author.name for author in cached.scalars(query)] == [
+            "Name 1",
+            "Name 2",
+        ]
+        assert cache.misses == 3
+
+        cached.execute(update(Author).values(name="Updated"))
+        cached.commit()
+        assert [author.name for author in cached.scalars(query)] == ["Updated"] * 2
+        assert cache.misses == 4
+
+    with Session(bind=engine, result_cache=cache) as other:
+        assert [author.name for author in other.scalars(query)] == ["Updated"] * 2
+        assert cache.hits == 2
+
+
+def test_result_cache_between_sessions(engine: Engine, session: Session) -> None:
+    class Author(DBModel):
+        id: PrimaryKey[int]
+        name: str
+
+        books: List["Book"] = relationship("Book", uselist=True, lazy="selectin")
+
+    class Book(DBModel):
+        id: PrimaryKey[int]
+        author_id: int = mapped_column(foreign_key=Author.id)
+
+    metadata.create_all(engine)
+    session.bulk_insert(Author, [{"id": i, "name": f"Name {i}"} for i in range(3)])
+    session.bulk_insert(Book, [{"id": i, "author_id": i % 2} for i in range(4)])
+    session.commit()
+
+    cache = ResultCache()
+    query = select(Author).order_by(Author.id)
+    with Session(bind=engine, result_cache=cache, autoflush=False) as first:
+        authors = first.scalars(query).all()
+        authors[0].name = "Dirty"
+        assert first.scalars(query).all() == authors
+        assert authors[0].name == "Dirty"
+
+        statements: List[str] = []
+        event.listen(
+            engine,
+            "before_cursor_execute",
+            lambda conn, cursor, statement, *args: statements.append(statement),
+        )
+        with Session(bind=engine, result_cache=cache, read_only=True) as second:
+            copies = second.scalars(query).all()
+            assert [author.name for author in copies] == [
+                "Name 0",
+                "Name 1",
+                "Name 2",
+            ]
+            assert [len(author.books) for author in copies] == [2, 2, 0]
+            assert (cache.hits, statements) == (2, [])
+            assert copies[0] is not authors[0]
+            assert copies[0] in second and not second.dirty
+
+
+@pytest.mark.usefixtures("session")
+def test_result_cache_after_commit(tmp_path: Path) -> None:
+    class Author(DBModel):
+        id: PrimaryKey[int]
+        name: str
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'cache.db'}", future=True)
+    metadata.create_all(engine)
+    cache = ResultCache()
+    query = select(col(Author.name))
+    with Session(bind=engine, result_cache=cache) as writer:
+        writer.bulk_insert(Author, [{"id": 1, "name": "Old"}])
+        writer.commit()
+
+        writer.execute(update(Author).values(name="New"))
+        with Session(bind=engine, result_cache=cache) as reader:
+            assert reader.scalars(query).all() == ["Old"]
+        writer.commit()
+
+    with Session(bind=engine, result_cache=cache) as reader:
+        assert reader.scalars(query).all() == ["New"]
+
+
+def test_cache_backends() -> None:
+    lru = LRUCache(maxsize=2)
+    lru.set("a", 1)  # type: ignore[arg-type]
+    lru.set("b", 2)  # type: ignore[arg-type]
+    assert lru.get("a") == 1
+    lru.set("c", 3)  # type: ignore[arg-type]
+    assert (lru.get("a"), lru.get("b"), lru.get("c")) == (1, None, 3)
+
+    ttl = TTLCache(ttl=10)
+    with patch("db_model.orm.cache.monotonic", return_value=0):
+        ttl.set("a", 1)  # type: ignore[arg-type]
+    with patch("db_model.orm.cache.monotonic", return_value=5):
+        assert ttl.get("a") == 1
+    with patch("db_model.orm.cache.monotonic", return_value=11):
+        assert ttl.get("a") is None
@@ -0,0 +1,63 @@
+from typing import Optional
+
+from sqlalchemy import Index
+from sqlalchemy.engine import Engine
+
+from db_model import (
+    DBModel,
+    Indexed,
+    PrimaryKey,
+    check_indexes,
+    get_metadata,
+    index,
+    mapped_column,
+)
+from db_model.orm import Session
+from db_model.sql import select
+
+metadata = get_metadata()
+
+
+def test_indexes(engine: Engine, session: Session) -> None:
+    class Author(DBModel):
+        __indexes__ = (
+            index("name", "age"),
+            index("email", unique=True, where="age IS NOT NULL", name="uq_adult_email"),
+            Index("ix_author_city", "city"),
+        )
+
+        id: PrimaryKey[int]
+        name: str
+        age: Optional[int]
+        email: str
+        city: str
+        country: Indexed[str]
+        code: str = mapped_column(unique=True)
+        team: int = mapped_column(index=True)
+
+    table = Author.__table__
+    indexes = {index_.name: index_ for index_ in table.indexes}
+    assert set(indexes) == {
+        "ix_author_name_age",
+        "uq_adult_email",
+        "ix_author_city",
+        "ix_author_country",
+        "ix_author_team",
+    }
+    assert [column.name for column in indexes["ix_author_name_age"].columns] == [
+        "name",
+        "age",
+    ]
+    assert indexes["uq_adult_email"].unique
+    assert (
+        str(indexes["uq_adult_email"].dialect_options["sqlite"]["where"])
+        == "age IS NOT NULL"
+    )
+    assert table.c.code.unique and not table.c.name.index
+
+    metadata.create_all(engine)
+    assert not check_indexes(session, select(Author).where(Author.name == "John"))
+    assert not check_indexes(session, select(Author).where(Author.country == "FR"))
+    assert check_indexes(session, select(Author).where(Author.email == "x")) == [
+        "SCAN author"
+    ]
@@ -0,0 +1,70 @@
+import io
+from datetime import date
+from pathlib import Path
+from typing import List, Optional
+from uuid import UUID, uuid4
+
+import pytest
+from sqlalchemy.engine import Engine
+
+from db_model import DBModel, PrimaryKey, col, get_metadata
+from db_model.ingest import LoadProgress, load
+from db_model.orm import Session
+from db_model.sql import select
+
+metadata = get_metadata()
+
+
+def test_load(engine: Engine, session: Session, tmp_path: Path) -> None:
+    class Author(DBModel):
+        id: PrimaryKey[UUID]
+        name: str
+        age: Optional[int]
+        born: Optional[date]
+
+    metadata.create_all(engine)
+    ids = [uuid4() for _ in range(5)]
+
+    path = tmp_path / "authors.csv"
+    path.write_text(
+        "id,name,age,born,ignored\n"
+        + "".join(
+            f"{id_},Name {i},{i or ''},2000-01-0{i + 1},x\n"
+            for i, id_ in enumerate(ids)
+        )
+    )
+    reports: List[LoadProgress] = []
+    assert load(Author, path, session, batch_size=2, progress=reports.append) == 5
+    assert [report.rows for report in reports] == [2, 4, 5]
+
+    jsonl = io.StringIO(
+        '{"id": "%s", "name": "Json", "age": 7, "born": null}\n\n' % UUID(int=1)
+    )
+    assert load(Author, jsonl, session, format="jsonl", progress=None) == 1
+
+    authors = session.scalars(select(Author).order_by(Author.name)).all()
+    assert [(author.id, author.age, author.born) for author in authors] == [
+        (UUID(int=1), 7, None),
+        (ids[0], None, date(2000, 1, 1)),
+        *((ids[i], i, date(2000, 1, i + 1)) for i in range(1, 5)),
+    ]
+
+    with pytest.raises(ValueError):
+        load(Author, tmp_path / "authors.txt", session)
+    with pytest.raises(ValueError):
+        load(Author, io.StringIO(), session)
+
+
+def test_load_bytes(engine: Engine, session: Session) -> None:
+    class Blob(DBModel):
+        id: PrimaryKey[int]
+        data: Optional[bytes]
+
+    metadata.create_all(engine)
+    csv_file = io.StringIO("id,data\n1,00ff\n2,\n")
+    assert load(Blob, csv_file, session, format="csv", progress=None) == 2
+    jsonl = io.StringIO('{"id": 3, "data": "DEADBEEF"}\n')
+    assert load(Blob, jsonl, session, format="jsonl", progress=None) == 1
+
+    blobs = session.execute(select(col(Blob.id), col(Blob.data)).order_by(Blob.id))
+    assert blobs.all() == [(1, b"\x00\xff"), (2, None), (3, b"\xde\xad\xbe\xef")]
@@ -1,11 +1,13 @@
 import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
+from threading import Barrier
 from typing import List, Optional, Union
 from uuid import UUID, uuid4
 
 import pydantic
 import pytest
-from sqlalchemy import ForeignKeyConstraint, MetaData, Table
+from sqlalchemy import ForeignKeyConstraint, MetaData, Table, text
 from sqlalchemy.engine import Engine
 from sqlalchemy.exc import ArgumentError, IntegrityError
 
@@ -257,3 +259,107 @@ def test_metadata() -> None:
 
     assert len(metadata.tables) == 1
     assert len(other_metadata.tables) == 1
+
+
+def test_lazy_model(engine: Engine, session: Session) -> None:
+    class Author(DBModel, lazy=True):
+        id: PrimaryKey[int]
+        name: str
+
+    class Book(DBModel, lazy=True):
+        id: PrimaryKey[int]
+        name: str
+
+    assert not hasattr(Author, "__table__")
+    assert not hasattr(Book, "__table__")
+
+    author = Author(id=1, name="John")
+    assert isinstance(Author.__table__, Table)
+    assert not hasattr(Book, "__table__")
+
+    metadata.create_all(engine)
+    assert isinstance(Book.__table__, Table)
+    assert set(metadata.tables) == {"author", "book"}
+
+    session.add_all([author, Book(id=1, name="My Book")])
+    assert session.scalars(select(Author)).all() == [author]
+    assert session.get(Book, 1) == Book(id=1, name="My Book")
+
+
+def test_lazy_model_configured_on_use(engine: Engine, session: Session) -> None:
+    class Author(DBModel, lazy=True):
+        id: PrimaryKey[int]
+        name: str
+
+    class Book(DBModel, lazy=True):
+        id: PrimaryKey[int]
+        name: str
+
+    class Edition(DBModel, lazy=True):
+        id: PrimaryKey[int]
+        number: int = 1
+
+    statement = select(Author)
+    assert not hasattr(Book, "__table__")
+    assert session.query(Book).statement is not None
+
+    assert not hasattr(Edition, "__table__")
+    by_number = select(col(Edition.id)).where(Edition.number == 2)
+    assert isinstance(Edition.__table__, Table)
+    assert "edition.number = :number_1" in str(by_number)
+    assert Edition(id=1).number == 1
+
+    metadata.create_all(engine)
+    assert session.scalars(statement).all() == []
+
+
+def test_lazy_model_entry_points(engine: Engine, session: Session) -> None:
+    class Author(DBModel, lazy=True):
+        id: PrimaryKey[int]
+        name: str
+
+    class Publisher(DBModel, lazy=True):
+        id: PrimaryKey[int]
+
+    class Book(DBModel):
+        id: PrimaryKey[int]
+        publisher_id: int = mapped_column(foreign_key="publisher.id")
+        editor_id: int = mapped_column(foreign_key="editor.id")
+
+    class Editor(DBModel, lazy=True):
+        id: PrimaryKey[int]
+
+    assert isinstance(Publisher.__table__, Table)
+    assert isinstance(Editor.__table__, Table)
+    assert not hasattr(Author, "__table__")
+
+    session.execute(text("CREATE TABLE author (id INTEGER PRIMARY KEY, name TEXT)"))
+    session.bulk_insert(Author, [{"id": 1, "name": "John"}])
+    assert isinstance(Author.__table__, Table)
+
+    class Reader(DBModel, lazy=True):
+        id: PrimaryKey[int]
+        name: str
+
+    session.execute(text("CREATE TABLE reader (id INTEGER PRIMARY KEY, name TEXT)"))
+    session.upsert(Reader, [{"id": 1, "name": "Paul"}])
+    assert session.get(Reader, 1) == Reader(id=1, name="Paul")
+
+    metadata.create_all(engine)
+    assert set(metadata.tables) == {"author", "book", "editor", "publisher", "reader"}
+    assert session.fetch_detached(select(Author)) == [Author(id=1, name="John")]
+
+
+def test_lazy_model_between_threads() -> None:
+    class Author(DBModel, lazy=True):
+        id: PrimaryKey[int]
+        name: str
+
+    barrier = Barrier(8)
+
+    def compare(_: int) -> str:
+        barrier.wait()
+        return str(Author.name == "John")
+
+    with ThreadPoolExecutor(8) as executor:
+        assert set(executor.map(compare, range(8))) == {"author.name = :name_1"}
@@ -0,0 +1,51 @@
+from pathlib import Path
+
+import pytest
+
+from db_model import DBModel, PrimaryKey, get_registration_stats
+from db_model.profile_import import main
+from db_model.sql import select
+
+
+def test_get_registration_stats() -> None:
+    class Eager(DBModel):
+        id: PrimaryKey[int]
+
+    class Lazy(DBModel, lazy=True):
+        id: PrimaryKey[int]
+
+    stats = {stat.model: stat for stat in get_registration_stats()}
+    assert stats[Eager].transform > 0
+    assert stats[Eager].map > 0
+    assert stats[Eager].total == pytest.approx(
+        stats[Eager].transform
+        + stats[Eager].resolve
+        + stats[Eager].columns
+        + stats[Eager].map
+    )
+    assert stats[Lazy].map == 0
+
+    select(Lazy)
+    assert stats[Lazy].map > 0
+
+
+def test_profile_import(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    (tmp_path / "profiled_models.py").write_text(
+        "from sqlalchemy import MetaData\n"
+        "from db_model import DBModel, PrimaryKey\n"
+        "\n"
+        "class ProfiledModel(DBModel, metadata=MetaData()):\n"
+        "    id: PrimaryKey[int]\n"
+        "    name: str\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    main(["profiled_models", "--limit", "5"])
+
+    output = capsys.readouterr().out
+    assert "profiled_models.ProfiledModel" in output
+    assert "1 models registered" in output
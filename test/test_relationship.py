@@ -2,14 +2,16 @@ from dataclasses import field
 from typing import Any, ClassVar, List, Optional
 from uuid import UUID, uuid4
 
+import pytest
 from sqlalchemy.engine import Engine
 from sqlalchemy.orm import relationship as sa_relationship
 
 from db_model import DBModel, PrimaryKey
 from db_model.core import _metadata as metadata
 from db_model.field import mapped_column
-from db_model.orm import Session
+from db_model.orm import NPlusOneDetector, NPlusOneError, Session
 from db_model.relationship import relationship
+from db_model.sql import select
 
 
 def test_relationship_via_properties(session: Session, engine: Engine) -> None:
@@ -67,3 +69,65 @@ def test_relationship(session: Session, engine: Engine) -> None:
     session.commit()
     session.refresh(author)
     assert author.books == [book]
+
+
+def test_lazy_relationship(session: Session, engine: Engine) -> None:
+    class Author(DBModel, lazy=True):
+        id: PrimaryKey[int]
+        name: str
+
+        books: list["Book"] = relationship(
+            "Book", back_populates="author", uselist=True
+        )
+
+    class Book(DBModel, lazy=True):
+        id: PrimaryKey[int]
+        name: str
+        author_id: Optional[int] = mapped_column(default=None, foreign_key="author.id")
+        author: Optional[Author] = relationship(Author, back_populates="books")
+
+    author = Author(id=1, name="My Author")
+    assert hasattr(Book, "__table__")
+
+    metadata.create_all(engine)
+    book = Book(id=1, name="My Book", author=author)
+    session.add_all((author, book))
+    session.commit()
+    session.refresh(author)
+    assert author.books == [book]
+
+
+def test_relationship_loading(session: Session, engine: Engine) -> None:
+    class Author(DBModel):
+        id: PrimaryKey[int]
+
+        books: list["Book"] = relationship("Book", uselist=True)
+        reviews: list["Review"] = relationship("Review", uselist=True, lazy="select")
+
+        __relationship_lazy__: ClassVar[str] = "selectin"
+
+    class Book(DBModel):
+        id: PrimaryKey[int]
+        author_id: int = mapped_column(foreign_key=Author.id)
+
+    class Review(DBModel):
+        id: PrimaryKey[int]
+        author_id: int = mapped_column(foreign_key=Author.id)
+
+    metadata.create_all(engine)
+    session.bulk_insert(Author, [{"id": i} for i in range(3)])
+    session.bulk_insert(Book, [{"id": i, "author_id": i % 3} for i in range(6)])
+    session.bulk_insert(Review, [{"id": i, "author_id": i % 3} for i in range(6)])
+
+    with session.detect_n_plus_one(NPlusOneDetector(action="raise")) as detector:
+        authors = session.scalars(select(Author)).all()
+        assert [len(author.books) for author in authors] == [2, 2, 2]
+        assert not detector.reports
+
+        with pytest.raises(NPlusOneError, match="Author.reviews lazily loaded 2 times"):
+            for author in authors:
+                author.reviews
+
+    (report,) = detector.reports
+    assert report.relationship == "Author.reviews"
+    assert report.call_site.startswith(__file__)
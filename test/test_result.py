@@ -0,0 +1,177 @@
+import csv
+import io
+import json
+from datetime import date, datetime
+from typing import Optional
+from uuid import UUID, uuid4
+
+import numpy
+from sqlalchemy.engine import Engine
+
+from db_model import DBModel, PrimaryKey, col, get_metadata, mapped_column
+from db_model.engine import Result, ScalarResult
+from db_model.engine.columnar import to_arrays
+from db_model.orm import Session
+from db_model.sql import select
+
+metadata = get_metadata()
+
+
+def test_typed_results(engine: Engine, session: Session) -> None:
+    class Model(DBModel):
+        id: PrimaryKey[int]
+        name: str
+
+    metadata.create_all(engine)
+    session.add(Model(id=1, name="John"))
+
+    result = session.execute(select(Model))
+    assert isinstance(result, Result)
+    assert isinstance(result.scalars(), ScalarResult)
+    assert isinstance(session.scalars(select(Model)), ScalarResult)
+
+
+def test_to_columns(engine: Engine, session: Session) -> None:
+    class Model(DBModel):
+        id: PrimaryKey[int]
+        name: str
+
+    metadata.create_all(engine)
+    session.add_all([Model(id=1, name="John"), Model(id=2, name="Paul")])
+
+    assert session.execute(
+        select(col(Model.id), col(Model.name)).order_by(Model.id)
+    ).to_columns(batch_size=1) == {"id": [1, 2], "name": ["John", "Paul"]}
+
+
+def test_to_numpy(engine: Engine, session: Session) -> None:
+    class Model(DBModel):
+        id: PrimaryKey[UUID]
+        name: str
+        age: Optional[int]
+        birthday: date
+        created_at: Optional[datetime]
+
+    metadata.create_all(engine)
+    models = [
+        Model(
+            id=uuid4(),
+            name=f"Name {i}",
+            age=i,
+            birthday=date(2000, 1, i + 1),
+            created_at=datetime(2020, 1, 1, i) if i else None,
+        )
+        for i in range(5)
+    ]
+    session.add_all(models)
+    session.flush()
+
+    columns = session.execute(
+        select(
+            col(Model.id),
+            col(Model.birthday),
+            col(Model.created_at),
+        ).order_by(Model.age)
+    ).to_numpy(batch_size=2)
+
+    assert columns["id"].dtype == numpy.dtype("V16")
+    assert [UUID(bytes=value.tobytes()) for value in columns["id"]] == [
+        model.id for model in models
+    ]
+    assert columns["birthday"].dtype == numpy.dtype("datetime64[D]")
+    assert columns["birthday"][4] == numpy.datetime64("2000-01-05")
+    assert numpy.isnat(columns["created_at"][0])
+    assert columns["created_at"][1] == numpy.datetime64("2020-01-01T01:00:00")
+
+    ages = session.scalars(select(col(Model.age)).order_by(Model.age)).to_numpy()
+    assert ages.dtype == numpy.int64
+    assert ages.tolist() == [0, 1, 2, 3, 4]
+
+    session.add(
+        Model(id=uuid4(), name="None", age=None, birthday=date.today(), created_at=None)
+    )
+    ages = session.scalars(select(col(Model.age)).order_by(Model.name)).to_numpy(
+        batch_size=2
+    )
+    assert ages.dtype == object
+    assert ages.tolist() == [0, 1, 2, 3, 4, None]
+
+
+def test_to_arrays_null_in_first_batch() -> None:
+    ids = [uuid4(), None]
+    numbers, uuids = to_arrays([[[1, None, 3], ids + [uuid4()]]], 2)
+    assert numbers.dtype == object
+    assert numbers.tolist() == [1, None, 3]
+    assert uuids.dtype == object
+    assert uuids.tolist()[:2] == ids
+
+
+def test_write_jsonl_and_csv(engine: Engine, session: Session) -> None:
+    class Model(DBModel):
+        id: PrimaryKey[UUID]
+        name: str
+        born: Optional[date]
+
+    metadata.create_all(engine)
+    ids = [UUID(int=i) for i in range(3)]
+    session.bulk_insert(
+        Model,
+        [
+            {"id": ids[0], "name": "John", "born": date(1940, 10, 9)},
+            {"id": ids[1], "name": 'Paul "Macca"', "born": None},
+            {"id": ids[2], "name": "George", "born": date(1943, 2, 25)},
+        ],
+    )
+    statement = select(Model).order_by(Model.name)
+
+    output = io.StringIO()
+    assert session.scalars(statement).write_jsonl(output, batch_size=2) == 3
+    lines = [json.loads(line) for line in output.getvalue().splitlines()]
+    assert lines[0] == {"id": str(ids[2]), "name": "George", "born": "1943-02-25"}
+    assert lines[2]["born"] is None
+
+    output = io.StringIO()
+    session.execute(
+        select(col(Model.name), col(Model.id)).order_by(Model.name)
+    ).write_jsonl(output)
+    assert json.loads(output.getvalue().splitlines()[1]) == {
+        "name": "John",
+        "id": str(ids[0]),
+    }
+
+    output = io.StringIO()
+    assert session.scalars(statement).write_csv(output, batch_size=1) == 3
+    assert list(csv.reader(io.StringIO(output.getvalue()))) == [
+        ["id", "name", "born"],
+        [str(ids[2]), "George", "1943-02-25"],
+        [str(ids[0]), "John", "1940-10-09"],
+        [str(ids[1]), 'Paul "Macca"', ""],
+    ]
+
+    output = io.StringIO()
+    session.execute(select(Model, col(Model.name)).where(Model.id == ids[0])).write_csv(
+        output
+    )
+    assert output.getvalue().splitlines() == [
+        "Model.id,Model.name,Model.born,name",
+        f"{ids[0]},John,1940-10-09,John",
+    ]
+
+    class Book(DBModel):
+        id: PrimaryKey[int]
+        model_id: UUID = mapped_column(foreign_key=Model.id)
+
+    metadata.create_all(engine)
+    session.bulk_insert(Book, [{"id": 1, "model_id": ids[0]}])
+    output = io.StringIO()
+    session.execute(
+        select(Book, Model, col(Model.name))
+        .outerjoin_from(Model, Book)
+        .order_by(Model.name)
+    ).write_csv(output)
+    assert list(csv.reader(io.StringIO(output.getvalue()))) == [
+        ["Book.id", "Book.model_id", "Model.id", "Model.name", "Model.born", "name"],
+        ["", "", str(ids[2]), "George", "1943-02-25", "George"],
+        ["1", str(ids[0]), str(ids[0]), "John", "1940-10-09", "John"],
+        ["", "", str(ids[1]), 'Paul "Macca"', "", 'Paul "Macca"'],
+    ]
@@ -0,0 +1,76 @@
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import (
+    Column,
+    Integer,
+    MetaData,
+    Table,
+    create_mock_engine,
+    insert,
+    select,
+)
+from sqlalchemy.engine import Engine
+
+from db_model.sa_types import GUID, BinaryGUID, migrate_guid_to_binary
+
+
+def _guid_table(metadata: MetaData, guid: GUID) -> Table:
+    return Table(
+        "guid",
+        metadata,
+        Column("id", Integer, primary_key=True),
+        Column("value", guid, nullable=True),
+    )
+
+
+def test_guid(engine: Engine) -> None:
+    values = [uuid4(), None, uuid4()]
+    for guid in (GUID(), BinaryGUID()):
+        metadata = MetaData()
+        table = _guid_table(metadata, guid)
+        with engine.begin() as connection:
+            metadata.create_all(connection)
+            connection.execute(
+                insert(table),
+                [{"id": i, "value": value} for i, value in enumerate(values)],
+            )
+            connection.execute(insert(table), {"id": 3, "value": str(values[0])})
+
+            assert connection.execute(
+                select(table.c.value).order_by(table.c.id)
+            ).scalars().all() == [*values, values[0]]
+            assert (
+                connection.execute(
+                    select(table.c.id).where(table.c.value == values[2])
+                ).scalar_one()
+                == 2
+            )
+            metadata.drop_all(connection)
+
+
+def test_migrate_guid_to_binary(engine: Engine) -> None:
+    values = [uuid4() for _ in range(5)]
+    char_table = _guid_table(MetaData(), GUID())
+    binary_table = _guid_table(MetaData(), GUID(binary=True))
+
+    with engine.begin() as connection:
+        char_table.create(connection)
+        connection.execute(
+            insert(char_table),
+            [{"id": i, "value": value} for i, value in enumerate(values)],
+        )
+
+        assert migrate_guid_to_binary(connection, char_table.c.value, batch_size=2) == 5
+        assert migrate_guid_to_binary(connection, char_table.c.value) == 0
+
+        assert (
+            connection.execute(select(binary_table.c.value).order_by(binary_table.c.id))
+            .scalars()
+            .all()
+            == values
+        )
+
+    postgresql = create_mock_engine("postgresql://", lambda *args, **kw: None)
+    with pytest.raises(NotImplementedError):
+        migrate_guid_to_binary(postgresql, char_table.c.value)  # type: ignore[arg-type]
@@ -0,0 +1,77 @@
+from typing import Optional
+from uuid import UUID, uuid4
+
+import pytest
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import ArgumentError
+
+from db_model import DBModel, PrimaryKey, col, get_metadata
+from db_model.orm import Session
+from db_model.sql import select
+
+metadata = get_metadata()
+
+
+def test_paginate(engine: Engine, session: Session) -> None:
+    class Author(DBModel):
+        id: PrimaryKey[int]
+        name: str
+
+    metadata.create_all(engine)
+    session.bulk_insert(Author, ({"id": i, "name": f"Name {i}"} for i in range(10)))
+
+    statement = select(Author).where(col(Author.id) % 2 == 0)
+    first = session.scalars(statement.paginate(page_size=3)).all()
+    second = session.scalars(statement.paginate(page_size=3, after=first[-1].id)).all()
+    assert [author.id for author in first + second] == [0, 2, 4, 6, 8]
+
+    pages = select(col(Author.name), col(Author.id)).iter_pages(
+        session, key=Author.id, page_size=4
+    )
+    assert [len(page) for page in pages] == [4, 4, 2]
+
+    with pytest.raises(ArgumentError):
+        list(select(col(Author.name)).iter_pages(session, key=Author.id))
+
+
+def test_paginate_composite_key(engine: Engine, session: Session) -> None:
+    class Author(DBModel):
+        first_name: PrimaryKey[str]
+        last_name: PrimaryKey[str]
+        age: Optional[int]
+
+    metadata.create_all(engine)
+    names = [(first, last) for first in "ABC" for last in "xyz"]
+    session.bulk_insert(
+        Author,
+        (
+            {"first_name": first, "last_name": last, "age": None}
+            for first, last in names
+        ),
+    )
+
+    page = session.scalars(select(Author).paginate(page_size=2, after=("B", "y"))).all()
+    assert [(a.first_name, a.last_name) for a in page] == [("B", "z"), ("C", "x")]
+
+    pages = list(select(Author).iter_pages(session, page_size=4))
+    assert [(a.first_name, a.last_name) for page in pages for (a,) in page] == names
+    assert [len(page) for page in pages] == [4, 4, 1]
+
+    class Membership(DBModel):
+        group_id: PrimaryKey[UUID]
+        user_id: PrimaryKey[UUID]
+
+    metadata.create_all(engine)
+    keys = sorted((uuid4(), uuid4()) for _ in range(5))
+    session.bulk_insert(
+        Membership, ({"group_id": group, "user_id": user} for group, user in keys)
+    )
+
+    memberships = session.scalars(
+        select(Membership).paginate(page_size=2, after=keys[1])
+    ).all()
+    assert [(m.group_id, m.user_id) for m in memberships] == keys[2:4]
+    membership_pages = list(select(Membership).iter_pages(session, page_size=2))
+    assert [
+        (m.group_id, m.user_id) for batch in membership_pages for (m,) in batch
+    ] == keys
@@ -0,0 +1,330 @@
+import shutil
+from pathlib import Path
+from typing import List, Optional
+from uuid import UUID, uuid4
+
+import pytest
+from sqlalchemy import UniqueConstraint, bindparam, create_engine, event, text, update
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import ArgumentError, InvalidRequestError
+from sqlalchemy.pool import QueuePool
+
+from db_model import DBModel, PrimaryKey, col, get_metadata
+from db_model.orm import Session
+from db_model.sql import select
+
+metadata = get_metadata()
+
+
+def test_bulk_insert(engine: Engine, session: Session) -> None:
+    class Model(DBModel):
+        id: PrimaryKey[UUID]
+        name: str
+        age: Optional[int]
+
+    metadata.create_all(engine)
+
+    models = [Model(id=uuid4(), name=f"Name {i}", age=i) for i in range(500)]
+    session.bulk_insert(Model, models, batch_size=100)
+    session.bulk_insert(
+        Model,
+        ({"id": uuid4(), "name": "Dict", "age": None} for _ in range(10)),
+    )
+
+    assert not session.new
+    assert session.query(Model).count() == 510
+    assert session.scalars(select(Model).where(Model.age == 42)).one() == models[42]
+
+
+def test_bulk_insert_return_primary_keys(engine: Engine, session: Session) -> None:
+    class Model(DBModel):
+        id: PrimaryKey[int]
+        name: str
+
+    metadata.create_all(engine)
+
+    primary_keys = session.bulk_insert(
+        Model,
+        [{"name": "John"}, {"name": "Paul"}],
+        return_primary_keys=True,
+    )
+
+    assert primary_keys == [(1,), (2,)]
+    assert session.get(Model, 2) == Model(id=2, name="Paul")
+
+
+def test_fetch_detached(engine: Engine, session: Session) -> None:
+    class Author(DBModel):
+        id: PrimaryKey[int]
+        name: str
+        age: Optional[int]
+
+    metadata.create_all(engine)
+
+    authors = [Author(id=i, name=f"Name {i}", age=i or None) for i in range(3)]
+    session.add_all(authors)
+    session.flush()
+    session.expunge_all()
+
+    detached = session.fetch_detached(
+        select(Author).where(col(Author.age) != None).order_by(Author.id)  # noqa: E711
+    )
+
+    assert detached == authors[1:]
+    assert detached[0].name == "Name 1"
+    assert len(session.identity_map) == 0
+
+    with pytest.raises(ArgumentError):
+        session.fetch_detached(select(col(Author.id)))
+
+
+def test_fetch_slotted(engine: Engine, session: Session) -> None:
+    class Base(DBModel, slots=True, abstract=True):
+        id: PrimaryKey[int]
+
+    class Author(Base):
+        name: str
+
+    metadata.create_all(engine)
+
+    session.bulk_insert(Author, [{"id": i, "name": f"Name {i}"} for i in range(2)])
+
+    detached = session.fetch_slotted(select(Author).order_by(Author.id))
+
+    assert Author.__slotted__ is not Base.__slotted__
+    assert detached == [
+        Author.__slotted__(id=0, name="Name 0"),
+        Author.__slotted__(id=1, name="Name 1"),
+    ]
+    assert not hasattr(detached[0], "__dict__")
+    assert isinstance(session.fetch_detached(select(Author))[0], Author)
+
+
+def test_prepare(engine: Engine, session: Session) -> None:
+    class Author(DBModel):
+        id: PrimaryKey[int]
+        name: str
+
+    metadata.create_all(engine)
+
+    session.add_all([Author(id=i, name=f"Name {i}") for i in range(3)])
+    session.flush()
+
+    by_id = select(Author).where(col(Author.id) == bindparam("id")).prepare()
+    names = select(col(Author.name)).where(col(Author.id) >= bindparam("id")).prepare()
+
+    assert by_id.scalars(session, id=1).one().name == "Name 1"
+    assert by_id(session, id=2).one()[0].name == "Name 2"
+    assert by_id.scalars(session, id=5).first() is None
+    assert names.scalars(session, id=1).all() == ["Name 1", "Name 2"]
+
+
+def test_stream(engine: Engine, session: Session) -> None:
+    class Author(DBModel):
+        id: PrimaryKey[int]
+        name: str
+
+    metadata.create_all(engine)
+
+    session.bulk_insert(Author, ({"id": i, "name": f"Name {i}"} for i in range(25)))
+
+    streamed = session.stream_scalars(select(Author).order_by(Author.id), batch_size=10)
+    ids = []
+    for author in streamed:
+        ids.append(author.id)
+        assert len(session.identity_map) <= 10
+    assert ids == list(range(25))
+    assert len(session.identity_map) == 0
+
+    rows = session.stream(
+        select(col(Author.id), col(Author.name)).where(col(Author.id) < 3),
+        batch_size=2,
+    )
+    assert rows.all() == [(0, "Name 0"), (1, "Name 1"), (2, "Name 2")]
+
+
+def test_upsert(engine: Engine, session: Session) -> None:
+    class Author(DBModel):
+        id: PrimaryKey[int]
+        email: str
+        name: str
+
+        __table_args__ = (UniqueConstraint("email", name="uq_author_email"),)
+
+    metadata.create_all(engine)
+    session.bulk_insert(
+        Author,
+        [{"id": i, "email": f"{i}@example.com", "name": "Old"} for i in range(3)],
+    )
+
+    session.upsert(
+        Author,
+        [Author(id=i, email=f"{i}@example.com", name="New") for i in range(1, 5)],
+        batch_size=2,
+    )
+    session.upsert(
+        Author,
+        [{"id": 9, "email": "4@example.com", "name": "Email"}],
+        conflict_on="uq_author_email",
+        update=["name"],
+    )
+    session.upsert(
+        Author, [{"id": 0, "email": "0@example.com", "name": "Ignored"}], update=()
+    )
+    statements: List[str] = []
+    event.listen(
+        engine,
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement),
+    )
+    session.upsert(
+        Author,
+        [
+            {"id": 5, "email": "5@example.com", "name": "First"},
+            {"id": 5, "email": "5@example.com", "name": "Last"},
+            {"id": 6, "email": "6@example.com", "name": "Other"},
+        ],
+    )
+    assert len(statements) == 1 and statements[0].count("?, ?, ?") == 2
+
+    names = session.execute(
+        select(col(Author.id), col(Author.name)).order_by(Author.id)
+    ).all()
+    assert names == [
+        (0, "Old"),
+        (1, "New"),
+        (2, "New"),
+        (3, "New"),
+        (4, "Email"),
+        (5, "Last"),
+        (6, "Other"),
+    ]
+
+    with pytest.raises(ArgumentError):
+        session.upsert(Author, [], conflict_on="missing")
+    with pytest.raises(NotImplementedError):
+        session.upsert(Author, [], returning=[Author.id])
+
+
+def test_read_only(engine: Engine, session: Session) -> None:
+    class Author(DBModel):
+        id: PrimaryKey[int]
+        name: str
+
+    metadata.create_all(engine)
+    session.bulk_insert(Author, [{"id": 1, "name": "Name"}])
+    session.commit()
+
+    with Session(bind=engine, read_only=True) as read_only:
+        author = read_only.scalars(select(Author)).one()
+        read_only.commit()
+        assert "name" in author.__dict__
+
+        with pytest.raises(InvalidRequestError):
+            read_only.add(Author(id=2, name="New"))
+        with pytest.raises(InvalidRequestError):
+            read_only.delete(author)
+        with pytest.raises(InvalidRequestError):
+            read_only.execute(update(Author).values(name="Updated"))
+        with pytest.raises(InvalidRequestError):
+            read_only.bulk_insert(Author, [{"id": 3, "name": "New"}])
+        with pytest.raises(InvalidRequestError):
+            read_only.bulk_save_objects([Author(id=3, name="New")])
+        with pytest.raises(InvalidRequestError):
+            read_only.bulk_insert_mappings(Author, [{"id": 3, "name": "New"}])
+        with pytest.raises(InvalidRequestError):
+            read_only.bulk_update_mappings(Author, [{"id": 1, "name": "New"}])
+
+        author.name = "Changed"
+        with pytest.raises(InvalidRequestError):
+            read_only.flush()
+
+
+def test_get_many(engine: Engine, session: Session) -> None:
+    class Author(DBModel):
+        id: PrimaryKey[UUID]
+        name: str
+
+    class Edition(DBModel):
+        book_id: PrimaryKey[int]
+        number: PrimaryKey[int]
+        name: str
+
+    metadata.create_all(engine)
+    ids = [uuid4() for _ in range(5)]
+    session.bulk_insert(
+        Author, [{"id": id_, "name": str(i)} for i, id_ in enumerate(ids)]
+    )
+    session.bulk_insert(
+        Edition,
+        [
+            {"book_id": i, "number": n, "name": f"{i}.{n}"}
+            for i in range(3)
+            for n in range(2)
+        ],
+    )
+
+    cached = session.get(Author, ids[3])
+    with session.track_queries() as queries:
+        authors = session.get_many(Author, [ids[4], uuid4(), ids[3], ids[0], ids[4]])
+    assert queries.count == 1
+    assert authors[2] is cached
+    assert [author and author.name for author in authors] == ["4", None, "3", "0", "4"]
+
+    editions = session.get_many(Edition, [(2, 1), (0, 0), (5, 0)])
+    assert [edition and edition.name for edition in editions] == ["2.1", "0.0", None]
+
+    with session.track_queries() as queries:
+        assert session.get_many(Edition, [(0, 0)]) == [editions[1]]
+        assert session.get_many(Edition, []) == []
+    assert queries.count == 0
+
+
+@pytest.mark.usefixtures("session")
+def test_read_replicas(tmp_path: Path) -> None:
+    class Author(DBModel):
+        id: PrimaryKey[int]
+        name: str
+
+    primary = create_engine(f"sqlite:///{tmp_path / 'primary.db'}", future=True)
+    metadata.create_all(primary)
+    with Session(bind=primary) as session:
+        session.bulk_insert(Author, [{"id": 1, "name": "primary"}])
+        session.commit()
+    readers = []
+    for reader_name in ("reader_0", "reader_1"):
+        path = tmp_path / f"{reader_name}.db"
+        shutil.copy(tmp_path / "primary.db", path)
+        reader = create_engine(f"sqlite:///{path}", future=True, poolclass=QueuePool)
+        with reader.begin() as connection:
+            connection.execute(update(Author.__table__).values(name=reader_name))
+        readers.append(reader)
+
+    def name(session: Session) -> str:
+        return session.scalars(select(col(Author.name)).where(Author.id == 1)).one()
+
+    with Session(bind=primary, readers=readers) as session:
+        first = name(session)
+        assert first.startswith("reader_")
+        assert session.get(Author, 1).name == first  # type: ignore[union-attr]
+        with session.on_primary():
+            assert name(session) == "primary"
+        locking = select(Author).with_for_update()
+        assert session.get_bind(clause=locking) is primary
+        statement = text("SELECT name FROM author WHERE id = 1")
+        assert session.execute(statement).scalar() == "primary"
+        assert name(session) == first
+
+        session.add(Author(id=2, name="New"))
+        session.flush()
+        assert session.scalars(select(Author).where(Author.id == 2)).one().name == "New"
+        assert name(session) == "primary"
+        session.rollback()
+
+    with Session(bind=primary, readers=readers) as session:
+        assert name(session) != first
+    for busy, expected in ((0, "reader_1"), (1, "reader_0")):
+        with readers[busy].connect(), Session(
+            bind=primary, readers=readers, reader_strategy="least_loaded"
+        ) as session:
+            assert name(session) == expected
@@ -0,0 +1,140 @@
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+import pytest
+from sqlalchemy import MetaData, create_engine, func, text, update
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import InvalidRequestError
+
+from db_model import DBModel, PrimaryKey, col, get_metadata
+from db_model.orm import Session, ShardedSession, hash_shard
+from db_model.sql import select
+
+metadata = get_metadata()
+
+
+@pytest.mark.usefixtures("session")
+def test_sharded_session(tmp_path: Path) -> None:
+    class Author(DBModel):
+        id: PrimaryKey[int]
+        name: str
+
+    class Edition(DBModel):
+        book_id: PrimaryKey[int]
+        number: PrimaryKey[int]
+
+    shards: Dict[str, Engine] = {
+        name: create_engine(
+            f"sqlite:///{tmp_path / name}.db",
+            future=True,
+            connect_args={"check_same_thread": False},
+        )
+        for name in ("a", "b", "c")
+    }
+    for engine in shards.values():
+        metadata.create_all(engine)
+
+    def by_book(identity: Tuple[int, ...], shard_ids: object) -> str:
+        return "c"
+
+    with ShardedSession(shards, shard_functions={Edition: by_book}) as session:
+        session.add_all([Author(id=i, name=f"Name {i}") for i in range(10)])
+        session.bulk_insert(
+            Author, [{"id": i, "name": f"Name {i}"} for i in range(10, 20)]
+        )
+        session.bulk_insert(Edition, [{"book_id": 1, "number": n} for n in range(3)])
+        session.commit()
+
+        with session.track_queries() as queries:
+            authors = session.scalars(select(Author)).all()
+        assert (queries.count, queries.rows) == (1, 20)
+        assert sorted(author.id for author in authors) == list(range(20))
+        assert {session.shard_for(Author, (author.id,)) for author in authors} == {
+            "a",
+            "b",
+            "c",
+        }
+
+        session.execute(update(Author).where(Author.id < 5).values(name="Updated"))
+        session.expunge_all()
+        with session.track_queries() as queries:
+            assert session.get(Author, 3).name == "Updated"  # type: ignore[union-attr]
+            found = session.get_many(Author, [12, 4, 99])
+            assert [author and author.id for author in found] == [12, 4, None]
+        assert queries.count == 1 + len({hash_shard((i,), "abc") for i in (12, 4, 99)})
+
+        with pytest.raises(InvalidRequestError):
+            session.add(Author(id=None, name="No key"))  # type: ignore[arg-type]
+            session.flush()
+        session.rollback()
+
+    class Review(DBModel, lazy=True, metadata=MetaData()):
+        id: PrimaryKey[int]
+
+    for engine in shards.values():
+        with engine.begin() as connection:
+            connection.execute(text("CREATE TABLE review (id INTEGER PRIMARY KEY)"))
+    with ShardedSession(shards) as session:
+        session.bulk_insert(Review, [{"id": i} for i in range(6)])
+        session.commit()
+        assert session.scalar(select(func.count()).select_from(Review)) == 6
+
+    for name, engine in shards.items():
+        with Session(bind=engine) as shard_session:
+            ids = shard_session.scalars(select(col(Author.id))).all()
+            assert all(hash_shard((id_,), "abc") == name for id_ in ids)
+            editions = shard_session.scalar(select(func.count()).select_from(Edition))
+            assert editions == (3 if name == "c" else 0)
+
+
+@pytest.mark.usefixtures("session")
+def test_sharded_session_merges_results(tmp_path: Path) -> None:
+    class Author(DBModel):
+        id: PrimaryKey[int]
+        name: str
+        age: Optional[int]
+
+    shards: Dict[str, Engine] = {
+        name: create_engine(
+            f"sqlite:///{tmp_path / name}.db",
+            future=True,
+            connect_args={"check_same_thread": False},
+        )
+        for name in ("a", "b", "c")
+    }
+    for engine in shards.values():
+        metadata.create_all(engine)
+
+    with ShardedSession(shards) as session:
+        session.add_all(
+            [
+                Author(id=i, name=f"Name {i:02}", age=None if i % 3 else i % 4)
+                for i in range(30)
+            ]
+        )
+        session.commit()
+
+        assert session.scalar(select(func.count()).select_from(Author)) == 30
+        assert session.execute(
+            select(func.sum(col(Author.id)), func.max(col(Author.name)))
+        ).one() == (435, "Name 29")
+
+        ordered = session.scalars(select(Author).order_by(Author.id).limit(3)).all()
+        assert [author.id for author in ordered] == [0, 1, 2]
+        ordered = session.scalars(
+            select(Author).order_by(col(Author.name).desc()).limit(3).offset(2)
+        ).all()
+        assert [author.id for author in ordered] == [27, 26, 25]
+        # SQLite sorts NULL first.
+        assert session.execute(
+            select(col(Author.age), col(Author.id))
+            .order_by(Author.age, col(Author.id).desc())
+            .limit(22)
+        ).all()[-3:] == [(None, 1), (0, 24), (0, 12)]
+
+        with pytest.raises(InvalidRequestError, match="GROUP BY"):
+            session.execute(select(col(Author.age), func.count()).group_by(Author.age))
+        with pytest.raises(InvalidRequestError, match="not selected"):
+            session.execute(select(col(Author.name)).order_by(Author.id))
+        with session.shard("a"):
+            session.execute(select(col(Author.name)).order_by(Author.id).limit(1))
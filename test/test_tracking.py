@@ -0,0 +1,62 @@
+import logging
+
+import pytest
+from sqlalchemy import update
+from sqlalchemy.engine import Engine
+
+from db_model import DBModel, PrimaryKey, col, get_metadata
+from db_model.orm import LoggingCollector, PrometheusCollector, Session
+from db_model.sql import select
+
+metadata = get_metadata()
+
+
+def test_track_queries(engine: Engine, session: Session) -> None:
+    class Author(DBModel):
+        id: PrimaryKey[int]
+        name: str
+
+    metadata.create_all(engine)
+    session.bulk_insert(Author, ({"id": i, "name": f"Name {i}"} for i in range(5)))
+
+    with session.track_queries() as queries:
+        authors = session.scalars(select(Author)).all()
+        assert session.scalars(select(Author).where(col(Author.id) == 1)).one()
+        assert [name for name in session.scalars(select(col(Author.name)))]
+        session.execute(update(Author).values(name="Updated"))
+
+    assert len(authors) == 5
+    assert queries.count == 4
+    assert [stats.rows for stats in queries.queries] == [5, 1, 5, 0]
+    assert queries.queries[0].models == ("Author",)
+    assert queries.queries[0].fingerprint.startswith("SELECT author.id, author.name")
+    assert all(stats.execute_time > 0 for stats in queries.queries)
+    assert queries.histogram.count == 4
+
+    session.scalars(select(Author)).all()
+    assert queries.count == 4
+    assert not session.query_collectors
+
+
+def test_collectors(
+    engine: Engine, session: Session, caplog: pytest.LogCaptureFixture
+) -> None:
+    class Author(DBModel):
+        id: PrimaryKey[int]
+        name: str
+
+    metadata.create_all(engine)
+    session.bulk_insert(Author, ({"id": i, "name": f"Name {i}"} for i in range(3)))
+
+    prometheus = PrometheusCollector()
+    session.query_collectors.append(prometheus)
+    with caplog.at_level(logging.INFO), session.track_queries(LoggingCollector()):
+        session.scalars(select(Author)).all()
+
+    assert "3 rows of Author" in caplog.text
+    text = prometheus.render()
+    assert 'db_model_query_rows_total{models="Author"} 3' in text
+    assert (
+        'db_model_query_duration_seconds_count{models="Author",phase="execute"} 1'
+        in text
+    )
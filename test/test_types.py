@@ -0,0 +1,135 @@
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from enum import Enum, IntEnum, IntFlag
+from typing import Optional
+
+from sqlalchemy import BigInteger, Boolean, DateTime
+from sqlalchemy import Enum as SAEnum
+from sqlalchemy import Integer, LargeBinary, Numeric, String, text
+from sqlalchemy.dialects.postgresql.base import PGDialect
+from sqlalchemy.engine import Engine
+from sqlalchemy.types import TypeDecorator
+
+from db_model import DBModel, PrimaryKey, get_metadata
+from db_model.orm import Session
+from db_model.sa_types import EpochDateTime, IntEnumType
+from db_model.sql import select
+from db_model.types_ import (
+    _COLUMN_TYPE_MAPPING,
+    ColumnSpec,
+    register_type,
+    resolve_type,
+)
+
+metadata = get_metadata()
+
+
+class BigInt(TypeDecorator):
+    impl = BigInteger
+    cache_ok = True
+
+
+def test_resolve_type() -> None:
+    assert resolve_type(Optional[int]) == ColumnSpec(Integer, True, ())
+    assert resolve_type(PrimaryKey[int]) == ColumnSpec(Integer, False, ("PrimaryKey",))
+    assert resolve_type(Optional[int]) is resolve_type(Optional[int])
+
+
+def test_register_type_invalidates_resolved_types() -> None:
+    assert resolve_type(int).db_type is Integer
+    try:
+        register_type(int, BigInt)
+        assert resolve_type(int).db_type is BigInt
+    finally:
+        register_type(int, Integer)  # type: ignore[arg-type]
+    assert resolve_type(int).db_type is _COLUMN_TYPE_MAPPING[int] is Integer
+
+
+class Color(str, Enum):
+    RED = "red"
+    BLUE = "blue"
+
+
+class Size(IntEnum):
+    SMALL = 1
+    LARGE = 2
+
+
+class Name(str):
+    pass
+
+
+def test_resolve_type_by_mro() -> None:
+    assert resolve_type(Name).db_type is String
+    assert resolve_type(bool).db_type is Boolean
+    assert resolve_type(Optional[Decimal]) == ColumnSpec(Numeric, True, ())
+    assert resolve_type(bytes).db_type is LargeBinary
+
+    size = resolve_type(Size).db_type()
+    assert isinstance(size, IntEnumType) and size.enum_class is Size
+    color = resolve_type(Optional[Color]).db_type()
+    assert isinstance(color, SAEnum) and color.python_type is Color
+    assert resolve_type(Size) is resolve_type(Size)
+
+
+def test_int_enum_width() -> None:
+    class Permission(IntFlag):
+        READ = 1
+        ADMIN = 2**15
+
+    class Big(IntEnum):
+        SMALL = 1
+        HUGE = 2**40
+
+    dialect = PGDialect()
+
+    assert IntEnumType(Size).compile(dialect=dialect) == "SMALLINT"
+    assert IntEnumType(Permission).compile(dialect=dialect) == "INTEGER"
+    assert IntEnumType(Big).compile(dialect=dialect) == "BIGINT"
+
+
+def test_enum_and_epoch_columns(engine: Engine, session: Session) -> None:
+    register_type(datetime, EpochDateTime)
+    try:
+
+        class Model(DBModel):
+            id: PrimaryKey[int]
+            color: Color
+            size: Optional[Size]
+            flag: bool
+            created_at: datetime
+
+    finally:
+        register_type(datetime, DateTime)  # type: ignore[arg-type]
+
+    assert isinstance(Model.__table__.c.created_at.type, EpochDateTime)  # type: ignore
+    metadata.create_all(engine)
+    created_at = datetime(2022, 5, 1, 12, 30, 15, 123456)
+    session.add_all(
+        [
+            Model(
+                id=1, color=Color.RED, size=Size.LARGE, flag=True, created_at=created_at
+            ),
+            Model(
+                id=2,
+                color=Color.BLUE,
+                size=None,
+                flag=False,
+                created_at=created_at.replace(tzinfo=timezone(timedelta(hours=2))),
+            ),
+        ]
+    )
+    session.commit()
+    session.expunge_all()
+
+    first, second = session.scalars(select(Model).order_by(Model.id)).all()
+    assert (first.color, first.size, first.flag, first.created_at) == (
+        Color.RED,
+        Size.LARGE,
+        True,
+        created_at,
+    )
+    assert second.created_at == created_at - timedelta(hours=2)
+    assert session.execute(
+        text("SELECT size, created_at FROM model WHERE id = 1")
+    ).one() == (2, 1651408215123456)